@@ -801,6 +801,7 @@ globals_vars = GlobalsDict(
         "tmp_dir_stack": general.tmp_dir_stack,
         "precise_mode_stack": general.precise_mode_stack,
         "nestable_mode_stack": general.nestable_mode_stack,
+        "fused_dispatch_mode_stack": general.fused_dispatch_mode_stack,
         "exception_trace_mode_stack": general.exception_trace_mode_stack,
         "default_dtype_stack": data_type.default_dtype_stack,
         "default_float_dtype_stack": data_type.default_float_dtype_stack,
@@ -1267,6 +1268,7 @@ GLOBAL_PROPS = [
     "nan_policy",
     "array_mode",
     "nestable_mode",
+    "fused_dispatch_mode",
     "exception_trace_mode",
     "show_func_wrapper_trace_mode",
     "min_denominator",
@@ -1,6 +1,6 @@
 # global
 import abc
-from typing import Optional, Tuple, Union, List, Callable, Sequence
+from typing import Optional, Tuple, Union, List, Callable, Sequence, Any
 
 # local
 import ivy
@@ -293,6 +293,10 @@ class _ArrayWithLayers(abc.ABC):
         /,
         *,
         mask: Optional[Union[ivy.Array, ivy.NativeArray]] = None,
+        additive_mask: Optional[Union[ivy.Array, ivy.NativeArray]] = None,
+        is_causal: bool = False,
+        query_block_size: Optional[int] = None,
+        key_block_size: Optional[int] = None,
         out: Optional[ivy.Array] = None,
     ) -> ivy.Array:
         """
@@ -322,6 +326,19 @@ class _ArrayWithLayers(abc.ABC):
             The mask input array. The mask to apply to the query-key values.
             Default is None. The shape of mask input should be in
             *[batch_shape,num_queries,num_keys]*.
+        additive_mask
+            Optional array added to the scaled query-key values before softmax.
+            It should broadcast to *[batch_shape,num_queries,num_keys]*.
+            Default is None.
+        is_causal
+            Whether each query may only attend to the keys at the same or an
+            earlier position. Default is False.
+        query_block_size
+            Number of queries processed per block of the online softmax.
+            Default is None.
+        key_block_size
+            Number of keys processed per block of the online softmax.
+            Default is None.
         out
             optional output array, for writing the result to. It must have a shape
             that the inputs broadcast to.
@@ -361,6 +378,10 @@ class _ArrayWithLayers(abc.ABC):
             v,
             scale,
             mask=mask,
+            additive_mask=additive_mask,
+            is_causal=is_causal,
+            query_block_size=query_block_size,
+            key_block_size=key_block_size,
             out=out,
         )
 
@@ -378,6 +399,7 @@ class _ArrayWithLayers(abc.ABC):
         to_q_v: Optional[Union[ivy.Array, ivy.NativeArray]] = None,
         to_kv_v: Optional[Union[ivy.Array, ivy.NativeArray]] = None,
         to_out_v: Optional[Union[ivy.Array, ivy.NativeArray]] = None,
+        kv_cache: Optional[Any] = None,
         out: Optional[ivy.Array] = None,
     ) -> ivy.Array:
         return ivy.multi_head_attention(
@@ -392,6 +414,7 @@ class _ArrayWithLayers(abc.ABC):
             to_q_v=to_q_v,
             to_kv_v=to_kv_v,
             to_out_v=to_out_v,
+            kv_cache=kv_cache,
             out=out,
         )
 
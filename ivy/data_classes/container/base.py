@@ -4,6 +4,9 @@
 import inspect
 from itertools import chain
 import re
+import hashlib
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 import abc
 import copy
 import termcolor
@@ -1095,7 +1098,12 @@ class ContainerBase(dict, abc.ABC):
 
     @staticmethod
     def cont_from_disk_as_hdf5(
-        h5_obj_or_filepath, slice_obj=slice(None), alphabetical_keys=True, ivyh=None
+        h5_obj_or_filepath,
+        slice_obj=slice(None),
+        alphabetical_keys=True,
+        ivyh=None,
+        key_chains=None,
+        mmap=False,
     ):
         """
         Load container object from disk, as an h5py file, at the specified hdf5
@@ -1113,6 +1121,15 @@ class ContainerBase(dict, abc.ABC):
         ivyh
             Handle to ivy module to use for the calculations. Default is ``None``, which
             results in the global ivy.
+        key_chains
+            Key chains of the datasets or groups to load, all others are skipped.
+            Default is ``None``, which loads everything.
+        mmap
+            Whether to memory map the contiguous, uncompressed datasets rather than
+            reading them, so that their data is only read from disk once accessed.
+            The mapped arrays are read-only, and only the numpy backend uses them
+            without a copy, other backends always read the datasets.
+            Default is ``False``.
 
         Returns
         -------
@@ -1130,22 +1147,74 @@ class ContainerBase(dict, abc.ABC):
             h5_obj = h5py.File(h5_obj_or_filepath, "r")
         else:
             h5_obj = h5_obj_or_filepath
-        items = sorted(h5_obj.items()) if alphabetical_keys else h5_obj.items()
-        for key, value in items:
-            if isinstance(value, h5py.Group):
-                container_dict[key] = ivy.Container.cont_from_disk_as_hdf5(
-                    value, slice_obj, ivyh
-                )
-            elif isinstance(value, h5py.Dataset):
-                container_dict[key] = ivy.default(ivyh, ivy).array(
-                    list(value[slice_obj]), dtype=str(value[slice_obj].dtype)
-                )
-            else:
-                raise ivy.utils.exceptions.IvyException(
-                    "Item found inside h5_obj which was neither a Group nor a Dataset."
-                )
+        try:
+            items = sorted(h5_obj.items()) if alphabetical_keys else h5_obj.items()
+            for key, value in items:
+                if key_chains is None:
+                    sub_key_chains = None
+                elif key in key_chains:
+                    sub_key_chains = None
+                else:
+                    sub_key_chains = [
+                        kc[len(key) + 1 :]
+                        for kc in key_chains
+                        if kc.startswith(key + "/")
+                    ]
+                    if not sub_key_chains:
+                        continue
+                if isinstance(value, h5py.Group):
+                    container_dict[key] = ivy.Container.cont_from_disk_as_hdf5(
+                        value,
+                        slice_obj,
+                        alphabetical_keys,
+                        ivyh,
+                        key_chains=sub_key_chains,
+                        mmap=mmap,
+                    )
+                elif isinstance(value, h5py.Dataset):
+                    if sub_key_chains is not None:
+                        continue
+                    ivy_module = ivy.default(ivyh, ivy)
+                    container_dict[key] = ivy_module.asarray(
+                        ivy.Container._h5_dataset_to_numpy(
+                            value,
+                            slice_obj,
+                            mmap and ivy_module.current_backend_str() == "numpy",
+                        )
+                    )
+                else:
+                    raise ivy.utils.exceptions.IvyException(
+                        "Item found inside h5_obj which was neither a Group nor a "
+                        "Dataset."
+                    )
+        finally:
+            if h5_obj is not h5_obj_or_filepath:
+                h5_obj.close()
         return ivy.Container(container_dict, ivyh=ivyh)
 
+    @staticmethod
+    def _h5_dataset_to_numpy(dataset, slice_obj, mmap):
+        offset = dataset.id.get_offset()
+        if (
+            mmap
+            and offset is not None
+            and dataset.chunks is None
+            and dataset.compression is None
+            and dataset.dtype.kind in "biufc"
+            and dataset.file.driver == "sec2"
+        ):
+            # contiguous datasets are stored as a plain buffer in the file, which
+            # can be mapped without reading it
+            return np.memmap(
+                dataset.file.filename,
+                dtype=dataset.dtype,
+                mode="r",
+                offset=offset,
+                shape=dataset.shape,
+            )[slice_obj]
+        # read the selection straight into a numpy buffer
+        return dataset[slice_obj]
+
     @staticmethod
     def cont_from_disk_as_pickled(pickle_filepath, ivyh=None):
         """
@@ -1949,7 +2018,16 @@ class ContainerBase(dict, abc.ABC):
         )
 
     def cont_to_disk_as_hdf5(
-        self, h5_obj_or_filepath, starting_index=0, mode="a", max_batch_size=None
+        self,
+        h5_obj_or_filepath,
+        starting_index=0,
+        mode="a",
+        max_batch_size=None,
+        chunks=True,
+        compression=None,
+        compression_opts=None,
+        num_workers=4,
+        changed_only=False,
     ):
         """
         Save container object to disk, as an h5py file, at the specified filepath.
@@ -1967,6 +2045,27 @@ class ContainerBase(dict, abc.ABC):
         max_batch_size
             Maximum batch size for the container on disk, this is useful if later
             appending to file. (Default value = None)
+        chunks
+            Chunk shape of the created datasets, ``True`` for a shape picked by h5py,
+            or ``None`` to store them contiguously, which allows memory mapping them
+            when loading but not resizing them later. Either a single value for all
+            leaves, or a dict from key chains to values, where missing leaves use
+            ``True``. Default is ``True``.
+        compression
+            Compression filter of the created datasets, such as ``"gzip"`` or
+            ``"lzf"``, either a single value or a dict from key chains to values.
+            Default is ``None``, for no compression.
+        compression_opts
+            Options of the compression filter, either a single value or a dict from
+            key chains to values. Default is ``None``.
+        num_workers
+            Number of threads copying the leaves to the host, while the leaves
+            copied before are written. ``0`` copies them in the calling thread, as
+            does the numpy backend. Default is ``4``.
+        changed_only
+            Whether to skip writing the leaves whose data is unchanged since they
+            were last saved with this option, for saving repeatedly to the same
+            file. Default is ``False``.
         """
         ivy.utils.assertions.check_exists(
             h5py,
@@ -1979,32 +2078,80 @@ class ContainerBase(dict, abc.ABC):
             h5_obj = h5py.File(h5_obj_or_filepath, mode)
         else:
             h5_obj = h5_obj_or_filepath
-        for key, value in self.items():
-            if isinstance(value, ivy.Container):
-                if key not in h5_obj.keys():
-                    h5_group = h5_obj.create_group(key)
-                else:
-                    h5_group = h5_obj[key]
-                value.cont_to_disk_as_hdf5(
-                    h5_group, starting_index, mode, max_batch_size
+
+        def _leaf_option(option, key_chain, default):
+            if isinstance(option, dict):
+                return option.get(key_chain, default)
+            return option
+
+        # numpy arrays are already on the host, and are only read here
+        on_host = self._cont_ivy.current_backend_str() == "numpy"
+
+        def _to_numpy(value):
+            value_as_np = self._cont_ivy.to_numpy(value, copy=not on_host)
+            if not changed_only:
+                return value_as_np, None
+            digest = hashlib.sha256()
+            digest.update(repr((starting_index, value_as_np.shape)).encode())
+            digest.update(str(value_as_np.dtype).encode())
+            digest.update(np.ascontiguousarray(value_as_np))
+            return value_as_np, digest.hexdigest()
+
+        def _write(key_chain, value_as_np, digest):
+            if digest is not None and key_chain in h5_obj:
+                if h5_obj[key_chain].attrs.get("ivy_digest") == digest:
+                    return
+            value_shape = value_as_np.shape
+            this_batch_size = value_shape[0]
+            batch_size = ivy.default(max_batch_size, starting_index + this_batch_size)
+            if key_chain not in h5_obj:
+                dataset_shape = [batch_size] + list(value_shape[1:])
+                leaf_chunks = _leaf_option(chunks, key_chain, True)
+                h5_obj.create_dataset(
+                    key_chain,
+                    dataset_shape,
+                    dtype=value_as_np.dtype,
+                    maxshape=[None for _ in dataset_shape] if leaf_chunks else None,
+                    chunks=leaf_chunks if leaf_chunks else None,
+                    compression=_leaf_option(compression, key_chain, None),
+                    compression_opts=_leaf_option(compression_opts, key_chain, None),
                 )
+            space_left = batch_size - starting_index
+            amount_to_write = min(this_batch_size, space_left)
+            dataset = h5_obj[key_chain]
+            dataset[starting_index : starting_index + amount_to_write] = value_as_np[
+                0:amount_to_write
+            ]
+            if digest is not None:
+                dataset.attrs["ivy_digest"] = digest
+
+        leaves = list()
+        for key_chain, value in self.cont_to_iterator(include_empty=True):
+            if isinstance(value, ivy.Container):
+                # empty containers are kept as empty groups
+                h5_obj.require_group(key_chain)
             else:
-                value_as_np = self._cont_ivy.to_numpy(value)
-                value_shape = value_as_np.shape
-                this_batch_size = value_shape[0]
-                if not max_batch_size:
-                    max_batch_size = starting_index + this_batch_size
-                if key not in h5_obj.keys():
-                    dataset_shape = [max_batch_size] + list(value_shape[1:])
-                    maxshape = [None for _ in dataset_shape]
-                    h5_obj.create_dataset(
-                        key, dataset_shape, dtype=value_as_np.dtype, maxshape=maxshape
-                    )
-                space_left = max_batch_size - starting_index
-                amount_to_write = min(this_batch_size, space_left)
-                h5_obj[key][starting_index : starting_index + amount_to_write] = (
-                    value_as_np[0:amount_to_write]
-                )
+                leaves.append((key_chain, value))
+        try:
+            if not num_workers or on_host:
+                for key_chain, value in leaves:
+                    _write(key_chain, *_to_numpy(value))
+                return
+            # convert a bounded number of leaves ahead of the one being written, so
+            # that the host memory in flight stays limited
+            with ThreadPoolExecutor(num_workers) as executor:
+                pending = deque()
+                for key_chain, value in leaves:
+                    pending.append((key_chain, executor.submit(_to_numpy, value)))
+                    if len(pending) > 2 * num_workers:
+                        key_chain, future = pending.popleft()
+                        _write(key_chain, *future.result())
+                while pending:
+                    key_chain, future = pending.popleft()
+                    _write(key_chain, *future.result())
+        finally:
+            if h5_obj is not h5_obj_or_filepath:
+                h5_obj.close()
 
     def cont_to_disk_as_pickled(self, pickle_filepath):
         """
@@ -758,6 +758,12 @@ class _ContainerWithLayers(ContainerBase):
         /,
         *,
         mask: Optional[Union[ivy.Array, ivy.NativeArray, ivy.Container]] = None,
+        additive_mask: Optional[
+            Union[ivy.Array, ivy.NativeArray, ivy.Container]
+        ] = None,
+        is_causal: bool = False,
+        query_block_size: Optional[int] = None,
+        key_block_size: Optional[int] = None,
         key_chains: Optional[Union[List[str], Dict[str, str]]] = None,
         to_apply: bool = True,
         prune_unapplied: bool = False,
@@ -791,6 +797,19 @@ class _ContainerWithLayers(ContainerBase):
             The mask input array/container. The mask to apply to the query-key values.
             Default is None. The shape of mask input array leaves should be in
             *[batch_shape,num_queries,num_keys]*.
+        additive_mask
+            Optional array/container added to the scaled query-key values before
+            softmax. Its leaves should broadcast to
+            *[batch_shape,num_queries,num_keys]*. Default is None.
+        is_causal
+            Whether each query may only attend to the keys at the same or an
+            earlier position. Default is False.
+        query_block_size
+            Number of queries processed per block of the online softmax.
+            Default is None.
+        key_block_size
+            Number of keys processed per block of the online softmax.
+            Default is None.
         key_chains
             The key-chains to apply or not apply the method to. Default is ``None``.
         to_apply
@@ -853,6 +872,10 @@ class _ContainerWithLayers(ContainerBase):
             v,
             scale,
             mask=mask,
+            additive_mask=additive_mask,
+            is_causal=is_causal,
+            query_block_size=query_block_size,
+            key_block_size=key_block_size,
             key_chains=key_chains,
             to_apply=to_apply,
             prune_unapplied=prune_unapplied,
@@ -868,6 +891,12 @@ class _ContainerWithLayers(ContainerBase):
         /,
         *,
         mask: Optional[Union[ivy.Array, ivy.NativeArray, ivy.Container]] = None,
+        additive_mask: Optional[
+            Union[ivy.Array, ivy.NativeArray, ivy.Container]
+        ] = None,
+        is_causal: bool = False,
+        query_block_size: Optional[int] = None,
+        key_block_size: Optional[int] = None,
         key_chains: Optional[Union[List[str], Dict[str, str]]] = None,
         to_apply: bool = True,
         prune_unapplied: bool = False,
@@ -901,6 +930,19 @@ class _ContainerWithLayers(ContainerBase):
             The mask input array/container. The mask to apply to the query-key values.
             Default is None. The shape of mask input array leaves should be in
             *[batch_shape,num_queries,num_keys]*.
+        additive_mask
+            Optional array/container added to the scaled query-key values before
+            softmax. Its leaves should broadcast to
+            *[batch_shape,num_queries,num_keys]*. Default is None.
+        is_causal
+            Whether each query may only attend to the keys at the same or an
+            earlier position. Default is False.
+        query_block_size
+            Number of queries processed per block of the online softmax.
+            Default is None.
+        key_block_size
+            Number of keys processed per block of the online softmax.
+            Default is None.
         key_chains
             The key-chains to apply or not apply the method to. Default is ``None``.
         to_apply
@@ -961,6 +1003,10 @@ class _ContainerWithLayers(ContainerBase):
             v,
             scale,
             mask=mask,
+            additive_mask=additive_mask,
+            is_causal=is_causal,
+            query_block_size=query_block_size,
+            key_block_size=key_block_size,
             key_chains=key_chains,
             to_apply=to_apply,
             prune_unapplied=prune_unapplied,
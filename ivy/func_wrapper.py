@@ -205,8 +205,8 @@ def try_array_function_override(func, overloaded_args, types, args, kwargs):
         # check all argument types.
         try:
             result = overloaded_arg.__ivy_array_function__(func, types, args, kwargs)
-        except Exception:
-            raise ivy.utils.exceptions.IvyNotImplementedException
+        except Exception as e:
+            raise ivy.utils.exceptions.IvyNotImplementedException(str(e)) from e
 
         if result is not NotImplemented:
             return True, result
@@ -296,6 +296,16 @@ def _check_in_nested_sequence(sequence, value=None, _type=None):
 # ---------------#
 
 
+def _array_function_candidates(args, kwargs):
+    # arrays inside sequence arguments, such as the inputs of ivy.concat, can
+    # override the function as well
+    for arg in args + tuple(kwargs.values()):
+        if isinstance(arg, (list, tuple)):
+            yield from arg
+        else:
+            yield arg
+
+
 def handle_array_function(fn):
     """
     Wrap a function `fn` to be passed to array_function method.
@@ -309,7 +319,7 @@ def handle_array_function(fn):
         overloaded_types = []
         overloaded_args = []
 
-        for arg in args + tuple(kwargs.values()):
+        for arg in _array_function_candidates(args, kwargs):
             if ivy.exists(arg) and (
                 not isinstance(arg, ivy.Container)
                 and hasattr(arg, "__ivy_array_function__")
@@ -359,42 +369,58 @@ def handle_array_function(fn):
     return _handle_array_function
 
 
+def _get_array_like_spec(fn: Callable) -> tuple:
+    """
+    Return the (index, name) pairs of the parameters of `fn` which accept array-like
+    inputs, i.e. which are annotated as arrays but not as sequences or scalars.
+    """
+    try:
+        type_hints = inspect.signature(fn).parameters
+    except (TypeError, ValueError):
+        return ()
+    spec = list()
+    for i, (parameter, param) in enumerate(type_hints.items()):
+        annotation_str = str(param.annotation)
+        if (
+            ("rray" in annotation_str or "Tensor" in annotation_str)
+            and parameter != "out"
+            and all(
+                sq not in annotation_str
+                for sq in ["Sequence", "List", "Tuple", "float", "int", "bool"]
+            )
+        ):
+            spec.append((i, parameter))
+    return tuple(spec)
+
+
 def handle_array_like_without_promotion(fn: Callable) -> Callable:
+    # resolved on the first call, once all of the annotations have been set
+    array_like_spec = None
+
     @functools.wraps(fn)
     def _handle_array_like_without_promotion(*args, **kwargs):
+        nonlocal array_like_spec
+        if array_like_spec is None:
+            array_like_spec = _get_array_like_spec(fn)
+        if not array_like_spec:
+            return fn(*args, **kwargs)
         args = list(args)
         num_args = len(args)
-        try:
-            type_hints = inspect.signature(fn).parameters
-        except (TypeError, ValueError):
-            return fn(*args, **kwargs)
-        parameters = list(type_hints.keys())
-        annotations = [param.annotation for param in type_hints.values()]
-
-        for i, (annotation, parameter, arg) in enumerate(
-            zip(annotations, parameters, args)
-        ):
-            annotation_str = str(annotation)
-            if (
-                ("rray" in annotation_str or "Tensor" in annotation_str)
-                and parameter != "out"
-                and all(
-                    sq not in annotation_str
-                    for sq in ["Sequence", "List", "Tuple", "float", "int", "bool"]
-                )
-            ):
-                if i < num_args:
-                    # Fix for ellipsis, slices for numpy's __getitem__
-                    # No need to try and convert them into arrays
-                    # since asarray throws unpredictable bugs
-                    if _check_in_nested_sequence(arg, value=Ellipsis, _type=slice):
-                        continue
-                    if not ivy.is_array(arg):
-                        args[i] = ivy.array(arg)
-                elif parameters in kwargs:
-                    kwarg = kwargs[parameter]
-                    if not ivy.is_array(kwarg):
-                        kwargs[parameter] = ivy.array(kwarg)
+        # only positional arguments are converted, keyword arguments are passed
+        # through as they are, since None and scalars are valid values of many
+        # optional array slots
+        for i, _ in array_like_spec:
+            if i < num_args:
+                arg = args[i]
+                # objects overriding ivy functions handle their own conversion
+                if ivy.is_array(arg) or hasattr(type(arg), "__ivy_array_function__"):
+                    continue
+                # Fix for ellipsis, slices for numpy's __getitem__
+                # No need to try and convert them into arrays
+                # since asarray throws unpredictable bugs
+                if _check_in_nested_sequence(arg, value=Ellipsis, _type=slice):
+                    continue
+                args[i] = ivy.array(arg)
 
         return fn(*args, **kwargs)
 
@@ -974,6 +1000,108 @@ def handle_nestable(fn: Callable) -> Callable:
     return _handle_nestable
 
 
+# Fused Dispatch #
+# ---------------#
+
+# wrappers whose work the fused dispatcher can replace with a single pass over the
+# arguments, functions with any other wrapper always go through the full chain
+FUSABLE_DECORATORS = (
+    "handle_array_function",
+    "outputs_to_ivy_arrays",
+    "inputs_to_native_arrays",
+    "handle_out_argument",
+    "handle_array_like_without_promotion",
+    "handle_nestable",
+    "handle_exceptions",
+    "handle_nans",
+)
+
+_fused_leaf_types = (str, int, float, complex, type(None))
+
+
+def _fused_native_args(args, kwargs, to_native, array_like_idxs):
+    """
+    Replace the ivy arrays in `args` and `kwargs` with native arrays in one pass.
+
+    Returns ``None`` if any argument requires the full wrapper chain, e.g.
+    containers, nests, `out` arrays or non-array values passed positionally in the
+    array-like slots `array_like_idxs`.
+    """
+    if kwargs.get("out") is not None:
+        return None
+    native_array = ivy.NativeArray
+    new_args = []
+    for i, arg in enumerate(args):
+        if isinstance(arg, ivy.Array):
+            arg = arg.data if to_native else arg
+        elif not isinstance(arg, native_array) and (
+            i in array_like_idxs or not isinstance(arg, _fused_leaf_types)
+        ):
+            return None
+        new_args.append(arg)
+    new_kwargs = {}
+    for key, val in kwargs.items():
+        if isinstance(val, ivy.Array):
+            val = val.data if to_native else val
+        elif not isinstance(val, (native_array,) + _fused_leaf_types):
+            return None
+        new_kwargs[key] = val
+    return new_args, new_kwargs
+
+
+def _fuse_wrappers(fn: Callable, wrapped: Callable) -> Callable:
+    """
+    Build a single dispatcher for the backend function `fn`.
+
+    The dispatcher converts the arguments and the return in one pass and calls `fn`
+    directly whenever the arguments only contain arrays and scalars, otherwise it
+    falls back to `wrapped`, the chain of wrappers built by `_wrap_function`.
+
+    Parameters
+    ----------
+    fn
+        the unwrapped backend function.
+    wrapped
+        `fn` wrapped with all of the decorators of its original implementation.
+
+    Returns
+    -------
+    ret
+        the fused dispatcher, exposing the same attributes as `wrapped`.
+    """
+    to_native = hasattr(wrapped, "inputs_to_native_arrays")
+    to_ivy = hasattr(wrapped, "outputs_to_ivy_arrays")
+    check_nans = hasattr(wrapped, "handle_nans")
+    array_like = hasattr(wrapped, "handle_array_like_without_promotion")
+    array_like_idxs = None if array_like else frozenset()
+
+    @functools.wraps(fn)
+    def _call_fn(*args, **kwargs):
+        ret = fn(*args, **kwargs)
+        if not to_ivy:
+            return ret
+        if isinstance(ret, ivy.NativeArray):
+            return ivy.Array(ret)
+        return ivy.to_ivy(ret, nested=True, include_derived={tuple: True})
+
+    if hasattr(wrapped, "handle_exceptions"):
+        _call_fn = ivy.handle_exceptions(_call_fn)
+
+    @functools.wraps(wrapped)
+    def _fused_dispatch(*args, **kwargs):
+        nonlocal array_like_idxs
+        if array_like_idxs is None:
+            array_like_idxs = frozenset(i for i, _ in _get_array_like_spec(fn))
+        if ivy.array_mode and not (check_nans and ivy.nan_policy != "nothing"):
+            native_args = _fused_native_args(args, kwargs, to_native, array_like_idxs)
+            if native_args is not None:
+                return _call_fn(*native_args[0], **native_args[1])
+        return wrapped(*args, **kwargs)
+
+    _fused_dispatch.fused_dispatch = True
+    return _fused_dispatch
+
+
 # Functions #
 
 
@@ -1042,6 +1170,7 @@ def _wrap_function(
             add_wrappers = backend_wrappers.get("to_add")
             skip_wrappers = backend_wrappers.get("to_skip")
 
+        backend_fn = to_wrap
         for attr in FN_DECORATORS:
             if hasattr(original, attr) and not hasattr(to_wrap, attr):
                 if attr not in skip_wrappers:
@@ -1058,6 +1187,21 @@ def _wrap_function(
                 if attr in add_wrappers:
                     to_wrap = getattr(ivy, attr)(to_wrap)
 
+        # replace the chain of wrappers with a single dispatcher, only when all of
+        # the wrappers have been added here and the fused dispatcher covers them
+        if (
+            ivy.fused_dispatch_mode
+            and not mixed_fn
+            and to_wrap is not backend_fn
+            and not any(hasattr(backend_fn, attr) for attr in FN_DECORATORS)
+            and all(
+                attr in FUSABLE_DECORATORS
+                for attr in FN_DECORATORS
+                if hasattr(to_wrap, attr)
+            )
+        ):
+            to_wrap = _fuse_wrappers(backend_fn, to_wrap)
+
         # we should remove the all the decorators
         # after handle_mixed_fuction in FN_DECORATORS
         # from the compos function because these will
@@ -92,3 +92,9 @@ def native_sparse_array_to_indices_values_and_shape(x):
         " indices, values and shape."
     )
     return None, None, None
+
+
+def native_sparse_array_matmul(x, y):
+    raise ivy.utils.exceptions.IvyNotImplementedException(
+        "Jax does not support sparse array natively"
+    )
@@ -1,6 +1,7 @@
 """Collection of Jax network layers, wrapped to fit Ivy syntax and signature."""
 
 # global
+import jax
 import jax.lax as jlax
 import jax.numpy as jnp
 
@@ -379,3 +380,41 @@ def conv_general_transpose(
     if data_format == "channel_first":
         return jnp.transpose(res, (0, dims + 1, *range(1, dims + 1)))
     return res
+
+
+def lstm_update(
+    x: JaxArray,
+    init_h: JaxArray,
+    init_c: JaxArray,
+    kernel: JaxArray,
+    recurrent_kernel: JaxArray,
+    /,
+    *,
+    bias: Optional[JaxArray] = None,
+    recurrent_bias: Optional[JaxArray] = None,
+) -> Tuple[JaxArray, JaxArray]:
+    dtype = jnp.result_type(x, init_h, init_c, kernel, recurrent_kernel)
+    if not jnp.issubdtype(dtype, jnp.inexact):
+        dtype = ivy.default_float_dtype(as_native=True)
+
+    # input projections of all the timesteps, scanned over the leading time axis
+    Wi_x = jnp.moveaxis(jnp.matmul(x, kernel), -2, 0).astype(dtype)
+    if bias is not None:
+        Wi_x = Wi_x + bias
+    if recurrent_bias is not None:
+        Wi_x = Wi_x + recurrent_bias
+
+    def _step(carry, Wi_xt):
+        ht, ct = carry
+        it, ft, gt, ot = jnp.split(Wi_xt + jnp.matmul(ht, recurrent_kernel), 4, -1)
+        ct = jax.nn.sigmoid(ft) * ct + jax.nn.sigmoid(it) * jnp.tanh(gt)
+        ht = jax.nn.sigmoid(ot) * jnp.tanh(ct)
+        return (ht.astype(dtype), ct.astype(dtype)), ht.astype(dtype)
+
+    batch_shape = Wi_x.shape[1:-1]
+    init = (
+        jnp.broadcast_to(init_h, batch_shape + init_h.shape[-1:]).astype(dtype),
+        jnp.broadcast_to(init_c, batch_shape + init_c.shape[-1:]).astype(dtype),
+    )
+    (_, ct), hts = jlax.scan(_step, init, Wi_x)
+    return jnp.moveaxis(hts, 0, -2), ct
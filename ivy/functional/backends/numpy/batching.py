@@ -0,0 +1,510 @@
+"""Batching rules used by the numpy backend's vectorized map."""
+
+# global
+import numpy as np
+
+# local
+import ivy
+
+
+batching_rules = dict()
+
+
+class _Unbatchable(ivy.utils.exceptions.IvyNotImplementedException):
+    """Raised when a vmapped function can't be run on the whole batch at once."""
+
+
+class _BatchTrace:
+    """
+    State shared by the tracers of one vmap call.
+
+    `unsupported` is set once a tracer reaches an operation it has no batching rule
+    for, which tells the errors caused by batching apart from those of the
+    vmapped function itself.
+    """
+
+    __slots__ = ("unsupported",)
+
+    def __init__(self):
+        self.unsupported = False
+
+
+class _BatchTracer:
+    """
+    Stand-in for a single example while a vmapped function runs.
+
+    The wrapped native array `val` holds the whole batch, with the mapped axes
+    leading (one per nested vmap). Ivy functions called on the tracer are
+    intercepted through ``__ivy_array_function__`` and executed once on the
+    batched array according to their rule in ``batching_rules``.
+    """
+
+    __slots__ = ("val", "batch_ndim", "trace")
+
+    # let numpy defer binary operators to the reflected tracer methods
+    __array_ufunc__ = None
+
+    def __init__(self, val, batch_ndim, trace):
+        self.val = val
+        self.batch_ndim = batch_ndim
+        self.trace = trace
+
+    def _unsupported(self, message):
+        self.trace.unsupported = True
+        return _Unbatchable(message)
+
+    def __ivy_array_function__(self, func, types, args, kwargs):
+        rule = batching_rules.get(func.__name__)
+        if (
+            rule is None
+            or any(
+                isinstance(v, _BatchTracer) or (k == "out" and v is not None)
+                for k, v in kwargs.items()
+            )
+            or any(
+                isinstance(arg, _BatchTracer)
+                and (arg.trace is not self.trace or arg.batch_ndim != self.batch_ndim)
+                for arg in args
+            )
+        ):
+            self.trace.unsupported = True
+            return NotImplemented
+        try:
+            ret = rule(func, self.batch_ndim, *args, **kwargs)
+        except _Unbatchable:
+            self.trace.unsupported = True
+            raise
+        return _BatchTracer(ivy.to_native(ret), self.batch_ndim, self.trace)
+
+    @property
+    def shape(self):
+        return self.val.shape[self.batch_ndim :]
+
+    @property
+    def ndim(self):
+        return self.val.ndim - self.batch_ndim
+
+    @property
+    def dtype(self):
+        return self.val.dtype
+
+    @property
+    def size(self):
+        return int(np.prod(self.shape))
+
+    def __len__(self):
+        return self.shape[0]
+
+    def __array__(self, *args, **kwargs):
+        raise self._unsupported("batched values cannot be converted to arrays")
+
+    def __bool__(self):
+        raise self._unsupported("batched values cannot be used in control flow")
+
+    __float__ = __int__ = __index__ = __bool__
+
+    def __getitem__(self, query):
+        query = query if isinstance(query, tuple) else (query,)
+        for q in query:
+            if q is not None and q is not Ellipsis and not isinstance(q, slice):
+                if isinstance(q, (bool, np.bool_)) or not isinstance(
+                    q, (int, np.integer)
+                ):
+                    raise self._unsupported(
+                        "only basic indexing is supported on batched values"
+                    )
+        return _BatchTracer(
+            self.val[(slice(None),) * self.batch_ndim + query],
+            self.batch_ndim,
+            self.trace,
+        )
+
+    def __add__(self, other):
+        return ivy.add(self, other)
+
+    def __radd__(self, other):
+        return ivy.add(other, self)
+
+    def __sub__(self, other):
+        return ivy.subtract(self, other)
+
+    def __rsub__(self, other):
+        return ivy.subtract(other, self)
+
+    def __mul__(self, other):
+        return ivy.multiply(self, other)
+
+    def __rmul__(self, other):
+        return ivy.multiply(other, self)
+
+    def __truediv__(self, other):
+        return ivy.divide(self, other)
+
+    def __rtruediv__(self, other):
+        return ivy.divide(other, self)
+
+    def __floordiv__(self, other):
+        return ivy.floor_divide(self, other)
+
+    def __rfloordiv__(self, other):
+        return ivy.floor_divide(other, self)
+
+    def __mod__(self, other):
+        return ivy.remainder(self, other)
+
+    def __rmod__(self, other):
+        return ivy.remainder(other, self)
+
+    def __pow__(self, other):
+        return ivy.pow(self, other)
+
+    def __rpow__(self, other):
+        return ivy.pow(other, self)
+
+    def __matmul__(self, other):
+        return ivy.matmul(self, other)
+
+    def __rmatmul__(self, other):
+        return ivy.matmul(other, self)
+
+    def __and__(self, other):
+        return ivy.bitwise_and(self, other)
+
+    def __rand__(self, other):
+        return ivy.bitwise_and(other, self)
+
+    def __or__(self, other):
+        return ivy.bitwise_or(self, other)
+
+    def __ror__(self, other):
+        return ivy.bitwise_or(other, self)
+
+    def __xor__(self, other):
+        return ivy.bitwise_xor(self, other)
+
+    def __rxor__(self, other):
+        return ivy.bitwise_xor(other, self)
+
+    def __neg__(self):
+        return ivy.negative(self)
+
+    def __pos__(self):
+        return ivy.positive(self)
+
+    def __abs__(self):
+        return ivy.abs(self)
+
+    def __invert__(self):
+        return ivy.bitwise_invert(self)
+
+    def __eq__(self, other):
+        return ivy.equal(self, other)
+
+    def __ne__(self, other):
+        return ivy.not_equal(self, other)
+
+    def __lt__(self, other):
+        return ivy.less(self, other)
+
+    def __le__(self, other):
+        return ivy.less_equal(self, other)
+
+    def __gt__(self, other):
+        return ivy.greater(self, other)
+
+    def __ge__(self, other):
+        return ivy.greater_equal(self, other)
+
+    __hash__ = None
+
+
+def _batching_rule(*fn_names):
+    def _register(rule):
+        for fn_name in fn_names:
+            batching_rules[fn_name] = rule
+        return rule
+
+    return _register
+
+
+def _example_ndim(x):
+    return x.ndim if hasattr(x, "ndim") else np.ndim(x)
+
+
+def _shift_axis(axis, batch_ndim):
+    # negative axes count from the end, which the leading batch axes don't affect
+    if isinstance(axis, (list, tuple)):
+        return tuple(_shift_axis(a, batch_ndim) for a in axis)
+    return axis if axis < 0 else axis + batch_ndim
+
+
+def _expand_to_ndim(x, ndim, batch_ndim):
+    # insert unit axes after the batch axes of a tracer, up to an example rank of ndim
+    val = x.val
+    return val.reshape(
+        val.shape[:batch_ndim] + (1,) * (ndim - x.ndim) + val.shape[batch_ndim:]
+    )
+
+
+def _align(args, batch_ndim):
+    # give every batched argument the broadcast rank of the example, so that the
+    # batch axes line up and the unbatched arguments broadcast over the trailing axes
+    ndim = max([_example_ndim(arg) for arg in args] + [0])
+    return [
+        _expand_to_ndim(arg, ndim, batch_ndim) if isinstance(arg, _BatchTracer) else arg
+        for arg in args
+    ]
+
+
+@_batching_rule(
+    "abs",
+    "acos",
+    "acosh",
+    "add",
+    "angle",
+    "asin",
+    "asinh",
+    "atan",
+    "atan2",
+    "atanh",
+    "bitwise_and",
+    "bitwise_invert",
+    "bitwise_left_shift",
+    "bitwise_or",
+    "bitwise_right_shift",
+    "bitwise_xor",
+    "ceil",
+    "clip",
+    "cos",
+    "cosh",
+    "deg2rad",
+    "divide",
+    "equal",
+    "erf",
+    "exp",
+    "exp2",
+    "expm1",
+    "floor",
+    "floor_divide",
+    "fmin",
+    "fmod",
+    "gcd",
+    "gelu",
+    "greater",
+    "greater_equal",
+    "imag",
+    "isfinite",
+    "isinf",
+    "isnan",
+    "isreal",
+    "lcm",
+    "leaky_relu",
+    "less",
+    "less_equal",
+    "log",
+    "log10",
+    "log1p",
+    "log2",
+    "logaddexp",
+    "logaddexp2",
+    "logical_and",
+    "logical_not",
+    "logical_or",
+    "logical_xor",
+    "maximum",
+    "minimum",
+    "mish",
+    "multiply",
+    "nan_to_num",
+    "negative",
+    "not_equal",
+    "positive",
+    "pow",
+    "rad2deg",
+    "real",
+    "reciprocal",
+    "relu",
+    "remainder",
+    "round",
+    "sigmoid",
+    "sign",
+    "sin",
+    "sinh",
+    "softplus",
+    "sqrt",
+    "square",
+    "subtract",
+    "tan",
+    "tanh",
+    "trunc",
+    "trunc_divide",
+    "where",
+)
+def _elementwise_rule(func, batch_ndim, *args, **kwargs):
+    return func(*_align(args, batch_ndim), **kwargs)
+
+
+@_batching_rule("all", "any", "max", "mean", "min", "prod", "std", "sum", "var")
+def _reduction_rule(func, batch_ndim, x, /, *, axis=None, **kwargs):
+    if axis is None:
+        axis = tuple(range(x.ndim))
+    return func(x.val, axis=_shift_axis(axis, batch_ndim), **kwargs)
+
+
+@_batching_rule("argmax", "argmin")
+def _arg_reduction_rule(func, batch_ndim, x, /, *, axis=None, keepdims=False, **kwargs):
+    if axis is not None:
+        return func(
+            x.val, axis=_shift_axis(axis, batch_ndim), keepdims=keepdims, **kwargs
+        )
+    batch_shape = x.val.shape[:batch_ndim]
+    ret = ivy.to_native(func(x.val.reshape(batch_shape + (-1,)), axis=-1, **kwargs))
+    return ret.reshape(batch_shape + (1,) * x.ndim) if keepdims else ret
+
+
+def _axis_rule(default_axis):
+    def _rule(func, batch_ndim, x, /, *, axis=None, **kwargs):
+        axis = default_axis if axis is None else axis
+        return func(x.val, axis=_shift_axis(axis, batch_ndim), **kwargs)
+
+    return _rule
+
+
+_batching_rule("argsort", "log_softmax", "softmax", "sort")(_axis_rule(-1))
+_batching_rule("cumprod")(_axis_rule(0))
+
+
+@_batching_rule("cumsum")
+def _cumsum_rule(func, batch_ndim, x, axis=0, *args, **kwargs):
+    return func(x.val, _shift_axis(axis, batch_ndim), *args, **kwargs)
+
+
+@_batching_rule("vecdot")
+def _vecdot_rule(func, batch_ndim, x1, x2, /, *, axis=-1, out=None):
+    # the backend contracts with tensordot, which only matches a batched
+    # contraction over the last axis for vector examples
+    if _example_ndim(x1) != 1 or _example_ndim(x2) != 1:
+        raise _Unbatchable("vecdot is only batched for vector examples")
+    x1, x2 = ivy.promote_types_of_inputs(*_align((x1, x2), batch_ndim))
+    return np.sum(np.multiply(x1, x2), axis=-1)
+
+
+@_batching_rule("matmul")
+def _matmul_rule(func, batch_ndim, x1, x2, /, **kwargs):
+    # lift batched vectors to matrices, as the batch axes would otherwise be taken
+    # as their rows, and drop the added axes from the result again
+    lift_x1 = (
+        isinstance(x1, _BatchTracer)
+        and x1.ndim == 1
+        and (isinstance(x2, _BatchTracer) or np.ndim(x2) > 2)
+    )
+    lift_x2 = isinstance(x2, _BatchTracer) and x2.ndim == 1
+    if (lift_x1 or lift_x2) and any(kwargs.values()):
+        raise _Unbatchable("transposed matmul of batched vectors is not supported")
+    operands = list()
+    for x, lift, vector_axis in ((x1, lift_x1, -2), (x2, lift_x2, -1)):
+        if lift:
+            x = _BatchTracer(np.expand_dims(x.val, vector_axis), batch_ndim, x.trace)
+        operands.append(x)
+    # pad the batched matrices to the rank of the other operand
+    ndim = max(_example_ndim(x) for x in operands)
+    for i, x in enumerate(operands):
+        if isinstance(x, _BatchTracer):
+            operands[i] = _expand_to_ndim(x, ndim, batch_ndim) if x.ndim > 1 else x.val
+    ret = ivy.to_native(func(*operands, **kwargs))
+    if lift_x2:
+        ret = ret[..., 0]
+    if lift_x1:
+        ret = ret[..., 0] if lift_x2 else ret[..., 0, :]
+    return ret
+
+
+@_batching_rule("reshape")
+def _reshape_rule(func, batch_ndim, x, /, shape, *, order="C", **kwargs):
+    if order != "C":
+        raise _Unbatchable("only C ordered reshapes are supported on batched values")
+    return func(x.val, x.val.shape[:batch_ndim] + tuple(shape), order=order, **kwargs)
+
+
+@_batching_rule("permute_dims")
+def _permute_dims_rule(func, batch_ndim, x, /, axes, **kwargs):
+    axes = tuple(range(batch_ndim)) + tuple(a % x.ndim + batch_ndim for a in axes)
+    return func(x.val, axes, **kwargs)
+
+
+@_batching_rule("swapaxes")
+def _swapaxes_rule(func, batch_ndim, x, axis0, axis1, /, **kwargs):
+    return func(
+        x.val,
+        _shift_axis(axis0, batch_ndim),
+        _shift_axis(axis1, batch_ndim),
+        **kwargs,
+    )
+
+
+@_batching_rule("expand_dims")
+def _expand_dims_rule(func, batch_ndim, x, /, *, axis=0, **kwargs):
+    return func(x.val, axis=_shift_axis(axis, batch_ndim), **kwargs)
+
+
+@_batching_rule("squeeze")
+def _squeeze_rule(func, batch_ndim, x, /, axis=None, **kwargs):
+    if axis is None:
+        axis = tuple(i for i, d in enumerate(x.shape) if d == 1)
+    return func(x.val, _shift_axis(axis, batch_ndim), **kwargs)
+
+
+def _batched_vmap_call(func, args, in_axes, axis_size, out_axes):
+    """
+    Call `func` once on the whole batch, with the mapped arguments replaced by
+    tracers which execute the ivy functions they reach through ``batching_rules``.
+
+    Arguments that are themselves tracers of an enclosing vmap get an extra batch
+    axis, so nested vmaps run as a single batched computation. ``_Unbatchable`` is
+    raised if `func` reaches a function without a batching rule or returns
+    something other than an array, any other error of `func` is raised as it is.
+    """
+    outer = [arg for arg in args if isinstance(arg, _BatchTracer)]
+    if len({(arg.batch_ndim, id(arg.trace)) for arg in outer}) > 1:
+        raise _Unbatchable("arguments are batched by different vmaps")
+    batch_ndim = outer[0].batch_ndim if outer else 0
+    trace = outer[0].trace if outer else _BatchTrace()
+    batched_args = list()
+    for arg, axis in zip(args, in_axes):
+        if isinstance(arg, _BatchTracer):
+            if axis is None:
+                val = np.expand_dims(arg.val, batch_ndim)
+            else:
+                val = np.moveaxis(arg.val, batch_ndim + axis % arg.ndim, batch_ndim)
+            arg = _BatchTracer(val, batch_ndim + 1, trace)
+        elif axis is not None:
+            val = np.moveaxis(arg, axis, 0)
+            val = val.reshape((1,) * batch_ndim + val.shape)
+            arg = _BatchTracer(val, batch_ndim + 1, trace)
+        batched_args.append(arg)
+
+    try:
+        ret = func(*batched_args)
+    except Exception as e:
+        if trace.unsupported:
+            raise _Unbatchable(str(e)) from e
+        raise
+    if isinstance(ret, _BatchTracer) and ret.batch_ndim == batch_ndim + 1:
+        ret = ret.val
+        ret = np.broadcast_to(
+            ret, ret.shape[:batch_ndim] + (axis_size,) + ret.shape[batch_ndim + 1 :]
+        )
+    elif ivy.is_array(ret) and not isinstance(ret, _BatchTracer):
+        # the output doesn't depend on the mapped arguments
+        ret = ivy.to_native(ret)
+        ret = np.broadcast_to(ret, (axis_size,) + ret.shape)
+        batch_ndim = 0
+    else:
+        trace.unsupported = True
+        raise _Unbatchable("the vmapped function must return a single array")
+    ret = np.moveaxis(
+        ret, batch_ndim, batch_ndim + out_axes % (ret.ndim - batch_ndim)
+    )
+    if batch_ndim:
+        return _BatchTracer(ret, batch_ndim, trace)
+    return np.ascontiguousarray(ret)
@@ -1,5 +1,11 @@
 # global
 import logging
+import numpy as np
+
+try:
+    import scipy.sparse as sp
+except ImportError:
+    sp = None
 
 # local
 import ivy
@@ -14,8 +20,8 @@ from ivy.functional.ivy.experimental.sparse_array import (
 
 
 def is_native_sparse_array(x):
-    """Numpy does not support sparse arrays natively."""
-    return False
+    """Numpy arrays are sparse through scipy.sparse, when it is installed."""
+    return sp is not None and sp.issparse(x)
 
 
 def native_sparse_array(
@@ -88,13 +94,43 @@ def native_sparse_array(
             values=values,
             dense_shape=dense_shape,
         )
-    logging.warning("Numpy does not support sparse array natively, None is returned.")
-    return None
+    if sp is None or format == "bsc" or (format == "coo" and len(dense_shape) != 2):
+        logging.warning(
+            "Numpy does not support sparse array natively, None is returned."
+        )
+        return None
+    shape = tuple(dense_shape)
+    if format == "coo":
+        return sp.coo_matrix((values, tuple(coo_indices)), shape=shape)
+    if format == "csr":
+        return sp.csr_matrix((values, col_indices, crow_indices), shape=shape)
+    if format == "bsr":
+        return sp.bsr_matrix((values, col_indices, crow_indices), shape=shape)
+    return sp.csc_matrix((values, row_indices, ccol_indices), shape=shape)
 
 
 def native_sparse_array_to_indices_values_and_shape(x):
+    if is_native_sparse_array(x):
+        if x.format == "coo":
+            return {"coo_indices": np.stack([x.row, x.col])}, x.data, x.shape
+        if x.format in ["csr", "bsr"]:
+            return (
+                {"crow_indices": x.indptr, "col_indices": x.indices},
+                x.data,
+                x.shape,
+            )
+        if x.format == "csc":
+            return (
+                {"ccol_indices": x.indptr, "row_indices": x.indices},
+                x.data,
+                x.shape,
+            )
     logging.warning(
         "Numpy does not support sparse array natively, None is returned for        "
         " indices, values and shape."
     )
     return None, None, None
+
+
+def native_sparse_array_matmul(x, y):
+    return np.asarray(x @ y)
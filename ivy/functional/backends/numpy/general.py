@@ -10,8 +10,10 @@ from numbers import Number
 
 # local
 import ivy
+from ivy.functional.backends.numpy.batching import _batched_vmap_call, _Unbatchable
 from ivy.functional.backends.numpy.device import _to_device
 from ivy.functional.backends.numpy.helpers import _scalar_output_to_0d_array
+from ivy.functional.backends.numpy.tape import _Tracked
 from ivy.func_wrapper import with_unsupported_dtypes
 from . import backend_version
 
@@ -221,7 +223,8 @@ def inplace_variables_supported():
 def is_native_array(x, /, *, exclusive=False):
     if isinstance(x, (np.ndarray, np.generic)):
         return True
-    return False
+    # arrays recorded on a gradient tape are the variables of the numpy backend
+    return not exclusive and isinstance(x, _Tracked)
 
 
 def multiprocessing(context: Optional[str] = None):
@@ -366,16 +369,18 @@ def vmap(
                 as_array=False,
             )
 
+        # the mapped axis of each positional argument
+        if isinstance(in_axes, (list, tuple)):
+            axes = list(in_axes)
+        else:
+            axes = [in_axes] * len(args)
+
         # checking uniqueness of axis_size
         axis_size = set()
 
-        if isinstance(in_axes, int):
-            for arg in args:
-                axis_size.add(arg.shape[in_axes])
-        elif isinstance(in_axes, (list, tuple)):
-            for arg, axis in zip(args, in_axes):
-                if axis is not None:
-                    axis_size.add(arg.shape[axis])
+        for arg, axis in zip(args, axes):
+            if axis is not None:
+                axis_size.add(arg.shape[axis])
 
         if len(axis_size) > 1:
             raise ivy.utils.exceptions.IvyException(
@@ -394,28 +399,24 @@ def vmap(
                 in_axes, message="single value in_axes should not be None"
             )
 
+        # run func once on the whole batch where all the ivy functions it calls
+        # have batching rules, and only fall back to mapping it over the examples
+        # when it can't be batched, errors raised by func itself are propagated
+        try:
+            return _batched_vmap_call(func, args, axes, tuple(axis_size)[0], out_axes)
+        except _Unbatchable:
+            pass
+
         # Handling None in in_axes by broadcasting the axis_size
-        if isinstance(in_axes, (tuple, list)) and None in in_axes:
-            none_axis_index = list()
-            for index, axis in enumerate(in_axes):
-                if axis is None:
-                    none_axis_index.append(index)
-
-            for none_mapped_axis in none_axis_index:
-                args[none_mapped_axis] = np.broadcast_to(
-                    args[none_mapped_axis],
-                    (tuple(axis_size) + args[none_mapped_axis].shape),
+        for index, axis in enumerate(axes):
+            if axis is None:
+                args[index] = np.broadcast_to(
+                    args[index], (tuple(axis_size) + args[index].shape)
                 )
+            else:
+                # set up the axis to be mapped to index zero.
+                args[index] = np.moveaxis(args[index], axis, 0)
 
-        # set up the axis to be mapped to index zero.
-        if isinstance(in_axes, (tuple, list)):
-            for i in range(len(in_axes)):
-                if in_axes[i] is not None:
-                    args[i] = np.moveaxis(args[i], in_axes[i], 0)
-        elif isinstance(in_axes, int):
-            args[0] = np.moveaxis(args[0], in_axes, 0)
-
-        # vectorisation. To be optimized.
         arr_results = []
         for arrays in zip(*args):
             single_op = func(*arrays)
@@ -1,99 +1,218 @@
 """Collection of NumPy gradient functions, wrapped to fit Ivy syntax and signature."""
 
 # global
-import logging
-from typing import Optional, Sequence, Union
+import numpy as np
+from typing import Optional, Callable, Sequence, Union, Tuple
+
+# local
 import ivy
+from ivy.functional.ivy.gradients import (
+    _get_required_float_variables,
+    _set_duplicates,
+    _process_func_ret_and_grads,
+    _idxs_to_str,
+)
+from ivy.functional.backends.numpy.tape import _Tape, _Tracked
 
 
 def variable(x, /):
-    logging.warning(
-        "NumPy does not support autograd, declaring a 'variable' "
-        "is identical to declaring an 'array' when using numpy backend."
-    )
     return x
 
 
 def is_variable(x, /, *, exclusive=False):
-    # NumPy does not support autograd, checking if x is a variable does have any meaning
-    # for NumPy. Return False.
-    return False
+    # numpy arrays are only differentiated while a tape records them
+    return isinstance(x, _Tracked)
 
 
 def variable_data(x, /):
-    return x
+    return x.val if isinstance(x, _Tracked) else x
 
 
-def execute_with_gradients(
-    func,
-    xs,
-    /,
-    *,
-    retain_grads: bool = False,
-    xs_grad_idxs: Optional[Sequence[Sequence[Union[str, int]]]] = None,
-    ret_grad_idxs: Optional[Sequence[Sequence[Union[str, int]]]] = None,
-):
-    logging.warning(
-        "NumPy does not support autograd, "
-        "'execute_with_gradients' returns None in place of function gradients."
-    )
-    xs = ivy.to_ivy(xs)
-    func_ret = func(xs)
-    return func_ret, None
+def _is_tracked(x):
+    return isinstance(x.data if isinstance(x, ivy.Array) else x, _Tracked)
 
 
-def value_and_grad(func):
-    logging.warning(
-        "NumPy does not support autograd, 'value_and_grad' "
-        "has no effect on the array, as gradients are not supported in the first place."
+def _watch(tape, xs):
+    """Start recording the float arrays of `xs`, returning the tracked nest."""
+    return ivy.nested_map(
+        xs,
+        lambda x: tape.watch(x) if ivy.is_array(x) and ivy.is_float_dtype(x) else x,
+        include_derived=True,
+        shallow=False,
     )
 
-    def grad_fn(xs):
-        grads = ivy.nested_map(
-            xs, lambda x: ivy.zeros_like(x), include_derived=True, shallow=False
-        )
-        y = func(xs)
-        y = ivy.to_ivy(y)
-        return y, grads
 
-    return grad_fn
+def _untrack(x):
+    return ivy.nested_map(
+        x,
+        lambda x: ivy.to_ivy(ivy.to_native(x).val) if _is_tracked(x) else x,
+        include_derived=True,
+        shallow=False,
+    )
 
 
-def jac(func):
-    logging.warning(
-        "NumPy does not support autograd, 'jac' "
-        "has no effect on the array, as gradients are not supported in the first place."
+def _set_tracked(xs, values):
+    """Replace the tracked arrays of the nest `xs` with `values`, in order."""
+    if _is_tracked(xs):
+        return values[0]
+    idxs = ivy.nested_argwhere(xs, _is_tracked)
+    ret = ivy.nested_map(
+        xs, lambda x: x, include_derived=True, to_mutable=True, shallow=False
     )
+    ivy.set_nest_at_indices(ret, idxs, values)
+    return ret
 
-    def grad_fn(xs):
-        jacobian = ivy.nested_map(
-            xs, lambda x: ivy.zeros_like(x), include_derived=True, shallow=False
-        )
-        return jacobian
 
-    return grad_fn
+def _gradients(tape, y, xs, cotangent=None):
+    """Back-propagate through the tracked output `y` to the tracked arrays of `xs`."""
+    inputs = (
+        [xs]
+        if _is_tracked(xs)
+        else ivy.multi_index_nest(xs, ivy.nested_argwhere(xs, _is_tracked))
+    )
+    y = ivy.to_native(y)
+    if cotangent is None:
+        cotangent = np.ones_like(y.val)
+    inputs = [ivy.to_native(x) for x in inputs]
+    return [ivy.to_ivy(g) for g in tape.gradients([y], [cotangent], inputs)]
+
+
+def _zeros(xs):
+    return ivy.nested_map(
+        xs,
+        lambda x: ivy.zeros_like(ivy.to_native(x).val) if _is_tracked(x) else x,
+        include_derived=True,
+        shallow=False,
+    )
 
 
-def grad(func, argnums=0):
-    logging.warning(
-        "NumPy does not support autograd, 'grad' "
-        "has no effect on the array, as gradients are not supported in the first place."
-    )
+def _forward(func, xs, x, duplicate_index_chains, xs_grad_idxs):
+    """Set the tracked variables `x` into `xs` and run the function on them."""
+    x_arr_idxs = ivy.nested_argwhere(x, _is_tracked)
+    x_arr_values = [x] if _is_tracked(x) else ivy.multi_index_nest(x, x_arr_idxs)
+    if xs_grad_idxs is not None:
+        xs_grad_arr_idxs = []
+        for grad_idx in xs_grad_idxs:
+            xs_grad_arr_idx = ivy.nested_argwhere(
+                ivy.index_nest(xs, grad_idx), ivy.is_array
+            )
+            for idx in xs_grad_arr_idx:
+                xs_grad_arr_idxs.append(grad_idx + idx)
+        ivy.set_nest_at_indices(xs, xs_grad_arr_idxs, x_arr_values)
+    elif ivy.is_array(xs):
+        xs = x
+    else:
+        xs_arr_idxs = ivy.nested_argwhere(xs, ivy.is_array)
+        ivy.set_nest_at_indices(xs, xs_arr_idxs, x_arr_values)
+
+    # Setting duplicates to ensure same references as in the original input
+    if not _is_tracked(xs):
+        xs = _set_duplicates(xs, duplicate_index_chains)
+    return func(xs)
 
-    def grad_fn(xs):
-        grad = ivy.nested_map(
-            xs, lambda x: ivy.zeros_like(x), include_derived=True, shallow=False
+
+def execute_with_gradients(
+    func,
+    xs,
+    /,
+    *,
+    retain_grads: bool = False,
+    xs_grad_idxs: Optional[Sequence[Sequence[Union[str, int]]]] = None,
+    ret_grad_idxs: Optional[Sequence[Sequence[Union[str, int]]]] = None,
+):
+    # Conversion of required arrays to float variables and duplicate index chains
+    (
+        xs,
+        xs_required,
+        required_duplicate_index_chains,
+        duplicate_index_chains,
+    ) = _get_required_float_variables(xs, xs_grad_idxs)
+
+    tape = _Tape()
+    x = _watch(tape, xs_required)
+    func_ret = _forward(func, xs, x, duplicate_index_chains, xs_grad_idxs)
+
+    # Getting the relevant outputs from the function return for gradient calculation
+    if _is_tracked(func_ret):
+        ys, ret_idxs = [func_ret], None
+    else:
+        ret_idxs = ivy.nested_argwhere(func_ret, _is_tracked)
+        if ret_grad_idxs is not None:
+            ret_idxs = [
+                idx
+                for idx in ret_idxs
+                if "_".join(str(i) for i in idx) in _idxs_to_str(ret_grad_idxs)
+            ]
+        ys = ivy.multi_index_nest(func_ret, ret_idxs)
+        if len(ys) == 1 and ret_grad_idxs is None:
+            ret_idxs = None
+
+    grads = [
+        _set_duplicates(
+            _set_tracked(x, _gradients(tape, y, x)), required_duplicate_index_chains
         )
-        y = func(xs)
-        y = ivy.to_ivy(y)
-        return grad
+        for y in ys
+    ]
+    if ret_idxs is None:
+        grads = grads[0] if grads else _zeros(x)
+    else:
+        grads = dict(zip(_idxs_to_str(ret_idxs), grads))
 
-    return grad_fn
+    return _process_func_ret_and_grads(_untrack(func_ret), grads, retain_grads)
 
 
-def stop_gradient(x, /, *, preserve_type=True, out=None):
-    logging.warning(
-        "NumPy does not support autograd, 'stop_gradient' "
-        "has no effect on the array, as gradients are not supported in the first place."
-    )
+def value_and_grad(func):
+    def callback_fn(xs):
+        tape = _Tape()
+        x = _watch(tape, ivy.nested_map(xs, ivy.to_ivy, include_derived=True))
+        y = func(x)
+        grads = _set_tracked(x, _gradients(tape, y, x)) if _is_tracked(y) else _zeros(x)
+        return _untrack(y), grads
+
+    return callback_fn
+
+
+def stop_gradient(
+    x: np.ndarray,
+    /,
+    *,
+    preserve_type: bool = True,
+    out: Optional[np.ndarray] = None,
+) -> np.ndarray:
     return x
+
+
+def jac(func: Callable):
+    def callback_fn(xs):
+        tape = _Tape()
+        x = _watch(tape, ivy.nested_map(xs, ivy.to_ivy, include_derived=True))
+        ys = func(x)
+
+        def jacobian(y):
+            if not _is_tracked(y):
+                return _zeros(x)
+            y = ivy.to_native(y)
+            # one reverse pass per output element, seeded with its basis vector
+            rows = []
+            for i in range(y.val.size):
+                cotangent = np.zeros(y.val.size, dtype=y.val.dtype)
+                cotangent[i] = 1
+                rows.append(_gradients(tape, y, x, cotangent.reshape(y.val.shape)))
+            return _set_tracked(
+                x,
+                [
+                    ivy.reshape(ivy.stack(g), y.val.shape + tuple(g[0].shape))
+                    for g in zip(*rows)
+                ],
+            )
+
+        if _is_tracked(ys):
+            return jacobian(ys)
+        return ivy.nested_map(ys, jacobian, include_derived=True, shallow=False)
+
+    return callback_fn
+
+
+def grad(func: Callable, argnums: Union[int, Tuple[int]] = 0):
+    grad_fn = value_and_grad(func)
+    return lambda xs: grad_fn(xs)[1]
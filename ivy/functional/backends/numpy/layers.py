@@ -10,7 +10,6 @@ import ivy
 from ivy.functional.ivy.layers import (
     _handle_padding,
     _deconv_length,
-    _get_x_data_format,
 )
 
 
@@ -23,13 +22,20 @@ def _add_dilations(x, dilations, axis, values=0):
     )
 
 
-def _dilate_pad_conv(x, filters, strides, padding, dims, dilations):
-    for j in range(dims):
-        if dilations[j] > 1:
-            filters = _add_dilations(filters, dilations[j], axis=j)
+# maximum number of output positions lowered to a single matmul by the convolution
+# engine, bounding the size of the im2col buffer; None lowers all positions at once
+conv_tile_size = None
+
+
+def _conv_pad_list(x_shape, filter_shape, strides, padding, dims, dilations):
     if isinstance(padding, str):
         pad_specific = [
-            _handle_padding(x.shape[1 + i], strides[i], filters.shape[i], padding)
+            _handle_padding(
+                x_shape[1 + i],
+                strides[i],
+                (filter_shape[i] - 1) * dilations[i] + 1,
+                padding,
+            )
             for i in range(dims)
         ]
         pad_list = [
@@ -40,7 +46,11 @@ def _dilate_pad_conv(x, filters, strides, padding, dims, dilations):
         pad_list = [(padding, padding)] * dims
     else:
         pad_list = [(_p, _p) if isinstance(_p, int) else _p for _p in padding]
+    return pad_list
 
+
+def _pad_conv(x, filter_shape, strides, padding, dims, dilations):
+    pad_list = _conv_pad_list(x.shape, filter_shape, strides, padding, dims, dilations)
     pad_width = [(0, 0), *pad_list, (0, 0)]
 
     x = np.pad(
@@ -48,7 +58,77 @@ def _dilate_pad_conv(x, filters, strides, padding, dims, dilations):
         pad_width=pad_width,
         mode="constant",
     )
-    return x, filters
+    return x
+
+
+def _conv_tiles(batch, out_shape):
+    # yields (batch slice, first output axis slice) pairs covering the output,
+    # each holding at most conv_tile_size output positions where possible
+    rows_per_item = int(np.prod(out_shape))
+    rows_per_line = int(np.prod(out_shape[1:]))
+    tile_size = conv_tile_size
+    if tile_size is None or batch * rows_per_item <= tile_size:
+        batch_step, line_step = batch, out_shape[0]
+    elif rows_per_item <= tile_size:
+        batch_step, line_step = tile_size // rows_per_item, out_shape[0]
+    else:
+        batch_step, line_step = 1, tile_size // max(rows_per_line, 1)
+    batch_step, line_step = max(batch_step, 1), max(line_step, 1)
+    for b in range(0, batch, batch_step):
+        for o in range(0, out_shape[0], line_step):
+            yield slice(b, b + batch_step), slice(o, o + line_step)
+
+
+def _conv_im2col(x, filters, strides, dims, dilations, feature_group_count=1):
+    """
+    Valid convolution of a padded, channel-last input with filters of shape
+    [*K, I // feature_group_count, O].
+
+    The input is viewed as B x O... x K... x G x I/G patches through
+    ``as_strided`` (with the dilations folded into the kernel strides), and each
+    tile of patches is contracted against the filters with a single matmul batched
+    over the groups.
+    """
+    groups = feature_group_count
+    kernel_shape = list(filters.shape[:dims])
+    group_in_dim = filters.shape[-2]
+    group_out_dim = filters.shape[-1] // groups
+    batch = x.shape[0]
+    out_shape = [
+        (x.shape[i + 1] - (kernel_shape[i] - 1) * dilations[i] - 1) // strides[i] + 1
+        for i in range(dims)
+    ]
+    # B x O... x K... x G x I/G
+    patches = np.lib.stride_tricks.as_strided(
+        x,
+        [batch, *out_shape, *kernel_shape, groups, group_in_dim],
+        (
+            x.strides[0],
+            *[x.strides[i + 1] * strides[i] for i in range(dims)],
+            *[x.strides[i + 1] * dilations[i] for i in range(dims)],
+            x.strides[-1] * group_in_dim,
+            x.strides[-1],
+        ),
+        writeable=False,
+    )
+    # G x (K... x I/G) x O/G
+    filters = np.moveaxis(
+        filters.reshape([*kernel_shape, group_in_dim, groups, group_out_dim]), -2, 0
+    ).reshape([groups, -1, group_out_dim])
+    # B x O... x G x O/G
+    res = np.empty(
+        [batch, *out_shape, groups, group_out_dim],
+        dtype=np.result_type(x.dtype, filters.dtype),
+    )
+    for batch_slice, line_slice in _conv_tiles(batch, out_shape):
+        tile = patches[batch_slice, line_slice]
+        # G x (B x O...) x (K... x I/G)
+        cols = np.moveaxis(tile, -2, 0).reshape([groups, -1, filters.shape[1]])
+        res[batch_slice, line_slice] = np.moveaxis(
+            np.matmul(cols, filters), 0, -2
+        ).reshape([*tile.shape[: dims + 1], groups, group_out_dim])
+    # B x O... x O
+    return res.reshape([batch, *out_shape, groups * group_out_dim])
 
 
 def _dilate_pad_conv_tranpose(
@@ -117,34 +197,8 @@ def conv1d(
     if data_format == "NCW":
         x = np.transpose(x, (0, 2, 1))
 
-    x, filters = _dilate_pad_conv(x, filters, strides, padding, 1, dilations)
-
-    x_shape = x.shape
-    filter_shape = list(filters.shape[0:1])
-    input_dim = filters.shape[-2]
-    output_dim = filters.shape[-1]
-    new_w = (x_shape[1] - filter_shape[0]) // strides[0] + 1
-    new_shape = [x_shape[0], new_w] + filter_shape + [x_shape[-1]]
-    new_strides = (
-        x.strides[0],
-        x.strides[1] * strides[0],
-        x.strides[1],
-        x.strides[2],
-    )
-    # B x OW x KW x I
-    sub_matrices = np.lib.stride_tricks.as_strided(
-        x, new_shape, new_strides, writeable=False
-    )
-    # B x OW x KW x I x O
-    sub_matrices_w_output_dim = np.tile(
-        np.expand_dims(sub_matrices, -1), [1] * 4 + [output_dim]
-    )
-    # B x OW x KW x I x O
-    mult = sub_matrices_w_output_dim * filters.reshape(
-        [1] * 2 + filter_shape + [input_dim, output_dim]
-    )
-    # B x OW x O
-    res = np.sum(mult, (2, 3))
+    x = _pad_conv(x, filters.shape[:1], strides, padding, 1, dilations)
+    res = _conv_im2col(x, filters, strides, 1, dilations)
 
     if data_format == "NCW":
         res = np.transpose(res, (0, 2, 1))
@@ -194,37 +248,8 @@ def conv2d(
     if data_format == "NCHW":
         x = np.transpose(x, (0, 2, 3, 1))
 
-    x, filters = _dilate_pad_conv(x, filters, strides, padding, 2, dilations)
-
-    x_shape = x.shape
-    filter_shape = list(filters.shape[0:2])
-    input_dim = filters.shape[-2]
-    output_dim = filters.shape[-1]
-    new_h = (x_shape[1] - filter_shape[0]) // strides[0] + 1
-    new_w = (x_shape[2] - filter_shape[1]) // strides[1] + 1
-    new_shape = [x_shape[0], new_h, new_w] + filter_shape + [x_shape[-1]]
-    new_strides = (
-        x.strides[0],
-        x.strides[1] * strides[0],
-        x.strides[2] * strides[1],
-        x.strides[1],
-        x.strides[2],
-        x.strides[3],
-    )
-    # B x OH x OW x KH x KW x I
-    sub_matrices = np.lib.stride_tricks.as_strided(
-        x, new_shape, new_strides, writeable=False
-    )
-    # B x OH x OW x KH x KW x I x O
-    sub_matrices_w_output_dim = np.tile(
-        np.expand_dims(sub_matrices, -1), [1] * 6 + [output_dim]
-    )
-    # B x OH x OW x KH x KW x I x O
-    mult = sub_matrices_w_output_dim * filters.reshape(
-        [1] * 3 + filter_shape + [input_dim, output_dim]
-    )
-    # B x OH x OW x O
-    res = np.sum(mult, (3, 4, 5))
+    x = _pad_conv(x, filters.shape[:2], strides, padding, 2, dilations)
+    res = _conv_im2col(x, filters, strides, 2, dilations)
 
     if data_format == "NCHW":
         return np.transpose(res, (0, 3, 1, 2))
@@ -271,47 +296,16 @@ def depthwise_conv2d(
 ):
     strides = [strides] * 2 if isinstance(strides, int) else strides
     dilations = [dilations] * 2 if isinstance(dilations, int) else dilations
-    if isinstance(padding, int):
-        padding = [(padding, padding)] * 2
-    if data_format == "NHWC":
-        x = np.transpose(x, (3, 0, 1, 2))
-    else:
-        x = np.transpose(x, (1, 0, 2, 3))
+    if data_format == "NCHW":
+        x = np.transpose(x, (0, 2, 3, 1))
     filters = np.squeeze(filters, 3) if filters.ndim == 4 else filters
-    filters = np.transpose(filters, (2, 0, 1))
-    filters = np.expand_dims(filters, (-1, -2))
-    filter_h = filters.shape[1] + (filters.shape[1] - 1) * (dilations[0] - 1)
-    filter_w = filters.shape[2] + (filters.shape[2] - 1) * (dilations[1] - 1)
-    if isinstance(padding, str):
-        if padding == "VALID":
-            out_height = np.ceil(float(x.shape[2] - filter_h + 1) / float(strides[0]))
-            out_width = np.ceil(float(x.shape[3] - filter_w + 1) / float(strides[1]))
-        else:
-            out_height = np.ceil(float(x.shape[2]) / float(strides[0]))
-            out_width = np.ceil(float(x.shape[3]) / float(strides[1]))
-    else:
-        out_height = np.ceil(
-            float(x.shape[2] - filter_h + padding[0][0] + padding[0][1] + 1)
-            / float(strides[0])
-        )
-        out_width = np.ceil(
-            float(x.shape[3] - filter_w + padding[1][0] + padding[1][1] + 1)
-            / float(strides[1])
-        )
-    if data_format == "NHWC":
-        outputs = np.empty([x.shape[1], int(out_height), int(out_width), 0], x.dtype)
-    else:
-        outputs = np.empty([x.shape[1], 0, int(out_height), int(out_width)], x.dtype)
-    x = np.expand_dims(x, -1)
-    for i in range(x.shape[0]):
-        output = conv2d(
-            x[i], filters[i], strides, padding, data_format="NHWC", dilations=dilations
-        )
-        if data_format == "NHWC":
-            outputs = np.append(outputs, output, axis=-1)
-        else:
-            outputs = np.append(outputs, np.transpose(output, (0, 3, 1, 2)), axis=1)
-    return outputs
+    # KH x KW x 1 x C, one group per channel
+    filters = np.expand_dims(filters, -2)
+    x = _pad_conv(x, filters.shape[:2], strides, padding, 2, dilations)
+    res = _conv_im2col(x, filters, strides, 2, dilations, x.shape[-1])
+    if data_format == "NCHW":
+        return np.transpose(res, (0, 3, 1, 2))
+    return res
 
 
 def conv3d(
@@ -330,40 +324,8 @@ def conv3d(
     if data_format == "NCDHW":
         x = np.transpose(x, (0, 2, 3, 4, 1))
 
-    x, filters = _dilate_pad_conv(x, filters, strides, padding, 3, dilations)
-
-    x_shape = x.shape
-    filter_shape = list(filters.shape[0:3])
-    input_dim = filters.shape[-2]
-    output_dim = filters.shape[-1]
-    new_d = (x_shape[1] - filter_shape[0]) // strides[0] + 1
-    new_h = (x_shape[2] - filter_shape[1]) // strides[1] + 1
-    new_w = (x_shape[3] - filter_shape[2]) // strides[2] + 1
-    new_shape = [x_shape[0], new_d, new_h, new_w] + filter_shape + [x_shape[-1]]
-    new_strides = (
-        x.strides[0],
-        x.strides[1] * strides[0],
-        x.strides[2] * strides[1],
-        x.strides[3] * strides[2],
-        x.strides[1],
-        x.strides[2],
-        x.strides[3],
-        x.strides[4],
-    )
-    # B x OD X OH x OW x KD X KH x KW x I
-    sub_matrices = np.lib.stride_tricks.as_strided(
-        x, new_shape, new_strides, writeable=False
-    )
-    # B x OD X OH x OW x KD X KH x KW x I x O
-    sub_matrices_w_output_dim = np.tile(
-        np.expand_dims(sub_matrices, -1), [1] * 8 + [output_dim]
-    )
-    # B x OD X OH x OW x KD X KH x KW x I x O
-    mult = sub_matrices_w_output_dim * filters.reshape(
-        [1] * 4 + filter_shape + [input_dim, output_dim]
-    )
-    # B x OD X OH x OW x O
-    res = np.sum(mult, (4, 5, 6, 7))
+    x = _pad_conv(x, filters.shape[:3], strides, padding, 3, dilations)
+    res = _conv_im2col(x, filters, strides, 3, dilations)
 
     if data_format == "NCDHW":
         return np.transpose(res, (0, 4, 1, 2, 3))
@@ -426,48 +388,8 @@ def conv_general_dilated(
     for j in range(dims):
         if x_dilations[j] > 1:
             x = _add_dilations(x, x_dilations[j], axis=j + 1)
-    x, filters = _dilate_pad_conv(x, filters, strides, padding, dims, dilations)
-
-    x_shape = x.shape
-    filter_shape = list(filters.shape[0:dims])
-    input_dim = filters.shape[-2]
-    output_dim = filters.shape[-1]
-    new_shape = [
-        (x_shape[i + 1] - filter_shape[i]) // strides[i] + 1 for i in range(dims)
-    ]
-    res = []
-    new_shape = [x_shape[0], *new_shape] + filter_shape + [input_dim]
-    for i, j in zip(
-        range(0, x.shape[-1], input_dim),
-        range(0, output_dim, output_dim // feature_group_count),
-    ):
-        sliced_x = x[..., i : i + input_dim]
-        sliced_filters = filters[..., j : j + output_dim // feature_group_count]
-        normal_strides = [sliced_x.strides[i] for i in range(1, dims + 2)]
-        changed_strides = [
-            sliced_x.strides[i] * strides[i - 1] for i in range(1, dims + 1)
-        ]
-        new_strides = (x.strides[0], *changed_strides, *normal_strides)
-        # B x OH x OW x KH x KW x I
-        sub_matrices = np.lib.stride_tricks.as_strided(
-            sliced_x, new_shape, new_strides, writeable=False
-        )
-
-        # B x OH x OW x KH x KW x I x O
-        sub_matrices_w_output_dim = np.tile(
-            np.expand_dims(sub_matrices, -1),
-            [1] * (dims * 2 + 2) + [output_dim // feature_group_count],
-        )
-        # B x OH x OW x KH x KW x I x O
-        mult = sub_matrices_w_output_dim * sliced_filters.reshape(
-            [1] * (dims + 1)
-            + filter_shape
-            + [input_dim, output_dim // feature_group_count]
-        )
-
-        # B x OH x OW x O
-        res.append(np.sum(mult, tuple([i for i in range(dims + 1, dims * 2 + 2)])))
-    res = np.concatenate(res, axis=-1)
+    x = _pad_conv(x, filters.shape[:dims], strides, padding, dims, dilations)
+    res = _conv_im2col(x, filters, strides, dims, dilations, feature_group_count)
     res = np.add(res, bias) if bias is not None else res
 
     if data_format == "channel_first":
@@ -498,28 +420,92 @@ def conv_general_transpose(
     )
 
     x = np.flip(x, (*range(1, dims + 1),))
-    res = np.concatenate(
-        [
-            np.flip(
-                conv_general_dilated(
-                    x[..., j : j + filters.shape[-2] // feature_group_count],
-                    filters[..., j : j + filters.shape[-2] // feature_group_count, :],
-                    1,
-                    "VALID",
-                    dims=dims,
-                    data_format=_get_x_data_format(dims, "channel_last"),
-                    dilations=1,
-                ),
-                (*range(1, dims + 1),),
-            )
-            for j in range(
-                0, filters.shape[-2], filters.shape[-2] // feature_group_count
-            )
-        ],
-        axis=-1,
+    # K... x I x O -> K... x I/G x (G x O), so that each group of input channels
+    # produces its own block of output channels
+    group_in_dim = filters.shape[-2] // feature_group_count
+    filters = np.moveaxis(
+        filters.reshape(
+            [*filters.shape[:dims], feature_group_count, group_in_dim, -1]
+        ),
+        -3,
+        -2,
+    ).reshape([*filters.shape[:dims], group_in_dim, -1])
+    res = np.flip(
+        conv_general_dilated(
+            x,
+            filters,
+            1,
+            "VALID",
+            dims=dims,
+            feature_group_count=feature_group_count,
+            dilations=1,
+        ),
+        (*range(1, dims + 1),),
     )
     res = np.add(res, bias) if bias is not None else res
 
     if data_format == "channel_first":
         return np.transpose(res, (0, dims + 1, *range(1, dims + 1)))
     return res
+
+
+def _sigmoid_(x):
+    # sigmoid(x) = (tanh(x / 2) + 1) / 2, computed in place
+    np.multiply(x, 0.5, out=x)
+    np.tanh(x, out=x)
+    np.add(x, 1, out=x)
+    np.multiply(x, 0.5, out=x)
+
+
+def lstm_update(
+    x: np.ndarray,
+    init_h: np.ndarray,
+    init_c: np.ndarray,
+    kernel: np.ndarray,
+    recurrent_kernel: np.ndarray,
+    /,
+    *,
+    bias: Optional[np.ndarray] = None,
+    recurrent_bias: Optional[np.ndarray] = None,
+) -> Tuple[np.ndarray, np.ndarray]:
+    dtype = np.result_type(x, init_h, init_c, kernel, recurrent_kernel)
+    if not np.issubdtype(dtype, np.inexact):
+        dtype = ivy.default_float_dtype(as_native=True)
+    *batch_shape, timesteps, input_channels = x.shape
+    hidden = recurrent_kernel.shape[0]
+
+    # input projections of all the timesteps, time major so each step is contiguous
+    Wi_x = np.matmul(
+        np.swapaxes(x.reshape((-1, timesteps, input_channels)), 0, 1), kernel
+    ).astype(dtype, copy=False)
+    if bias is not None:
+        Wi_x += bias
+    if recurrent_bias is not None:
+        Wi_x += recurrent_bias
+
+    # the output sequence is preallocated and each hidden state is written into it
+    hts = np.empty((timesteps, Wi_x.shape[1], hidden), dtype=dtype)
+    ht = np.broadcast_to(init_h, batch_shape + [hidden]).reshape(hts.shape[1:])
+    ct = np.broadcast_to(init_c, batch_shape + [hidden]).reshape(hts.shape[1:])
+    ct = ct.astype(dtype)
+    gates = np.empty(Wi_x.shape[1:], dtype=dtype)
+    ig = np.empty_like(ct)
+    i, f, g, o = (slice(k * hidden, (k + 1) * hidden) for k in range(4))
+    for t in range(timesteps):
+        np.matmul(ht, recurrent_kernel, out=gates, casting="unsafe")
+        gates += Wi_x[t]
+        _sigmoid_(gates[:, i])
+        _sigmoid_(gates[:, f])
+        np.tanh(gates[:, g], out=gates[:, g])
+        _sigmoid_(gates[:, o])
+        ct *= gates[:, f]
+        np.multiply(gates[:, i], gates[:, g], out=ig)
+        ct += ig
+        ht = hts[t]
+        np.tanh(ct, out=ht)
+        ht *= gates[:, o]
+
+    return (
+        np.swapaxes(hts, 0, 1).reshape(batch_shape + [timesteps, hidden]),
+        ct.reshape(batch_shape + [hidden]),
+    )
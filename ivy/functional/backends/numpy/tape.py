@@ -0,0 +1,885 @@
+"""Reverse-mode differentiation tape used by the numpy backend's gradients."""
+
+# global
+import inspect
+import math
+import numpy as np
+
+# local
+import ivy
+from ivy.functional.backends.numpy.layers import _conv_pad_list
+
+
+# functions differentiated by recording a vector-jacobian product on the tape. A rule
+# is called as rule(g, ans, keys, *args, **kwargs) with the cotangent `g` of the
+# output `ans` and the raw inputs, and returns the cotangents of the inputs in
+# `keys` (positional indices, (index, position) pairs for the arrays in sequence
+# arguments and names for keyword arguments)
+vjp_rules = dict()
+
+# functions differentiated by expressing them in terms of other ivy functions. A rule
+# is called as rule(func, *args, **kwargs) with the tracked inputs
+composite_rules = dict()
+
+# functions with floating point outputs which are nevertheless constant with respect
+# to their inputs
+non_differentiable = {
+    "ceil",
+    "empty_like",
+    "floor",
+    "full_like",
+    "ones_like",
+    "round",
+    "sign",
+    "stop_gradient",
+    "to_list",
+    "to_numpy",
+    "to_scalar",
+    "trunc",
+    "zeros_like",
+}
+
+
+class _Tape:
+    """
+    The operations recorded while a differentiated function runs.
+
+    Each node holds the tracked inputs of one operation together with its
+    vector-jacobian product, and the nodes are stored in the order they were
+    executed, which is a topological order of the graph.
+    """
+
+    __slots__ = ("nodes",)
+
+    def __init__(self):
+        self.nodes = []
+
+    def watch(self, x):
+        return self.record(np.asarray(ivy.to_native(x)), None, None)
+
+    def record(self, val, parents, vjp):
+        self.nodes.append((parents, vjp))
+        return _Tracked(val, self, len(self.nodes) - 1)
+
+    def gradients(self, outputs, cotangents, inputs):
+        """Back-propagate the cotangents of `outputs` to the watched `inputs`."""
+        grads = dict()
+        for y, g in zip(outputs, cotangents):
+            _accumulate(grads, y, g)
+        for index in range(max((y.index for y in outputs), default=-1), -1, -1):
+            parents, vjp = self.nodes[index]
+            if vjp is None or index not in grads:
+                continue
+            for key, g in vjp(grads.pop(index)).items():
+                _accumulate(grads, parents[key], g)
+        return [
+            grads[x.index] if x.index in grads else np.zeros_like(x.val) for x in inputs
+        ]
+
+
+def _unbroadcast(g, shape):
+    # sums the cotangent of a broadcast result back to the shape of the input
+    if g.ndim > len(shape):
+        g = np.sum(g, axis=tuple(range(g.ndim - len(shape))))
+    axes = tuple(i for i, (s, d) in enumerate(zip(shape, g.shape)) if s == 1 and d != 1)
+    if axes:
+        g = np.sum(g, axis=axes, keepdims=True)
+    return np.reshape(g, shape)
+
+
+def _accumulate(grads, x, g):
+    if not np.issubdtype(x.val.dtype, np.inexact):
+        return
+    g = np.asarray(g)
+    if g.shape != x.val.shape:
+        g = _unbroadcast(g, x.val.shape)
+    g = g.astype(x.val.dtype, copy=False)
+    grads[x.index] = grads[x.index] + g if x.index in grads else g
+
+
+def _unwrap(x):
+    return x.data if isinstance(x, ivy.Array) else x
+
+
+def _raw(x):
+    x = _unwrap(x)
+    if isinstance(x, _Tracked):
+        return x.val
+    if isinstance(x, list):
+        return [_raw(v) for v in x]
+    if isinstance(x, tuple):
+        return tuple(_raw(v) for v in x)
+    if isinstance(x, dict):
+        return {k: _raw(v) for k, v in x.items()}
+    return x
+
+
+def _parents(args, kwargs):
+    parents = dict()
+    for i, arg in enumerate(args):
+        if isinstance(arg, (list, tuple)):
+            for j, v in enumerate(arg):
+                if isinstance(_unwrap(v), _Tracked):
+                    parents[(i, j)] = _unwrap(v)
+        elif isinstance(_unwrap(arg), _Tracked):
+            parents[i] = _unwrap(arg)
+    for k, v in kwargs.items():
+        if isinstance(_unwrap(v), _Tracked):
+            parents[k] = _unwrap(v)
+    return parents
+
+
+def _has_float_arrays(x):
+    if isinstance(x, (list, tuple)):
+        return any(_has_float_arrays(v) for v in x)
+    if isinstance(x, dict):
+        return any(_has_float_arrays(v) for v in x.values())
+    if isinstance(x, (np.ndarray, np.generic, ivy.Array)):
+        return np.issubdtype(x.dtype, np.inexact)
+    return False
+
+
+def _apply(fn, rule, args, kwargs):
+    """Run `fn` on the raw inputs and record the vjp `rule` of its output."""
+    parents = _parents(args, kwargs)
+    args = _raw(args)
+    kwargs = {k: _raw(v) for k, v in kwargs.items() if k != "out"}
+    ans = np.asarray(ivy.to_native(fn(*args, **kwargs)))
+    if not parents or not np.issubdtype(ans.dtype, np.inexact):
+        return ans
+    tape = next(iter(parents.values())).tape
+    keys = parents.keys()
+    return tape.record(ans, parents, lambda g: rule(g, ans, keys, *args, **kwargs))
+
+
+class _Tracked:
+    """
+    An array whose operations are recorded on a tape.
+
+    Ivy functions called on the tracked array are intercepted through
+    ``__ivy_array_function__``: they are executed on the wrapped native array `val`
+    and, unless constant, recorded on `tape` with the rule found in ``vjp_rules`` or
+    ``composite_rules``. Compositional ivy functions without a rule are differentiated
+    by running their body on the tracked arrays.
+    """
+
+    __slots__ = ("val", "tape", "index")
+
+    # let numpy defer binary operators to the reflected tracked methods
+    __array_ufunc__ = None
+
+    def __init__(self, val, tape, index):
+        self.val = val
+        self.tape = tape
+        self.index = index
+
+    def __ivy_array_function__(self, func, types, args, kwargs):
+        name = func.__name__
+        if kwargs.get("out", None) is not None:
+            raise ivy.utils.exceptions.IvyNotImplementedException(
+                "differentiated functions cannot write to out arguments"
+            )
+        if any(p.tape is not self.tape for p in _parents(args, kwargs).values()):
+            raise ivy.utils.exceptions.IvyNotImplementedException(
+                "higher order gradients are not supported by the numpy backend"
+            )
+        if name in composite_rules:
+            return composite_rules[name](func, *args, **kwargs)
+        if name in vjp_rules:
+            return _apply(func, vjp_rules[name], args, kwargs)
+        fn = inspect.unwrap(func)
+        if fn.__module__.startswith("ivy.functional.ivy"):
+            return fn(*args, **kwargs)
+        ret = func(*_raw(args), **_raw(kwargs))
+        if name in non_differentiable or not _has_float_arrays(ret):
+            return ret
+        raise ivy.utils.exceptions.IvyNotImplementedException(
+            "there is no gradient rule for ivy.{} in the numpy backend".format(name)
+        )
+
+    def __repr__(self):
+        return "Tracked({})".format(self.val)
+
+    @property
+    def shape(self):
+        return self.val.shape
+
+    @property
+    def ndim(self):
+        return self.val.ndim
+
+    @property
+    def dtype(self):
+        return self.val.dtype
+
+    @property
+    def size(self):
+        return self.val.size
+
+    @property
+    def T(self):
+        return ivy.permute_dims(self, tuple(reversed(range(self.ndim))))
+
+    def override_dtype_check(self):
+        return ivy.as_ivy_dtype(self.val.dtype)
+
+    def astype(self, dtype, /, *, copy=True):
+        return ivy.astype(self, dtype, copy=copy)
+
+    def __len__(self):
+        return len(self.val)
+
+    def __array__(self, *args, **kwargs):
+        raise ivy.utils.exceptions.IvyNotImplementedException(
+            "differentiated values cannot be converted to arrays"
+        )
+
+    def __bool__(self):
+        return bool(self.val)
+
+    def __float__(self):
+        return float(self.val)
+
+    def __int__(self):
+        return int(self.val)
+
+    def __getitem__(self, query):
+        return _apply(lambda x, query: x[query], _getitem_vjp, (self, _raw(query)), {})
+
+    def __setitem__(self, query, value):
+        raise ivy.utils.exceptions.IvyNotImplementedException(
+            "differentiated values cannot be updated inplace"
+        )
+
+    def __add__(self, other):
+        return ivy.add(self, other)
+
+    def __radd__(self, other):
+        return ivy.add(other, self)
+
+    def __sub__(self, other):
+        return ivy.subtract(self, other)
+
+    def __rsub__(self, other):
+        return ivy.subtract(other, self)
+
+    def __mul__(self, other):
+        return ivy.multiply(self, other)
+
+    def __rmul__(self, other):
+        return ivy.multiply(other, self)
+
+    def __truediv__(self, other):
+        return ivy.divide(self, other)
+
+    def __rtruediv__(self, other):
+        return ivy.divide(other, self)
+
+    def __floordiv__(self, other):
+        return ivy.floor_divide(self, other)
+
+    def __rfloordiv__(self, other):
+        return ivy.floor_divide(other, self)
+
+    def __pow__(self, other):
+        return ivy.pow(self, other)
+
+    def __rpow__(self, other):
+        return ivy.pow(other, self)
+
+    def __matmul__(self, other):
+        return ivy.matmul(self, other)
+
+    def __rmatmul__(self, other):
+        return ivy.matmul(other, self)
+
+    def __neg__(self):
+        return ivy.negative(self)
+
+    def __pos__(self):
+        return ivy.positive(self)
+
+    def __abs__(self):
+        return ivy.abs(self)
+
+    def __eq__(self, other):
+        return ivy.equal(self, other)
+
+    def __ne__(self, other):
+        return ivy.not_equal(self, other)
+
+    def __lt__(self, other):
+        return ivy.less(self, other)
+
+    def __le__(self, other):
+        return ivy.less_equal(self, other)
+
+    def __gt__(self, other):
+        return ivy.greater(self, other)
+
+    def __ge__(self, other):
+        return ivy.greater_equal(self, other)
+
+
+def _getitem_vjp(g, ans, keys, x, query):
+    dx = np.zeros_like(x)
+    basic = query if isinstance(query, tuple) else (query,)
+    if all(
+        q is None or q is Ellipsis or isinstance(q, (slice, int, np.integer))
+        for q in basic
+    ):
+        dx[query] = g
+    else:
+        np.add.at(dx, query, g)
+    return {0: dx}
+
+
+# Elementwise #
+# ------------ #
+
+
+def _def_elementwise(name, *derivatives):
+    # derivatives[i](g, ans, *args, **kwargs) is the cotangent of the i-th input
+    def rule(g, ans, keys, *args, **kwargs):
+        return {
+            i: derivative(g, ans, *args, **kwargs)
+            for i, derivative in enumerate(derivatives)
+            if i in keys and derivative is not None
+        }
+
+    vjp_rules[name] = rule
+
+
+_def_elementwise("negative", lambda g, ans, x: -g)
+_def_elementwise("positive", lambda g, ans, x: g)
+_def_elementwise("abs", lambda g, ans, x, **kw: g * np.sign(x))
+_def_elementwise("exp", lambda g, ans, x: g * ans)
+_def_elementwise("expm1", lambda g, ans, x: g * (ans + 1))
+_def_elementwise("log", lambda g, ans, x: g / x)
+_def_elementwise("log1p", lambda g, ans, x: g / (1 + x))
+_def_elementwise("log2", lambda g, ans, x: g / (x * math.log(2)))
+_def_elementwise("log10", lambda g, ans, x: g / (x * math.log(10)))
+_def_elementwise("sqrt", lambda g, ans, x: g / (2 * ans))
+_def_elementwise("square", lambda g, ans, x: 2 * g * x)
+_def_elementwise("reciprocal", lambda g, ans, x: -g * ans * ans)
+_def_elementwise("sin", lambda g, ans, x: g * np.cos(x))
+_def_elementwise("cos", lambda g, ans, x: -g * np.sin(x))
+_def_elementwise("tan", lambda g, ans, x: g * (1 + ans * ans))
+_def_elementwise("asin", lambda g, ans, x: g / np.sqrt(1 - x * x))
+_def_elementwise("acos", lambda g, ans, x: -g / np.sqrt(1 - x * x))
+_def_elementwise("atan", lambda g, ans, x: g / (1 + x * x))
+_def_elementwise("sinh", lambda g, ans, x: g * np.cosh(x))
+_def_elementwise("cosh", lambda g, ans, x: g * np.sinh(x))
+_def_elementwise("tanh", lambda g, ans, x: g * (1 - ans * ans))
+_def_elementwise("asinh", lambda g, ans, x: g / np.sqrt(x * x + 1))
+_def_elementwise("acosh", lambda g, ans, x: g / np.sqrt(x * x - 1))
+_def_elementwise("atanh", lambda g, ans, x: g / (1 - x * x))
+_def_elementwise("erf", lambda g, ans, x: g * (2 / math.sqrt(math.pi)) * np.exp(-x * x))
+_def_elementwise(
+    "add",
+    lambda g, ans, x1, x2, alpha=None: g,
+    lambda g, ans, x1, x2, alpha=None: g if alpha is None else g * alpha,
+)
+_def_elementwise(
+    "subtract",
+    lambda g, ans, x1, x2, alpha=None: g,
+    lambda g, ans, x1, x2, alpha=None: -g if alpha is None else -g * alpha,
+)
+_def_elementwise(
+    "multiply", lambda g, ans, x1, x2: g * x2, lambda g, ans, x1, x2: g * x1
+)
+_def_elementwise(
+    "divide",
+    lambda g, ans, x1, x2: g / x2,
+    lambda g, ans, x1, x2: -g * ans / x2,
+)
+_def_elementwise(
+    "pow",
+    lambda g, ans, x1, x2: g * x2 * np.power(x1, np.subtract(x2, 1)),
+    lambda g, ans, x1, x2: g * ans * np.log(np.where(np.greater(x1, 0), x1, 1)),
+)
+_def_elementwise(
+    "maximum",
+    lambda g, ans, x1, x2, **kw: g * np.greater_equal(x1, x2),
+    lambda g, ans, x1, x2, **kw: g * np.less(x1, x2),
+)
+_def_elementwise(
+    "minimum",
+    lambda g, ans, x1, x2, **kw: g * np.less_equal(x1, x2),
+    lambda g, ans, x1, x2, **kw: g * np.greater(x1, x2),
+)
+_def_elementwise(
+    "logaddexp",
+    lambda g, ans, x1, x2: g * np.exp(x1 - ans),
+    lambda g, ans, x1, x2: g * np.exp(x2 - ans),
+)
+_def_elementwise(
+    "where",
+    None,
+    lambda g, ans, cond, x1, x2: np.where(cond, g, 0),
+    lambda g, ans, cond, x1, x2: np.where(cond, 0, g),
+)
+_def_elementwise(
+    "clip",
+    lambda g, ans, x, x_min, x_max: g
+    * np.logical_and(
+        True if x_min is None else np.greater_equal(x, x_min),
+        True if x_max is None else np.less_equal(x, x_max),
+    ),
+    lambda g, ans, x, x_min, x_max: g * np.less(x, x_min),
+    lambda g, ans, x, x_min, x_max: g * np.greater(x, x_max),
+)
+for _name in ("astype", "broadcast_to", "copy_array"):
+    _def_elementwise(_name, lambda g, ans, *args, **kwargs: g)
+
+
+# Activations #
+# ------------ #
+
+
+def _gelu_derivative(g, ans, x, /, *, approximate=False):
+    if approximate:
+        inner = 0.7978845608 * (1 + 3 * 0.044715 * x * x)
+        t = np.tanh(0.7978845608 * (x + 0.044715 * x * x * x))
+        return g * (0.5 * (1 + t) + 0.5 * x * (1 - t * t) * inner)
+    cdf = 0.5 * (1 + ivy.to_native(ivy.erf(x / math.sqrt(2))))
+    return g * (cdf + x * np.exp(-0.5 * x * x) / math.sqrt(2 * math.pi))
+
+
+def _softplus_derivative(g, ans, x, /, *, beta=None, threshold=None):
+    beta = 1 if beta is None else beta
+    ret = g / (1 + np.exp(-beta * x))
+    if threshold is not None:
+        ret = np.where(beta * x > threshold, g, ret)
+    return ret
+
+
+def _silu_derivative(g, ans, x):
+    s = 1 / (1 + np.exp(-x))
+    return g * s * (1 + x * (1 - s))
+
+
+def _softmax_derivative(g, ans, x, /, *, axis=None):
+    axis = -1 if axis is None else axis
+    return ans * (g - np.sum(g * ans, axis=axis, keepdims=True))
+
+
+def _log_softmax_derivative(g, ans, x, /, *, axis=None):
+    axis = -1 if axis is None else axis
+    return g - np.exp(ans) * np.sum(g, axis=axis, keepdims=True)
+
+
+_def_elementwise("relu", lambda g, ans, x: g * np.greater(x, 0))
+_def_elementwise(
+    "leaky_relu", lambda g, ans, x, alpha=0.2: g * np.where(x > 0, 1, alpha)
+)
+_def_elementwise("sigmoid", lambda g, ans, x: g * ans * (1 - ans))
+_def_elementwise("gelu", _gelu_derivative)
+_def_elementwise("softplus", _softplus_derivative)
+_def_elementwise("silu", _silu_derivative)
+_def_elementwise("softmax", _softmax_derivative)
+_def_elementwise("log_softmax", _log_softmax_derivative)
+
+
+# Reductions #
+# ----------- #
+
+
+def _reduced_axes(x, axis):
+    if axis is None:
+        return tuple(range(np.ndim(x)))
+    axis = (axis,) if isinstance(axis, int) else axis
+    return tuple(a % np.ndim(x) for a in axis)
+
+
+def _expand_reduced(g, x, axis, keepdims):
+    # broadcasts the cotangent (or the value) of a reduction back over its input
+    if not keepdims:
+        g = np.expand_dims(g, _reduced_axes(x, axis))
+    return np.broadcast_to(g, np.shape(x))
+
+
+def _def_reduction(name, derivative):
+    def rule(g, ans, keys, x, /, *, axis=None, keepdims=False, **kwargs):
+        g = _expand_reduced(g, x, axis, keepdims)
+        ans = _expand_reduced(ans, x, axis, keepdims)
+        return {0: derivative(g, ans, x, _reduced_axes(x, axis), **kwargs)}
+
+    vjp_rules[name] = rule
+
+
+def _var_derivative(g, ans, x, axes, correction=0.0, **kwargs):
+    count = np.prod([np.shape(x)[a] for a in axes])
+    mean = np.mean(x, axis=axes, keepdims=True)
+    return g * 2 * (x - mean) / (count - correction)
+
+
+def _extremum_derivative(g, ans, x, axes, **kwargs):
+    mask = np.equal(x, ans)
+    return g * mask / np.sum(mask, axis=axes, keepdims=True)
+
+
+def _vector_norm_derivative(g, ans, x, axes, ord=2, **kwargs):
+    if ord == 1:
+        return g * np.sign(x)
+    if ord in (math.inf, -math.inf):
+        return _extremum_derivative(g * np.sign(x), ans, np.abs(x), axes)
+    if ord in (0, None) or ord < 1:
+        raise ivy.utils.exceptions.IvyNotImplementedException(
+            "there is no gradient rule for vector norms of order {}".format(ord)
+        )
+    safe_ans = np.where(ans == 0, 1, ans)
+    return g * np.sign(x) * (np.abs(x) / safe_ans) ** (ord - 1)
+
+
+_def_reduction("sum", lambda g, ans, x, axes, **kw: g)
+_def_reduction(
+    "mean", lambda g, ans, x, axes, **kw: g / np.prod([x.shape[a] for a in axes])
+)
+_def_reduction("prod", lambda g, ans, x, axes, **kw: g * ans / x)
+_def_reduction("var", _var_derivative)
+_def_reduction(
+    "std",
+    lambda g, ans, x, axes, **kw: _var_derivative(g / (2 * ans), ans, x, axes, **kw),
+)
+_def_reduction("max", _extremum_derivative)
+_def_reduction("min", _extremum_derivative)
+_def_reduction("vector_norm", _vector_norm_derivative)
+
+
+def _cumsum_vjp(g, ans, keys, x, axis=0, exclusive=False, reverse=False, **kwargs):
+    return {0: ivy.to_native(ivy.cumsum(g, axis, exclusive, not reverse))}
+
+
+vjp_rules["cumsum"] = _cumsum_vjp
+
+
+# Linear Algebra #
+# --------------- #
+
+
+def _matmul_vjp(
+    g,
+    ans,
+    keys,
+    x1,
+    x2,
+    /,
+    *,
+    transpose_a=False,
+    transpose_b=False,
+    adjoint_a=False,
+    adjoint_b=False,
+    **kwargs,
+):
+    x1, x2 = np.asarray(x1), np.asarray(x2)
+    transpose_a = (transpose_a or adjoint_a) and x1.ndim > 1
+    transpose_b = (transpose_b or adjoint_b) and x2.ndim > 1
+    a = np.swapaxes(x1, -1, -2) if transpose_a else x1
+    b = np.swapaxes(x2, -1, -2) if transpose_b else x2
+    # vectors take part as single row and column matrices
+    if a.ndim == 1:
+        a, g = a[None], np.expand_dims(g, -2)
+    if b.ndim == 1:
+        b, g = b[:, None], np.expand_dims(g, -1)
+    grads = dict()
+    if 0 in keys:
+        da = _unbroadcast(np.matmul(g, np.swapaxes(b, -1, -2)), a.shape)
+        da = np.swapaxes(da, -1, -2) if transpose_a else da
+        grads[0] = da.reshape(x1.shape)
+    if 1 in keys:
+        db = _unbroadcast(np.matmul(np.swapaxes(a, -1, -2), g), b.shape)
+        db = np.swapaxes(db, -1, -2) if transpose_b else db
+        grads[1] = db.reshape(x2.shape)
+    return grads
+
+
+def _einsum_vjp(g, ans, keys, equation, *operands, **kwargs):
+    equation = equation.replace(" ", "")
+    inputs, _, output = equation.partition("->")
+    inputs = inputs.split(",")
+    if "..." in equation or any(len(set(sub)) != len(sub) for sub in inputs):
+        raise ivy.utils.exceptions.IvyNotImplementedException(
+            "there is no gradient rule for einsum with ellipses or repeated indices"
+        )
+    if not _:
+        letters = "".join(inputs)
+        output = "".join(sorted(c for c in set(letters) if letters.count(c) == 1))
+    grads = dict()
+    for key in keys:
+        i = key - 1
+        subs = inputs[:i] + inputs[i + 1 :]
+        available = set(output).union(*subs)
+        sub = "".join(c for c in inputs[i] if c in available)
+        grad = np.einsum(
+            ",".join([output] + subs) + "->" + sub,
+            g,
+            *(operands[:i] + operands[i + 1 :]),
+        )
+        # indices only summed over within this operand are broadcast back
+        shape = np.shape(operands[i])
+        grad = grad.reshape(
+            [d if c in available else 1 for c, d in zip(inputs[i], shape)]
+        )
+        grads[key] = np.broadcast_to(grad, shape)
+    return grads
+
+
+vjp_rules["matmul"] = _matmul_vjp
+vjp_rules["einsum"] = _einsum_vjp
+
+
+# Manipulation #
+# ------------- #
+
+
+def _tile_vjp(g, ans, keys, x, /, repeats, **kwargs):
+    repeats = list(repeats)
+    ndim = max(len(repeats), np.ndim(x))
+    shape = [1] * (ndim - np.ndim(x)) + list(np.shape(x))
+    repeats = [1] * (ndim - len(repeats)) + repeats
+    g = g.reshape([d for pair in zip(repeats, shape) for d in pair])
+    return {0: np.sum(g, axis=tuple(range(0, 2 * ndim, 2))).reshape(np.shape(x))}
+
+
+def _concat_vjp(g, ans, keys, xs, /, *, axis=0, **kwargs):
+    sizes = [np.shape(x)[axis] for x in xs]
+    parts = np.split(g, np.cumsum(sizes)[:-1], axis)
+    return {key: parts[key[1]] for key in keys}
+
+
+def _stack_vjp(g, ans, keys, arrays, /, *, axis=0, **kwargs):
+    return {key: np.take(g, key[1], axis) for key in keys}
+
+
+def _gather_vjp(g, ans, keys, params, indices, /, *, axis=-1, batch_dims=0, **kwargs):
+    if batch_dims:
+        raise ivy.utils.exceptions.IvyNotImplementedException(
+            "there is no gradient rule for gathers with batch dimensions"
+        )
+    indices = np.asarray(indices)
+    axis = axis % np.ndim(params)
+    dx = np.zeros_like(params)
+    g = np.moveaxis(g, range(axis, axis + indices.ndim), range(indices.ndim))
+    np.add.at(np.moveaxis(dx, axis, 0), indices, g)
+    return {0: dx}
+
+
+vjp_rules.update(
+    {
+        "reshape": lambda g, ans, keys, x, *a, **kw: {0: g.reshape(np.shape(x))},
+        "expand_dims": lambda g, ans, keys, x, *a, **kw: {0: g.reshape(np.shape(x))},
+        "squeeze": lambda g, ans, keys, x, *a, **kw: {0: g.reshape(np.shape(x))},
+        "permute_dims": lambda g, ans, keys, x, axes, **kw: {
+            0: np.transpose(g, np.argsort(axes))
+        },
+        "swapaxes": lambda g, ans, keys, x, axis0, axis1, **kw: {
+            0: np.swapaxes(g, axis0, axis1)
+        },
+        "flip": lambda g, ans, keys, x, *, axis=None, **kw: {
+            0: np.flip(
+                g, axis if axis is None or isinstance(axis, int) else tuple(axis)
+            )
+        },
+        "roll": lambda g, ans, keys, x, shift, *, axis=None, **kw: {
+            0: np.roll(g, np.negative(shift), axis)
+        },
+        "tile": _tile_vjp,
+        "concat": _concat_vjp,
+        "stack": _stack_vjp,
+        "gather": _gather_vjp,
+    }
+)
+
+
+def _split(func, x, /, *, copy=None, num_or_size_splits=None, axis=0, **kwargs):
+    parts = func(x.val, num_or_size_splits=num_or_size_splits, axis=axis, **kwargs)
+    axis = axis % x.ndim
+    start, ret = 0, []
+    for part in parts:
+        stop = start + part.shape[axis]
+        ret.append(x[(slice(None),) * axis + (slice(start, stop),)])
+        start = stop
+    return ret
+
+
+def _unstack(func, x, /, *, copy=None, axis=0, keepdims=False):
+    axis = axis % x.ndim
+    return [
+        x[(slice(None),) * axis + ((slice(i, i + 1),) if keepdims else (i,))]
+        for i in range(x.shape[axis])
+    ]
+
+
+composite_rules["split"] = _split
+composite_rules["unstack"] = _unstack
+composite_rules["get_item"] = lambda func, x, query, **kwargs: x[_raw(query)]
+
+
+# Convolutions #
+# ------------- #
+
+
+def _conv_vjp(
+    g,
+    ans,
+    keys,
+    x,
+    filters,
+    strides,
+    padding,
+    /,
+    *,
+    dims=2,
+    feature_group_count=1,
+    dilations=1,
+    bias=None,
+):
+    """
+    Cotangents of a channel-last convolution.
+
+    The input and the filters get their cotangents one kernel offset at a time: each
+    offset reads a strided window of the padded input, and its contributions are
+    one matmul per group.
+    """
+    strides = [strides] * dims if isinstance(strides, int) else strides
+    dilations = [dilations] * dims if isinstance(dilations, int) else dilations
+    kernel_shape = filters.shape[:dims]
+    pad_list = _conv_pad_list(x.shape, kernel_shape, strides, padding, dims, dilations)
+    x_pad = np.pad(x, [(0, 0), *pad_list, (0, 0)])
+    groups = feature_group_count
+    batch, out_shape = g.shape[0], g.shape[1:-1]
+    group_in_dim = filters.shape[-2]
+    group_out_dim = filters.shape[-1] // groups
+    # G x (B x O...) x O/G
+    g_cols = np.moveaxis(g.reshape([-1, groups, group_out_dim]), 1, 0)
+    # K... x G x O/G x I/G
+    w = np.moveaxis(
+        filters.reshape([*kernel_shape, group_in_dim, groups, group_out_dim]), -3, -1
+    )
+    dx_pad = np.zeros_like(x_pad) if 0 in keys else None
+    dw = np.empty_like(w) if 1 in keys else None
+    for k in np.ndindex(*kernel_shape):
+        window = (slice(None),) + tuple(
+            slice(
+                k[i] * dilations[i],
+                k[i] * dilations[i] + (out_shape[i] - 1) * strides[i] + 1,
+                strides[i],
+            )
+            for i in range(dims)
+        )
+        if dw is not None:
+            # G x I/G x (B x O...)
+            cols = np.moveaxis(x_pad[window].reshape([-1, groups, group_in_dim]), 0, -1)
+            dw[k] = np.swapaxes(np.matmul(cols, g_cols), -1, -2)
+        if dx_pad is not None:
+            dx_pad[window] += np.moveaxis(np.matmul(g_cols, w[k]), 0, 1).reshape(
+                [batch, *out_shape, groups * group_in_dim]
+            )
+    grads = dict()
+    if dx_pad is not None:
+        grads[0] = dx_pad[
+            (slice(None),)
+            + tuple(
+                slice(lo, lo + x.shape[i + 1]) for i, (lo, _) in enumerate(pad_list)
+            )
+        ]
+    if dw is not None:
+        grads[1] = np.moveaxis(dw, -1, -3).reshape(filters.shape)
+    if "bias" in keys:
+        grads["bias"] = np.sum(g, axis=tuple(range(dims + 1)))
+    return grads
+
+
+def _conv_general_dilated(
+    func,
+    x,
+    filters,
+    strides,
+    padding,
+    /,
+    *,
+    dims=2,
+    data_format="channel_last",
+    filter_format="channel_last",
+    feature_group_count=1,
+    x_dilations=1,
+    dilations=1,
+    bias=None,
+    out=None,
+):
+    x_dilations = [x_dilations] * dims if isinstance(x_dilations, int) else x_dilations
+    if any(d > 1 for d in x_dilations):
+        raise ivy.utils.exceptions.IvyNotImplementedException(
+            "there is no gradient rule for convolutions with input dilations"
+        )
+    if data_format == "channel_first":
+        x = ivy.permute_dims(x, (0, *range(2, dims + 2), 1))
+    if filter_format == "channel_first":
+        filters = ivy.permute_dims(filters, (*range(2, dims + 2), 1, 0))
+    ret = _apply(
+        func,
+        _conv_vjp,
+        (x, filters, strides, padding),
+        dict(
+            dims=dims,
+            feature_group_count=feature_group_count,
+            dilations=dilations,
+            bias=bias,
+        ),
+    )
+    if data_format == "channel_first":
+        ret = ivy.permute_dims(ret, (0, dims + 1, *range(1, dims + 1)))
+    return ret
+
+
+def _def_conv(name, dims):
+    def rule(func, x, filters, strides, padding, /, *, data_format=None, **kwargs):
+        kwargs.pop("out", None)
+        channel_first = data_format is not None and data_format[1] == "C"
+        return ivy.conv_general_dilated(
+            x,
+            filters,
+            strides,
+            padding,
+            dims=dims,
+            data_format="channel_first" if channel_first else "channel_last",
+            **kwargs,
+        )
+
+    composite_rules[name] = rule
+
+
+def _depthwise_conv2d(
+    func, x, filters, strides, padding, /, *, data_format="NHWC", dilations=1, out=None
+):
+    if filters.ndim == 4:
+        filters = ivy.squeeze(filters, axis=3)
+    # KH x KW x 1 x C, one group per channel
+    return ivy.conv_general_dilated(
+        x,
+        ivy.expand_dims(filters, axis=-2),
+        strides,
+        padding,
+        dims=2,
+        data_format="channel_first" if data_format == "NCHW" else "channel_last",
+        feature_group_count=x.shape[1 if data_format == "NCHW" else -1],
+        dilations=dilations,
+    )
+
+
+_def_conv("conv1d", 1)
+_def_conv("conv2d", 2)
+_def_conv("conv3d", 3)
+composite_rules["conv_general_dilated"] = _conv_general_dilated
+composite_rules["depthwise_conv2d"] = _depthwise_conv2d
+
+
+# Recurrent #
+# ---------- #
+
+# the numpy lstm kernel updates its buffers in place, so the recorded graph is the one
+# of the unrolled steps
+composite_rules["lstm_update"] = lambda func, *args, **kwargs: inspect.unwrap(
+    ivy.utils.backend.handler.ivy_original_dict["lstm_update"]
+)(*args, **kwargs)
@@ -23,3 +23,7 @@ def native_sparse_array(
 
 def native_sparse_array_to_indices_values_and_shape(x):
     raise IvyNotImplementedException()
+
+
+def native_sparse_array_matmul(x, y):
+    raise IvyNotImplementedException()
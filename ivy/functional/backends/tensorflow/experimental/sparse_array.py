@@ -102,3 +102,9 @@ def native_sparse_array_to_indices_values_and_shape(x):
     if isinstance(x, tf.SparseTensor):
         return {"coo_indices": x.indices}, x.values, x.dense_shape
     raise ivy.utils.exceptions.IvyException("not a SparseTensor")
+
+
+def native_sparse_array_matmul(x, y):
+    if len(y.shape) == 1:
+        return tf.squeeze(tf.sparse.sparse_dense_matmul(x, tf.expand_dims(y, -1)), -1)
+    return tf.sparse.sparse_dense_matmul(x, y)
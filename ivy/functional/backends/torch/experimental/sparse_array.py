@@ -115,3 +115,10 @@ def native_sparse_array_to_indices_values_and_shape(x):
             x.size(),
         )
     raise ivy.utils.exceptions.IvyException("not a sparse COO/CSR/CSC/BSC/BSR Tensor")
+
+
+def native_sparse_array_matmul(x, y):
+    if x.dtype.is_floating_point or x.dtype.is_complex:
+        return torch.matmul(x, y)
+    # the sparse kernels are only implemented for floating point values
+    return torch.matmul(x.to(torch.float64), y.to(torch.float64)).to(x.dtype)
@@ -510,3 +510,46 @@ def conv_general_transpose(
     if data_format == "channel_last":
         res = res.permute(0, *range(2, dims + 2), 1)
     return res
+
+
+def lstm_update(
+    x: torch.Tensor,
+    init_h: torch.Tensor,
+    init_c: torch.Tensor,
+    kernel: torch.Tensor,
+    recurrent_kernel: torch.Tensor,
+    /,
+    *,
+    bias: Optional[torch.Tensor] = None,
+    recurrent_bias: Optional[torch.Tensor] = None,
+) -> Tuple[torch.Tensor, torch.Tensor]:
+    *batch_shape, timesteps, input_channels = x.shape
+    hidden = recurrent_kernel.shape[0]
+    # torch stores the gate weights as [4 x out, in], in the same i, f, g, o order
+    params = [kernel.t(), recurrent_kernel.t()]
+    has_biases = bias is not None or recurrent_bias is not None
+    if has_biases:
+        params += [
+            bias if bias is not None else torch.zeros_like(recurrent_bias),
+            recurrent_bias if recurrent_bias is not None else torch.zeros_like(bias),
+        ]
+    x = x.reshape(-1, timesteps, input_channels)
+    init_h = init_h.expand(*batch_shape, hidden).reshape(1, -1, hidden)
+    init_c = init_c.expand(*batch_shape, hidden).reshape(1, -1, hidden)
+    hts, _, ct = torch._VF.lstm(
+        x, (init_h, init_c), params, has_biases, 1, 0.0, False, False, True
+    )
+    return (
+        hts.reshape(*batch_shape, timesteps, hidden),
+        ct.reshape(*batch_shape, hidden),
+    )
+
+
+# the fused kernel only takes floating point arrays of a single dtype
+lstm_update.partial_mixed_handler = lambda x, *args, **kwargs: (
+    ivy.dtype(x) in ("float32", "float64")
+    and all(
+        ivy.dtype(a) == ivy.dtype(x)
+        for a in args + tuple(v for v in kwargs.values() if v is not None)
+    )
+)
@@ -12,8 +12,21 @@ def scaled_dot_product_attention(
     /,
     *,
     mask=None,
+    additive_mask=None,
+    is_causal=False,
+    query_block_size=None,
+    key_block_size=None,
     out=None,
 ):
+    # xformers picks its own blocking, so the block sizes are not needed here
     if isinstance(mask, torch.Tensor):
         mask = torch.where(mask == 0, -torch.inf, 0)
+    if isinstance(additive_mask, torch.Tensor):
+        mask = additive_mask if mask is None else mask + additive_mask
+    if is_causal:
+        mask = (
+            xops.LowerTriangularMask()
+            if mask is None
+            else xops.fmha.attn_bias.LowerTriangularMaskWithTensorBias(mask)
+        )
     return xops.memory_efficient_attention(q, k, v, scale=scale, attn_bias=mask)
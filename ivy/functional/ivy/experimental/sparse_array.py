@@ -290,7 +290,6 @@ def _is_data_not_indices_values_and_shape(
             row_indices,
             values,
             dense_shape,
-            format=format,
             fn=ivy.exists,
             type="any",
             limit=[0],
@@ -354,6 +353,43 @@ def _is_valid_format(
     )
 
 
+def _compressed_to_indices(compressed_indices, nnz):
+    # the position of every stored element in the compressed dimension, found by
+    # locating it among the offsets instead of expanding each slice in a loop
+    return (
+        ivy.searchsorted(
+            compressed_indices, ivy.arange(nnz, dtype="int64"), side="right"
+        )
+        - 1
+    )
+
+
+def _indices_to_compressed(major, minor, size, minor_size):
+    # order the elements by (major, minor) and take the offset of every slice of the
+    # major dimension, giving the compressed indices and the order of the values
+    order = ivy.argsort(major * minor_size + minor, stable=True)
+    compressed = ivy.searchsorted(
+        ivy.gather(major, order), ivy.arange(size + 1, dtype="int64"), side="left"
+    )
+    return ivy.astype(compressed, "int64"), order
+
+
+def _normalize_axes(axis, ndim):
+    if axis is None:
+        return list(range(ndim))
+    return [a % ndim for a in (axis if isinstance(axis, (list, tuple)) else [axis])]
+
+
+def _segment_sum(data, segment_ids, num_segments):
+    # sum the rows of data sharing a segment id, the sparse analogue of a reduction
+    return ivy.scatter_nd(
+        ivy.expand_dims(segment_ids, axis=-1),
+        data,
+        reduction="sum",
+        out=ivy.zeros((num_segments,) + tuple(data.shape[1:]), dtype=data.dtype),
+    )
+
+
 class SparseArray:
     def __init__(
         self,
@@ -398,7 +434,6 @@ class SparseArray:
                     crow_indices, col_indices, values, dense_shape, format
                 )
             else:
-                print(format)
                 self._init_compressed_column_components(
                     ccol_indices, row_indices, values, dense_shape, format
                 )
@@ -570,6 +605,10 @@ class SparseArray:
     def dense_shape(self):
         return self._dense_shape
 
+    @property
+    def format(self):
+        return self._format
+
     # Setters #
     # --------#
 
@@ -680,99 +719,486 @@ class SparseArray:
     # Instance Methods #
     # ---------------- #
 
-    def _coo_to_dense_coordinates(self):
-        all_coordinates = []
-        for i in range(self._values.shape[0]):
-            coordinate = ivy.gather(self._coo_indices, ivy.array([[i]]))
-            coordinate = ivy.reshape(coordinate, (self._coo_indices.shape[0],))
-            all_coordinates.append(coordinate.to_list())
-        return all_coordinates
-
-    def _csr_to_dense_coordinates(self):
-        all_coordinates = []
-        total_rows = self._dense_shape[0]
-        all_rows = self._col_indices.to_list()
-        all_cols = self._crow_indices.to_list()
-        for row in range(total_rows):
-            cols = all_rows[all_cols[row] : all_cols[row + 1]]
-            for col in cols:
-                all_coordinates.append([row, col])
-        return all_coordinates
-
-    def _csc_to_dense_coordinates(self):
-        # CSC sparse array
-        all_coordinates = []
-        total_rows = self._dense_shape[1]
-        all_cols = self._row_indices.to_list()
-        all_rows = self._ccol_indices.to_list()
-        for col in range(total_rows):
-            rows = all_cols[all_rows[col] : all_rows[col + 1]]
-            for row in rows:
-                all_coordinates.append([row, col])
-        return all_coordinates
-
-    def _bsr_to_dense_coordinates(self):
-        all_coordinates = []
-        total_rows = self._dense_shape[0]
-        all_rows = self._crow_indices.to_list()
-        all_cols = self._col_indices.to_list()
-
+    def _coordinates(self):
+        """
+        Return the coordinates *[ndim, nnz]* and the values *[nnz]* of the stored
+        elements, whatever the format.
+        """
+        if self._format == "coo":
+            return self._coo_indices, self._values
+        if self._format == "csr":
+            rows = _compressed_to_indices(self._crow_indices, self._values.shape[0])
+            return ivy.stack([rows, self._col_indices]), self._values
+        if self._format == "csc":
+            cols = _compressed_to_indices(self._ccol_indices, self._values.shape[0])
+            return ivy.stack([self._row_indices, cols]), self._values
+        # every block is expanded to the coordinates of its elements
         nblockrows, nblockcols = self._values.shape[-2:]
+        if self._format == "bsr":
+            block_cols = self._col_indices
+            block_rows = _compressed_to_indices(self._crow_indices, block_cols.shape[0])
+        else:
+            block_rows = self._row_indices
+            block_cols = _compressed_to_indices(self._ccol_indices, block_rows.shape[0])
+        rows = ivy.reshape(block_rows, (-1, 1, 1)) * nblockrows + ivy.reshape(
+            ivy.arange(nblockrows, dtype="int64"), (1, -1, 1)
+        )
+        cols = ivy.reshape(block_cols, (-1, 1, 1)) * nblockcols + ivy.reshape(
+            ivy.arange(nblockcols, dtype="int64"), (1, 1, -1)
+        )
+        rows, cols = ivy.broadcast_arrays(rows, cols)
+        return (
+            ivy.stack([ivy.reshape(rows, (-1,)), ivy.reshape(cols, (-1,))]),
+            ivy.reshape(self._values, (-1,)),
+        )
 
-        for row in range(total_rows // nblockrows):
-            cols = all_cols[all_rows[row] : all_rows[row + 1]]
-            for col in cols:
-                for col_index in range(nblockcols):
-                    for row_index in range(nblockrows):
-                        all_coordinates.append(
-                            [
-                                nblockrows * row + row_index,
-                                nblockcols * col + col_index,
-                            ]
-                        )
-        return all_coordinates
-
-    def _bsc_to_dense_coordinates(self):
-        all_coordinates = []
-        total_cols = self._dense_shape[1]
-        all_rows = self._row_indices.to_list()
-        all_cols = self._ccol_indices.to_list()
-
-        nblockrows, nblockcols = self._values.shape[-2:]
+    def _with_values(self, values):
+        """Return a sparse array with the same sparsity pattern and new values."""
+        values = ivy.reshape(values, self._values.shape)
+        if self._format == "coo":
+            return SparseArray(
+                coo_indices=self._coo_indices,
+                values=values,
+                dense_shape=self._dense_shape,
+                format="coo",
+            )
+        if self._format in ["csr", "bsr"]:
+            return SparseArray(
+                crow_indices=self._crow_indices,
+                col_indices=self._col_indices,
+                values=values,
+                dense_shape=self._dense_shape,
+                format=self._format,
+            )
+        return SparseArray(
+            ccol_indices=self._ccol_indices,
+            row_indices=self._row_indices,
+            values=values,
+            dense_shape=self._dense_shape,
+            format=self._format,
+        )
 
-        for col in range(total_cols // nblockcols):
-            rows = all_rows[all_cols[col] : all_cols[col + 1]]
-            for row in rows:
-                for col_index in range(nblockcols):
-                    for row_index in range(nblockrows):
-                        all_coordinates.append(
-                            [
-                                nblockrows * row + row_index,
-                                nblockcols * col + col_index,
-                            ]
-                        )
-        return all_coordinates
+    def _values_of(self, x):
+        """Gather the elements of the dense array `x` at the stored coordinates."""
+        indices, _ = self._coordinates()
+        ndim = len(self._dense_shape)
+        x = ivy.reshape(x, (1,) * (ndim - len(x.shape)) + tuple(x.shape))
+        # broadcast dimensions of x are indexed at zero rather than materialized
+        indices = [
+            indices[d] if x.shape[d] != 1 else ivy.zeros_like(indices[d])
+            for d in range(ndim)
+        ]
+        return ivy.gather_nd(x, ivy.stack(indices, axis=-1))
+
+    def _coalesced(self):
+        """
+        Return the linear indices, in increasing order, and the values of the
+        stored elements, with the values of duplicate coordinates summed.
+        """
+        indices, values = self._coordinates()
+        linear = ivy.zeros_like(indices[0])
+        for d, size in enumerate(self._dense_shape):
+            linear = linear * size + indices[d]
+        keys, inverse = ivy.unique_inverse(linear)
+        return keys, _segment_sum(values, inverse, keys.shape[0])
+
+    def _from_linear(self, keys, values):
+        """Build a sparse array of this format from linear indices and values."""
+        indices = []
+        for size in reversed(self._dense_shape):
+            indices.insert(0, keys % size)
+            keys = keys // size
+        ret = SparseArray(
+            coo_indices=ivy.stack(indices),
+            values=values,
+            dense_shape=self._dense_shape,
+            format="coo",
+        )
+        if self._format == "csr":
+            return ret.to_csr()
+        if self._format == "csc":
+            return ret.to_csc()
+        return ret
 
     def to_dense_array(self, *, native=False):
-        if self._format == "coo":
-            all_coordinates = self._coo_to_dense_coordinates()
-        elif self._format == "csr":
-            all_coordinates = self._csr_to_dense_coordinates()
-        elif self._format == "csc":
-            all_coordinates = self._csc_to_dense_coordinates()
-        elif self._format == "bsc":
-            all_coordinates = self._bsc_to_dense_coordinates()
-        else:
-            all_coordinates = self._bsr_to_dense_coordinates()
-
+        indices, values = self._coordinates()
         # make dense array
         ret = ivy.scatter_nd(
-            ivy.array(all_coordinates),
-            ivy.flatten(self._values),
+            ivy.permute_dims(indices, (1, 0)),
+            values,
             ivy.array(self._dense_shape),
         )
         return ret.to_native() if native else ret
 
+    def to_coo(self):
+        """
+        Convert the sparse array to the COO format, without going through a dense
+        array.
+
+        Returns
+        -------
+        ret
+            the sparse array in the COO format.
+        """
+        if self._format == "coo":
+            return self
+        indices, values = self._coordinates()
+        return SparseArray(
+            coo_indices=indices,
+            values=values,
+            dense_shape=self._dense_shape,
+            format="coo",
+        )
+
+    def to_csr(self):
+        """
+        Convert the 2D sparse array to the CSR format, without going through a dense
+        array.
+
+        Returns
+        -------
+        ret
+            the sparse array in the CSR format.
+        """
+        if self._format == "csr":
+            return self
+        (rows, cols), values = self._coordinates()
+        crow_indices, order = _indices_to_compressed(
+            rows, cols, self._dense_shape[0], self._dense_shape[1]
+        )
+        return SparseArray(
+            crow_indices=crow_indices,
+            col_indices=ivy.gather(cols, order),
+            values=ivy.gather(values, order),
+            dense_shape=self._dense_shape,
+            format="csr",
+        )
+
+    def to_csc(self):
+        """
+        Convert the 2D sparse array to the CSC format, without going through a dense
+        array.
+
+        Returns
+        -------
+        ret
+            the sparse array in the CSC format.
+        """
+        if self._format == "csc":
+            return self
+        (rows, cols), values = self._coordinates()
+        ccol_indices, order = _indices_to_compressed(
+            cols, rows, self._dense_shape[1], self._dense_shape[0]
+        )
+        return SparseArray(
+            ccol_indices=ccol_indices,
+            row_indices=ivy.gather(rows, order),
+            values=ivy.gather(values, order),
+            dense_shape=self._dense_shape,
+            format="csc",
+        )
+
+    def transpose(self):
+        """
+        Reverse the dimensions of the sparse array. The compressed formats are
+        transposed by reinterpreting their indices, CSR as CSC and BSR as BSC.
+
+        Returns
+        -------
+        ret
+            the transposed sparse array.
+        """
+        dense_shape = tuple(reversed(self._dense_shape))
+        if self._format == "coo":
+            return SparseArray(
+                coo_indices=ivy.flip(self._coo_indices, axis=0),
+                values=self._values,
+                dense_shape=dense_shape,
+                format="coo",
+            )
+        values = self._values
+        if self._format in ["bsr", "bsc"]:
+            values = ivy.permute_dims(values, (0, 2, 1))
+        if self._format in ["csr", "bsr"]:
+            return SparseArray(
+                ccol_indices=self._crow_indices,
+                row_indices=self._col_indices,
+                values=values,
+                dense_shape=dense_shape,
+                format="csc" if self._format == "csr" else "bsc",
+            )
+        return SparseArray(
+            crow_indices=self._ccol_indices,
+            col_indices=self._row_indices,
+            values=values,
+            dense_shape=dense_shape,
+            format="csr" if self._format == "csc" else "bsr",
+        )
+
+    def matmul(self, other):
+        """
+        Multiply the 2D sparse array with a dense matrix or vector, touching only
+        the stored elements.
+
+        Parameters
+        ----------
+        other
+            dense array *[n, k]* or *[n]*, for a sparse array of shape *[m, n]*.
+
+        Returns
+        -------
+        ret
+            the dense product *[m, k]* or *[m]*.
+        """
+        ivy.utils.assertions.check_equal(
+            len(self._dense_shape),
+            2,
+            message="only 2D sparse arrays can be multiplied",
+            as_array=False,
+        )
+        other = ivy.array(other)
+        if ivy.exists(self._data) and ivy.dtype(other) == ivy.dtype(self._values):
+            # backends with native sparse arrays have their own kernels
+            return ivy.to_ivy(ivy.native_sparse_array_matmul(self._data, other))
+        vector = len(other.shape) == 1
+        if vector:
+            other = ivy.expand_dims(other, axis=-1)
+        num_rows = self._dense_shape[0]
+        if self._format == "bsr":
+            # one small dense matmul per stored block
+            nblockrows, nblockcols = self._values.shape[-2:]
+            other_blocks = ivy.reshape(other, (-1, nblockcols, other.shape[-1]))
+            products = ivy.matmul(
+                self._values, ivy.gather(other_blocks, self._col_indices, axis=0)
+            )
+            block_rows = _compressed_to_indices(
+                self._crow_indices, self._col_indices.shape[0]
+            )
+            ret = ivy.reshape(
+                _segment_sum(products, block_rows, num_rows // nblockrows),
+                (num_rows, -1),
+            )
+        else:
+            (rows, cols), values = self._coordinates()
+            products = ivy.expand_dims(values, axis=-1) * ivy.gather(
+                other, cols, axis=0
+            )
+            ret = _segment_sum(products, rows, num_rows)
+        return ivy.squeeze(ret, axis=-1) if vector else ret
+
+    def sum(self, *, axis=None, keepdims=False):
+        """
+        Sum the elements of the sparse array, along the given axes.
+
+        Parameters
+        ----------
+        axis
+            axis or axes along which to sum. Default is ``None``, which sums all of
+            the elements.
+        keepdims
+            whether to keep the reduced axes with a size of one. Default is
+            ``False``.
+
+        Returns
+        -------
+        ret
+            the dense sums.
+        """
+        ndim = len(self._dense_shape)
+        axes = _normalize_axes(axis, ndim)
+        kept = [d for d in range(ndim) if d not in axes]
+        shape = [self._dense_shape[d] for d in kept]
+        indices, values = self._coordinates()
+        if kept:
+            # the linear index over the kept dimensions identifies each output
+            segment_ids = ivy.zeros_like(indices[0])
+            for d in kept:
+                segment_ids = segment_ids * self._dense_shape[d] + indices[d]
+            num_segments = 1
+            for size in shape:
+                num_segments *= size
+            ret = ivy.reshape(_segment_sum(values, segment_ids, num_segments), shape)
+        else:
+            ret = ivy.sum(values)
+        if keepdims:
+            ret = ivy.reshape(
+                ret, [1 if d in axes else self._dense_shape[d] for d in range(ndim)]
+            )
+        return ret
+
+    def mean(self, *, axis=None, keepdims=False):
+        """
+        Compute the mean of the sparse array along the given axes, counting the
+        elements which are not stored as zeros.
+
+        Parameters
+        ----------
+        axis
+            axis or axes along which to compute the mean. Default is ``None``, which
+            takes the mean of all of the elements.
+        keepdims
+            whether to keep the reduced axes with a size of one. Default is
+            ``False``.
+
+        Returns
+        -------
+        ret
+            the dense means.
+        """
+        count = 1
+        for a in _normalize_axes(axis, len(self._dense_shape)):
+            count *= self._dense_shape[a]
+        return ivy.divide(self.sum(axis=axis, keepdims=keepdims), count)
+
+    def multiply(self, other):
+        """
+        Multiply the sparse array elementwise, keeping its sparsity pattern. A
+        sparse `other` keeps the coordinates stored in both arrays.
+
+        Parameters
+        ----------
+        other
+            scalar, dense array broadcastable to the dense shape or sparse array of
+            the same dense shape.
+
+        Returns
+        -------
+        ret
+            the sparse product.
+        """
+        if not ivy.is_ivy_sparse_array(other):
+            if ivy.is_array(other):
+                other = self._values_of(other)
+            return self._with_values(ivy.reshape(self._values, (-1,)) * other)
+        keys, values = self._coalesced()
+        other_keys, other_values = other._coalesced()
+        # in the sorted keys of both arrays, the coordinates stored in both appear as
+        # adjacent pairs
+        all_keys = ivy.concat([keys, other_keys])
+        order = ivy.argsort(all_keys, stable=True)
+        all_keys = ivy.gather(all_keys, order)
+        all_values = ivy.gather(ivy.concat([values, other_values]), order)
+        first = ivy.nonzero(all_keys[1:] == all_keys[:-1], as_tuple=False)
+        first = ivy.reshape(first, (-1,))
+        return self._from_linear(
+            ivy.gather(all_keys, first),
+            ivy.gather(all_values, first) * ivy.gather(all_values, first + 1),
+        )
+
+    def divide(self, other):
+        """
+        Divide the sparse array elementwise, keeping its sparsity pattern.
+
+        Parameters
+        ----------
+        other
+            scalar or dense array broadcastable to the dense shape.
+
+        Returns
+        -------
+        ret
+            the sparse quotient.
+        """
+        if ivy.is_array(other):
+            other = self._values_of(other)
+        return self._with_values(ivy.divide(ivy.reshape(self._values, (-1,)), other))
+
+    def add(self, other):
+        """
+        Add another array to the sparse array. The sum with a sparse array of the
+        same dense shape is sparse, the sum with a dense array is dense.
+
+        Parameters
+        ----------
+        other
+            sparse or dense array to add.
+
+        Returns
+        -------
+        ret
+            the sum.
+        """
+        if not ivy.is_ivy_sparse_array(other):
+            return ivy.add(self.to_dense_array(), other)
+        ivy.utils.assertions.check_equal(
+            self._dense_shape,
+            other.dense_shape,
+            message="sparse arrays must have the same shape",
+            as_array=False,
+        )
+        indices, values = self._coordinates()
+        other_indices, other_values = other._coordinates()
+        # the union of both patterns, with the values of shared coordinates summed
+        union = SparseArray(
+            coo_indices=ivy.concat([indices, other_indices], axis=1),
+            values=ivy.concat([values, other_values]),
+            dense_shape=self._dense_shape,
+            format="coo",
+        )
+        return self._from_linear(*union._coalesced())
+
+    def subtract(self, other):
+        """
+        Subtract another array from the sparse array. The difference with a sparse
+        array of the same dense shape is sparse, the difference with a dense array
+        is dense.
+
+        Parameters
+        ----------
+        other
+            sparse or dense array to subtract.
+
+        Returns
+        -------
+        ret
+            the difference.
+        """
+        return self.add(-other)
+
+    def __matmul__(self, other):
+        return self.matmul(other)
+
+    def __rmatmul__(self, other):
+        # x @ A = (A^T @ x^T)^T
+        other = ivy.array(other)
+        if len(other.shape) == 1:
+            return self.transpose().matmul(other)
+        return ivy.matrix_transpose(
+            self.transpose().matmul(ivy.matrix_transpose(other))
+        )
+
+    def __mul__(self, other):
+        return self.multiply(other)
+
+    def __rmul__(self, other):
+        return self.multiply(other)
+
+    def __truediv__(self, other):
+        return self.divide(other)
+
+    def __add__(self, other):
+        return self.add(other)
+
+    def __radd__(self, other):
+        return self.add(other)
+
+    def __sub__(self, other):
+        return self.subtract(other)
+
+    def __rsub__(self, other):
+        return (-self).add(other)
+
+    def __neg__(self):
+        return self._with_values(-self._values)
+
+    def __abs__(self):
+        return self._with_values(ivy.abs(self._values))
+
+    def __ivy_array_function__(self, func, types, args, kwargs):
+        if kwargs.pop("out", None) is not None or func.__name__ not in _functions:
+            return NotImplemented
+        return _functions[func.__name__](*args, **kwargs)
+
 
 class NativeSparseArray:
     pass
@@ -818,3 +1244,78 @@ def native_sparse_array(
 @handle_exceptions
 def native_sparse_array_to_indices_values_and_shape(x):
     return ivy.current_backend().native_sparse_array_to_indices_values_and_shape(x)
+
+
+@handle_exceptions
+@inputs_to_native_arrays
+def native_sparse_array_matmul(x, y):
+    return ivy.current_backend().native_sparse_array_matmul(x, y)
+
+
+# Array Functions #
+# --------------- #
+
+# ivy functions computed on the stored elements when called with a sparse array, see
+# SparseArray.__ivy_array_function__
+
+
+def _transpose(x, adjoint):
+    if is_ivy_sparse_array(x):
+        x = x.transpose()
+        return x._with_values(ivy.conj(x.values)) if adjoint else x
+    x = ivy.matrix_transpose(x)
+    return ivy.conj(x) if adjoint else x
+
+
+def _matmul(
+    x1, x2, /, *, transpose_a=False, transpose_b=False, adjoint_a=False, adjoint_b=False
+):
+    if transpose_a or adjoint_a:
+        x1 = _transpose(x1, adjoint_a)
+    if transpose_b or adjoint_b:
+        x2 = _transpose(x2, adjoint_b)
+    if is_ivy_sparse_array(x1):
+        return x1.matmul(x2)
+    return x2.__rmatmul__(x1)
+
+
+def _sum(x, /, *, axis=None, dtype=None, keepdims=False):
+    ret = x.sum(axis=axis, keepdims=keepdims)
+    return ivy.astype(ret, dtype) if dtype is not None else ret
+
+
+def _add(x1, x2, /, *, alpha=None):
+    if alpha is not None:
+        x2 = x2 * alpha
+    return x1.add(x2) if is_ivy_sparse_array(x1) else x2.add(x1)
+
+
+def _subtract(x1, x2, /, *, alpha=None):
+    if alpha is not None:
+        x2 = x2 * alpha
+    return x1.subtract(x2) if is_ivy_sparse_array(x1) else (-x2).add(x1)
+
+
+def _multiply(x1, x2, /):
+    return x1.multiply(x2) if is_ivy_sparse_array(x1) else x2.multiply(x1)
+
+
+def _divide(x1, x2, /):
+    # dividing by a sparse array divides by its zeros
+    return x1.divide(x2) if is_ivy_sparse_array(x1) else NotImplemented
+
+
+_functions = {
+    "matmul": _matmul,
+    "sum": _sum,
+    "mean": lambda x, /, *, axis=None, keepdims=False: x.mean(
+        axis=axis, keepdims=keepdims
+    ),
+    "add": _add,
+    "subtract": _subtract,
+    "multiply": _multiply,
+    "divide": _divide,
+    "negative": lambda x, /: -x,
+    "abs": lambda x, /: abs(x),
+    "matrix_transpose": lambda x, /: x.transpose(),
+}
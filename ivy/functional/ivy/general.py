@@ -2,8 +2,12 @@
 
 # global
 import gc
+import hashlib
 import inspect
 import math
+import threading
+import time
+from collections import OrderedDict, namedtuple
 from functools import wraps
 from numbers import Number
 from typing import (
@@ -48,6 +52,7 @@ queue_timeout_stack = list()
 array_mode_stack = list()
 shape_array_mode_stack = list()
 nestable_mode_stack = list()
+fused_dispatch_mode_stack = list()
 exception_trace_mode_stack = list()
 trace_mode_dict = dict()
 trace_mode_dict["frontend"] = "ivy/functional/frontends"
@@ -521,6 +526,63 @@ def unset_nestable_mode() -> None:
         ivy.__setattr__("nestable_mode", mode, True)
 
 
+ivy.fused_dispatch_mode = False
+
+
+@handle_exceptions
+def set_fused_dispatch_mode(mode: bool) -> None:
+    """
+    Set the mode of whether backend functions are wrapped with a single fused
+    dispatcher, which replaces the chain of function wrappers with one pass over the
+    arguments whenever no container, `out`, nan or view handling is required.
+
+    The mode is read when a backend is set, so it only affects the functions wrapped
+    by subsequent calls to `ivy.set_backend`.
+
+    Parameter
+    ---------
+    mode
+        boolean whether to build fused dispatchers when setting a backend
+
+    Examples
+    --------
+    >>> ivy.set_fused_dispatch_mode(True)
+    >>> ivy.fused_dispatch_mode
+    True
+
+    >>> ivy.set_fused_dispatch_mode(False)
+    >>> ivy.fused_dispatch_mode
+    False
+    """
+    global fused_dispatch_mode_stack
+    ivy.utils.assertions.check_isinstance(mode, bool)
+    fused_dispatch_mode_stack.append(mode)
+    ivy.__setattr__("fused_dispatch_mode", mode, True)
+
+
+@handle_exceptions
+def unset_fused_dispatch_mode() -> None:
+    """
+    Reset the mode of whether backend functions are wrapped with a single fused
+    dispatcher to the previous state.
+
+    Examples
+    --------
+    >>> ivy.set_fused_dispatch_mode(True)
+    >>> ivy.fused_dispatch_mode
+    True
+
+    >>> ivy.unset_fused_dispatch_mode()
+    >>> ivy.fused_dispatch_mode
+    False
+    """
+    global fused_dispatch_mode_stack
+    if fused_dispatch_mode_stack:
+        fused_dispatch_mode_stack.pop(-1)
+        mode = fused_dispatch_mode_stack[-1] if fused_dispatch_mode_stack else False
+        ivy.__setattr__("fused_dispatch_mode", mode, True)
+
+
 ivy.exception_trace_mode = "full"
 
 
@@ -1737,23 +1799,131 @@ def match_kwargs(
     return split_kwargs
 
 
+_CacheInfo = namedtuple(
+    "CacheInfo", ["hits", "misses", "evictions", "maxsize", "currsize"]
+)
+
+
+class _FnCache:
+    """Least recently used store of the outputs of one cached function."""
+
+    def __init__(self, maxsize=None, ttl=None):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and (
+                self.ttl is None or time.monotonic() - entry[1] <= self.ttl
+            ):
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return True, entry[0]
+            if entry is not None:
+                del self._entries[key]
+                self.evictions += 1
+            self.misses += 1
+            return False, None
+
+    def put(self, key, value, refs):
+        with self._lock:
+            # the keyed arrays are kept alive with the entry, so that their ids
+            # can't be reused by other arrays while the entry exists
+            self._entries[key] = (value, time.monotonic(), refs)
+            self._entries.move_to_end(key)
+            while self.maxsize is not None and len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def info(self):
+        with self._lock:
+            return _CacheInfo(
+                self.hits,
+                self.misses,
+                self.evictions,
+                self.maxsize,
+                len(self._entries),
+            )
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = self.evictions = 0
+
+
+def _cache_key(x, refs):
+    if isinstance(x, ivy.Array):
+        x = x.data
+    if ivy.is_native_array(x):
+        version = getattr(x, "_version", None)
+        if version is not None:
+            # frameworks which count in-place updates let arrays be keyed by
+            # identity, without reading their data
+            refs.append(x)
+            return "array", id(x), tuple(x.shape), str(x.dtype), version
+        x_np = np.ascontiguousarray(
+            x if isinstance(x, np.ndarray) else ivy.to_numpy(x)
+        )
+        return (
+            "array",
+            x_np.shape,
+            str(x_np.dtype),
+            hashlib.blake2b(x_np, digest_size=16).digest(),
+        )
+    if isinstance(x, (list, tuple)):
+        return type(x), tuple(_cache_key(v, refs) for v in x)
+    if isinstance(x, dict):
+        return type(x), tuple(
+            (_cache_key(k, refs), _cache_key(v, refs)) for k, v in x.items()
+        )
+    try:
+        hash(x)
+    except TypeError:
+        return type(x), str(x)
+    return type(x), x
+
+
 @handle_exceptions
-def cache_fn(func: Callable) -> Callable:
+def cache_fn(
+    func: Optional[Callable] = None,
+    /,
+    *,
+    maxsize: Optional[int] = None,
+    ttl: Optional[float] = None,
+) -> Callable:
     """
     Cache function outputs.
 
     A decorator to wrap a function, such that computed outputs are cached to avoid
-    recalculating them later.
+    recalculating them later. Arrays are keyed by their shape, dtype and a digest of
+    their data, or by their identity and version counter for frameworks which track
+    in-place updates, while other arguments are keyed by their value.
 
     Parameters
     ----------
     func
-        The function to wrap, whose output should be cached for later.
+        The function to wrap, whose output should be cached for later. If not
+        given, a decorator using the other arguments is returned.
+    maxsize
+        Maximum number of outputs to cache for the function, the least recently
+        used ones are evicted first. Default is ``None``, for no limit.
+    ttl
+        Number of seconds after which a cached output expires. Default is ``None``,
+        for no expiry.
 
     Returns
     -------
     ret
-        The newly cache wrapped function.
+        The newly cache wrapped function, with a ``cache_info()`` method returning
+        the hit, miss and eviction counts and the current size of the cache, and a
+        ``cache_clear()`` method emptying it. Repeatedly wrapping the same function
+        shares a single cache, using the limits it was first created with.
 
     Examples
     --------
@@ -1793,25 +1963,38 @@ def cache_fn(func: Callable) -> Callable:
 
     >>> print(cached_line_eq(5)) # Output is re-computed
     10
+
+    With a bounded cache:
+
+    >>> def square(x:float)->float: return x**2
+    >>> cached_square = ivy.cache_fn(square, maxsize=2)
+    >>> for x in (1, 2, 3, 3): _ = cached_square(x)
+    >>> print(cached_square.cache_info())
+    CacheInfo(hits=1, misses=3, evictions=1, maxsize=2, currsize=2)
     """
+    if func is None:
+        return lambda fn: cache_fn(fn, maxsize=maxsize, ttl=ttl)
     global FN_CACHE
     if func not in FN_CACHE:
-        FN_CACHE[func] = dict()
+        FN_CACHE[func] = _FnCache(maxsize=maxsize, ttl=ttl)
+    cache = FN_CACHE[func]
 
     @wraps(func)
     def cached_fn(*args, **kwargs):
-        key = "".join(
-            [str(i) + ", " for i in args]
-            + [" kw, "]
-            + [str(i) + ", " for i in sorted(kwargs.items())]
+        refs = list()
+        key = (
+            _cache_key(args, refs),
+            _cache_key(tuple(sorted(kwargs.items())), refs),
         )
-        cache = FN_CACHE[func]
-        if key in cache:
-            return cache[key]
+        found, ret = cache.get(key)
+        if found:
+            return ret
         ret = func(*args, **kwargs)
-        cache[key] = ret
+        cache.put(key, ret, refs)
         return ret
 
+    cached_fn.cache_info = cache.info
+    cached_fn.cache_clear = cache.clear
     return cached_fn
 
 
@@ -1,7 +1,7 @@
 """Collection of Ivy neural network layers in functional form."""
 
 # global
-from typing import Optional, Tuple, Union, Callable, Sequence
+from typing import Optional, Tuple, Union, Callable, Sequence, Any
 
 # local
 import ivy
@@ -355,6 +355,7 @@ def dropout(
 
 
 @handle_exceptions
+@handle_nestable
 @handle_array_like_without_promotion
 @handle_array_function
 def scaled_dot_product_attention(
@@ -365,11 +366,22 @@ def scaled_dot_product_attention(
     /,
     *,
     mask: Optional[Union[ivy.Array, ivy.NativeArray]] = None,
+    additive_mask: Optional[Union[ivy.Array, ivy.NativeArray]] = None,
+    is_causal: bool = False,
+    query_block_size: Optional[int] = None,
+    key_block_size: Optional[int] = None,
     out: Optional[ivy.Array] = None,
 ) -> ivy.Array:
     """
     Apply scaled dot product attention to inputs x using optional mask.
 
+    When ``query_block_size`` or ``key_block_size`` is given, the attention is
+    computed one block of queries and keys at a time with an online softmax, which
+    keeps a running maximum, denominator and weighted sum per query block. Only a
+    *[batch_shape,query_block_size,key_block_size]* slice of the similarities is
+    ever held in memory, rather than the full *[batch_shape,num_queries,num_keys]*
+    matrix.
+
     Parameters
     ----------
     q
@@ -390,6 +402,20 @@ def scaled_dot_product_attention(
     mask
         The mask input array. The mask to apply to the query-key values. Default is
         None. The shape of mask input should be in *[batch_shape,num_queries,num_keys]*.
+        Query-key pairs where the mask is zero or False are excluded from attention.
+    additive_mask
+        Optional array added to the scaled query-key values before softmax, such as
+        ``-inf`` at the positions to exclude. It should broadcast to
+        *[batch_shape,num_queries,num_keys]*. Default is None.
+    is_causal
+        Whether each query may only attend to the keys at the same or an earlier
+        position. Default is False.
+    query_block_size
+        Number of queries processed per block. Default is None, meaning all queries
+        at once unless ``key_block_size`` is given.
+    key_block_size
+        Number of keys processed per block. Default is None, meaning all keys at
+        once unless ``query_block_size`` is given.
     out
         optional output array, for writing the result to. It must have a shape that the
         inputs broadcast to.
@@ -541,17 +567,23 @@ def scaled_dot_product_attention(
                     [4.3, 5.3]]])
     }
     """
-    # BS x Q x K
-    sim = ivy.einsum("... q f, ... k f -> ... q k", q, k) * scale
-
-    if ivy.exists(mask):
-        # BS x Q x K
-        sim = ivy.where(
-            ivy.logical_not(mask),
-            -ivy.ones_like(sim) * ivy.finfo(ivy.dtype(sim)).max,
-            sim,
+    if ivy.exists(query_block_size) or ivy.exists(key_block_size):
+        return _blocked_attention(
+            q,
+            k,
+            v,
+            scale,
+            mask,
+            additive_mask,
+            is_causal,
+            query_block_size,
+            key_block_size,
+            out,
         )
 
+    # BS x Q x K
+    sim = _masked_similarities(q, k, scale, mask, additive_mask, is_causal)
+
     # BS x Q x K
     attn = ivy.softmax(sim, axis=-1)
 
@@ -559,6 +591,119 @@ def scaled_dot_product_attention(
     return ivy.einsum("... q k, ... k f -> ... q f", attn, v, out=out)
 
 
+def _mask_block(mask, q_start, q_end, k_start, k_end):
+    # slice the query and key axes of a mask, leaving broadcast axes untouched
+    k_slice = slice(k_start, k_end) if mask.shape[-1] != 1 else slice(None)
+    if len(mask.shape) < 2:
+        return mask[..., k_slice]
+    q_slice = slice(q_start, q_end) if mask.shape[-2] != 1 else slice(None)
+    return mask[..., q_slice, k_slice]
+
+
+def _masked_similarities(
+    q,
+    k,
+    scale,
+    mask,
+    additive_mask,
+    is_causal,
+    q_start=0,
+    q_end=None,
+    k_start=0,
+    k_end=None,
+):
+    """Scaled and masked similarities of queries q_start:q_end to keys
+    k_start:k_end, of all queries and keys when no block is given."""
+    blocked = ivy.exists(q_end)
+    if blocked:
+        q = q[..., q_start:q_end, :]
+        k = k[..., k_start:k_end, :]
+        if ivy.exists(mask):
+            mask = _mask_block(mask, q_start, q_end, k_start, k_end)
+        if ivy.exists(additive_mask):
+            additive_mask = _mask_block(additive_mask, q_start, q_end, k_start, k_end)
+    # BS x Q x K
+    sim = ivy.einsum("... q f, ... k f -> ... q k", q, k) * scale
+    if ivy.exists(additive_mask):
+        sim = sim + additive_mask
+    keep = ivy.astype(mask, bool) if ivy.exists(mask) else None
+    if is_causal:
+        if not blocked:
+            q_end, k_end = q.shape[-2], k.shape[-2]
+        causal = ivy.expand_dims(ivy.arange(q_start, q_end), axis=-1) >= ivy.arange(
+            k_start, k_end
+        )
+        keep = causal if keep is None else ivy.logical_and(keep, causal)
+    if ivy.exists(keep):
+        sim = ivy.where(keep, sim, -ivy.finfo(ivy.dtype(sim)).max)
+    return sim
+
+
+def _blocked_attention(
+    q,
+    k,
+    v,
+    scale,
+    mask,
+    additive_mask,
+    is_causal,
+    query_block_size,
+    key_block_size,
+    out,
+):
+    num_queries, num_keys = q.shape[-2], k.shape[-2]
+    query_block_size = ivy.default(query_block_size, num_queries)
+    key_block_size = ivy.default(key_block_size, num_keys)
+    # key blocks entirely after the last query of a block are masked out by the
+    # causal mask, and only matter for rows which another mask hides completely
+    skip_future = is_causal and not ivy.exists(mask) and not ivy.exists(additive_mask)
+    blocks = []
+    for q_start in range(0, num_queries, query_block_size):
+        q_end = min(q_start + query_block_size, num_queries)
+        # running max, softmax denominator and weighted sum of the values, BS x Qb
+        running_max, denominator, acc = None, None, None
+        for k_start in range(0, num_keys, key_block_size):
+            if skip_future and k_start >= q_end:
+                break
+            k_end = min(k_start + key_block_size, num_keys)
+            # BS x Qb x Kb
+            sim = _masked_similarities(
+                q,
+                k,
+                scale,
+                mask,
+                additive_mask,
+                is_causal,
+                q_start,
+                q_end,
+                k_start,
+                k_end,
+            )
+            block_max = ivy.max(sim, axis=-1, keepdims=True)
+            new_max = (
+                block_max
+                if running_max is None
+                else ivy.maximum(running_max, block_max)
+            )
+            # rows with only -inf similarities so far have no finite max to shift by
+            shift = ivy.where(ivy.isinf(new_max), ivy.zeros_like(new_max), new_max)
+            weights = ivy.exp(sim - shift)
+            block_sum = ivy.sum(weights, axis=-1, keepdims=True)
+            # BS x Qb x F
+            block_out = ivy.einsum(
+                "... q k, ... k f -> ... q f", weights, v[..., k_start:k_end, :]
+            )
+            if running_max is None:
+                denominator, acc = block_sum, block_out
+            else:
+                correction = ivy.exp(running_max - shift)
+                denominator = denominator * correction + block_sum
+                acc = acc * correction + block_out
+            running_max = new_max
+        blocks.append(acc / denominator)
+    return ivy.concat(blocks, axis=-2, out=out)
+
+
 @handle_exceptions
 @handle_array_like_without_promotion
 @inputs_to_ivy_arrays
@@ -577,6 +722,7 @@ def multi_head_attention(
     to_q_v: Optional[Union[ivy.Array, ivy.NativeArray]] = None,
     to_kv_v: Optional[Union[ivy.Array, ivy.NativeArray]] = None,
     to_out_v: Optional[Union[ivy.Array, ivy.NativeArray]] = None,
+    kv_cache: Optional[Any] = None,
     out: Optional[Union[ivy.Array, ivy.NativeArray]] = None,
 ) -> Union[ivy.Array, ivy.NativeArray]:
     """
@@ -610,6 +756,12 @@ def multi_head_attention(
         The variables for function to_kv_fn. Default is ``None``.
     to_out_v
         The variables for function to_out_fn. Default is ``None``.
+    kv_cache
+        An :class:`ivy.KVCache` holding the keys and values of the previous steps.
+        The keys and values of the context are appended to it, and the queries
+        attend to all the cached steps, so that autoregressive decoding only needs
+        the context of the new steps. The mask should then cover all the cached
+        keys. Default is ``None``.
     out
         optional output array, for writing the result to. It must have a shape that the
         inputs broadcast to.
@@ -772,9 +924,13 @@ def multi_head_attention(
 
     q, k, v = map(call_einops, (q, k, v))
 
-    # BS x H x Q x K
+    # BS x H x K x F,  BS x H x K x F, including the cached steps
+    if ivy.exists(kv_cache):
+        k, v = kv_cache.append(k, v)
+
+    # BS x 1 x Q x K, broadcast over the heads
     if ivy.exists(mask):
-        mask = ivy.einops_repeat(mask, "... q k -> ... h q k", h=num_heads)
+        mask = ivy.expand_dims(mask, axis=-3)
 
     # BS x H x Q x F
     sdpa = ivy.scaled_dot_product_attention(q, k, v, scale, mask=mask)
@@ -1916,6 +2072,9 @@ def lstm_update(
     """
     Perform long-short term memory update by unrolling time dimension of input array.
 
+    Backends with a fused LSTM kernel run the whole sequence with it, in place of the
+    unrolled steps.
+
     Parameters
     ----------
     x
@@ -1946,13 +2105,14 @@ def lstm_update(
     input_channels = x_shape[-1]
     x_flat = ivy.reshape(x, (-1, input_channels))
 
-    # input kernel
+    # input kernel, with both biases added once for all of the timesteps
     Wi = kernel
-    Wi_x = ivy.reshape(
-        ivy.matmul(x_flat, Wi) + (bias if bias is not None else 0),
-        batch_shape + [timesteps, -1],
-    )
-    Wii_x, Wif_x, Wig_x, Wio_x = ivy.split(Wi_x, num_or_size_splits=4, axis=-1)
+    Wi_x = ivy.matmul(x_flat, Wi)
+    if bias is not None:
+        Wi_x = Wi_x + bias
+    if recurrent_bias is not None:
+        Wi_x = Wi_x + recurrent_bias
+    Wi_x = ivy.reshape(Wi_x, batch_shape + [timesteps, -1])
 
     # recurrent kernel
     Wh = recurrent_kernel
@@ -1964,33 +2124,26 @@ def lstm_update(
     # lstm outputs
     hts_list = list()
 
-    # unrolled time dimension with lstm steps
-    for Wii_xt, Wif_xt, Wig_xt, Wio_xt in zip(
-        ivy.unstack(Wii_x, axis=-2),
-        ivy.unstack(Wif_x, axis=-2),
-        ivy.unstack(Wig_x, axis=-2),
-        ivy.unstack(Wio_x, axis=-2),
-    ):
-        htm1 = ht
-        ctm1 = ct
-
-        Wh_htm1 = ivy.matmul(htm1, Wh) + (
-            recurrent_bias if recurrent_bias is not None else 0
-        )
-        Whi_htm1, Whf_htm1, Whg_htm1, Who_htm1 = ivy.split(
-            Wh_htm1, num_or_size_splits=4, axis=-1
-        )
+    # unrolled time dimension with lstm steps, all four gates from a single matmul
+    for Wi_xt in ivy.unstack(Wi_x, axis=-2):
+        gates = Wi_xt + ivy.matmul(ht, Wh)
+        it, ft, gt, ot = ivy.split(gates, num_or_size_splits=4, axis=-1)
+
+        ct = ivy.sigmoid(ft) * ct + ivy.sigmoid(it) * ivy.tanh(gt)
+        ht = ivy.sigmoid(ot) * ivy.tanh(ct)
+
+        hts_list.append(ht)
 
-        it = ivy.sigmoid(Wii_xt + Whi_htm1)
-        ft = ivy.sigmoid(Wif_xt + Whf_htm1)
-        gt = ivy.tanh(Wig_xt + Whg_htm1)
-        ot = ivy.sigmoid(Wio_xt + Who_htm1)
-        ct = ft * ctm1 + it * gt
-        ht = ot * ivy.tanh(ct)
+    return ivy.stack(hts_list, axis=-2), ct
 
-        hts_list.append(ivy.expand_dims(ht, axis=-2))
 
-    return ivy.concat(hts_list, axis=-2), ct
+lstm_update.mixed_backend_wrappers = {
+    "to_add": (
+        "inputs_to_native_arrays",
+        "outputs_to_ivy_arrays",
+    ),
+    "to_skip": ("inputs_to_ivy_arrays",),
+}
 
 
 # Helpers #
@@ -193,6 +193,118 @@ class Dropout(Module):
 # ----------#
 
 
+class KVCache:
+    def __init__(self, /, *, window=None, capacity=256):
+        """
+        Growable key and value buffers for incremental attention decoding.
+
+        The keys and values of every step are written into preallocated buffers of
+        shape *[batch_shape,num_heads,capacity,head_dim]*, which double in size
+        when they fill up, so each appended step costs amortized constant time
+        rather than a concatenation of the whole history.
+
+        Parameters
+        ----------
+        window
+            The number of most recent steps kept between calls to append, older
+            steps are evicted. Default is ``None``, in which case every step is kept.
+        capacity
+            The number of steps to allocate the buffers for initially.
+            Default is 256.
+        """
+        self._window = window
+        self._capacity = capacity if window is None else max(capacity, 2 * window)
+        self.reset()
+
+    def reset(self):
+        """Drop all the cached steps."""
+        self._keys = None
+        self._values = None
+        self._start = 0
+        self._end = 0
+
+    def __len__(self):
+        return self._end - self._start
+
+    @property
+    def keys(self):
+        """The cached keys *[batch_shape,num_heads,len(self),head_dim]*."""
+        if self._keys is None:
+            return None
+        return self._keys[..., self._start : self._end, :]
+
+    @property
+    def values(self):
+        """The cached values *[batch_shape,num_heads,len(self),head_dim]*."""
+        if self._values is None:
+            return None
+        return self._values[..., self._start : self._end, :]
+
+    def _reserve(self, size, keys, values):
+        # move the cached steps to the front of the buffers, which are regrown to
+        # twice the size needed whenever they would be more than half full
+        capacity = 0 if self._keys is None else self._keys.shape[-2]
+        if size > capacity // 2:
+            capacity = max(2 * size, self._capacity)
+        buffers = []
+        for old, new in ((self._keys, keys), (self._values, values)):
+            buffer = ivy.zeros(
+                tuple(new.shape[:-2]) + (capacity, new.shape[-1]),
+                dtype=new.dtype,
+                device=ivy.dev(new),
+            )
+            if len(self):
+                buffer[..., : len(self), :] = old[..., self._start : self._end, :]
+            buffers.append(buffer)
+        self._keys, self._values = buffers
+        self._start, self._end = 0, len(self)
+
+    def append(self, keys, values):
+        """
+        Append the keys and values of new steps to the cache.
+
+        Parameters
+        ----------
+        keys
+            The new keys *[batch_shape,num_heads,num_steps,head_dim]*.
+        values
+            The new values *[batch_shape,num_heads,num_steps,head_dim]*.
+
+        Returns
+        -------
+        ret
+            The keys and values of all the cached steps, including the new ones,
+            *[batch_shape,num_heads,num_keys,head_dim]*. With a window, older steps
+            are evicted only after this call, so that all the new steps are
+            returned.
+        """
+        keys, values = ivy.to_ivy(keys), ivy.to_ivy(values)
+        num_steps = keys.shape[-2]
+        if self._keys is None or self._end + num_steps > self._keys.shape[-2]:
+            self._reserve(len(self) + num_steps, keys, values)
+        self._keys[..., self._end : self._end + num_steps, :] = keys
+        self._values[..., self._end : self._end + num_steps, :] = values
+        self._end += num_steps
+        ret = self.keys, self.values
+        if ivy.exists(self._window):
+            self._start = max(self._start, self._end - self._window)
+        return ret
+
+    def reorder(self, indices):
+        """
+        Reorder the cache along the batch axis, such as for the beams kept at each
+        step of a beam search.
+
+        Parameters
+        ----------
+        indices
+            The batch entries to keep, in their new order.
+        """
+        if self._keys is not None:
+            self._keys = ivy.gather(self._keys, indices, axis=0)
+            self._values = ivy.gather(self._values, indices, axis=0)
+
+
 class MultiHeadAttention(Module):
     def __init__(
         self,
@@ -267,6 +379,7 @@ class MultiHeadAttention(Module):
         self._with_to_q_fn = with_to_q_fn
         self._with_to_kv_fn = with_to_kv_fn
         self._with_to_out_fn = with_to_out_fn
+        self._kv_cache = None
         ivy.Module.__init__(
             self,
             device=device,
@@ -276,6 +389,38 @@ class MultiHeadAttention(Module):
             dtype=dtype,
         )
 
+    @property
+    def kv_cache(self):
+        """The :class:`ivy.KVCache` of the layer, or ``None`` when not decoding."""
+        return self._kv_cache
+
+    def init_kv_cache(self, /, *, window=None, capacity=256):
+        """
+        Cache the keys and values of every call, so that each following call only
+        needs the inputs of the new steps, as when decoding token by token.
+
+        Parameters
+        ----------
+        window
+            The number of most recent steps kept in the cache, which the new steps
+            attend to along with themselves. Default is ``None``, in which case
+            every step is kept.
+        capacity
+            The number of steps to allocate the cache for initially.
+            Default is 256.
+
+        Returns
+        -------
+        ret
+            The new key/value cache, which can also be reordered for beam search.
+        """
+        self._kv_cache = ivy.KVCache(window=window, capacity=capacity)
+        return self._kv_cache
+
+    def clear_kv_cache(self):
+        """Stop caching, so that each call attends to its own context only."""
+        self._kv_cache = None
+
     def _build(self, *args, **kwargs):
         if self._with_to_q_fn:
             self._to_q = ivy.Linear(
@@ -355,6 +500,7 @@ class MultiHeadAttention(Module):
             to_q_v=self.v.to_q if self._with_to_q_fn else None,
             to_kv_v=self.v.to_kv if self._with_to_kv_fn else None,
             to_out_v=self.v.to_out if self._with_to_out_fn else None,
+            kv_cache=self._kv_cache,
         )
 
 
@@ -512,7 +512,7 @@ class Module(ModuleConverters, ModuleHelpers):
         self._unset_submod_flags()
         return ret
 
-    def save_weights(self, weights_path, /):
+    def save_weights(self, weights_path, /, **kwargs):
         """
         Save the weights on the Module.
 
@@ -520,13 +520,18 @@ class Module(ModuleConverters, ModuleHelpers):
         ----------
         weights_path
             The hdf5 file for saving the weights.
+        kwargs
+            Keyword arguments passed to ``Container.cont_to_disk_as_hdf5``, such as
+            ``chunks``, ``compression``, ``num_workers`` or ``changed_only``.
 
         Returns
         -------
         None
         """
-        os.makedirs("/".join(weights_path.split("/")[:-1]), exist_ok=True)
-        self.v.cont_to_disk_as_hdf5(weights_path)
+        weights_dir = os.path.dirname(weights_path)
+        if weights_dir:
+            os.makedirs(weights_dir, exist_ok=True)
+        self.v.cont_to_disk_as_hdf5(weights_path, **kwargs)
 
     def build(
         self,
@@ -982,6 +982,48 @@ def test_cache_fn_with_args():
     assert ret0 is not ret1
 
 
+def test_cache_fn_with_arrays():
+    def func(x):
+        return ivy.sum(x)
+
+    cached_fn = ivy.cache_fn(func)
+    # arrays with identical reprs, which differ in their data
+    x = ivy.zeros(10000)
+    y = ivy.concat([ivy.zeros(5000), ivy.ones(1), ivy.zeros(4999)])
+    assert str(x) == str(y)
+    assert ivy.to_numpy(cached_fn(x)).item() == 0
+    assert ivy.to_numpy(cached_fn(y)).item() == 1
+    assert cached_fn(x) is cached_fn(x)
+    assert cached_fn.cache_info().hits == 2
+
+
+def test_cache_fn_maxsize_and_ttl():
+    calls = list()
+
+    def func(x, /, *, y=0):
+        calls.append(x)
+        return x + y
+
+    cached_fn = ivy.cache_fn(maxsize=2)(func)
+    for x in (0, 1, 0, 2, 1):
+        cached_fn(x)
+    # 1 is evicted as the least recently used output when 2 is added
+    assert calls == [0, 1, 2, 1]
+    assert cached_fn.cache_info() == (1, 4, 2, 2, 2)
+    assert cached_fn(0, y=1) == 1
+    assert cached_fn(0.0) == 0 and len(calls) == 6
+
+    cached_fn.cache_clear()
+    assert cached_fn.cache_info() == (0, 0, 0, 2, 0)
+
+    cached_fn = ivy.cache_fn(lambda: time.perf_counter(), ttl=0.05)
+    ret = cached_fn()
+    assert cached_fn() == ret
+    time.sleep(0.1)
+    assert cached_fn() != ret
+    assert cached_fn.cache_info().evictions == 1
+
+
 def test_framework_setting_with_threading():
     if ivy.current_backend_str() == "jax":
         # Numpy is the conflicting framework being tested against
@@ -2143,6 +2185,55 @@ def test_vmap(func, dtype_and_arrays_and_axes, in_axes_as_cont):
         assert False, "One of the results is None while other isn't"
 
 
+def test_vmap_in_axes_none():
+    ivy.set_backend("numpy")
+    x = np.random.uniform(size=(5, 3, 4))
+    w = np.random.uniform(size=(4, 2))
+    ret = ivy.vmap(_fn1, in_axes=(1, None), out_axes=1)(x, w)
+    assert np.allclose(ret, np.stack([x[:, i] @ w for i in range(3)], 1))
+    # unmapped arguments can also come first
+    ret = ivy.vmap(lambda b, a: ivy.sum(a * b), in_axes=(None, 0))(w[:, 0], x[0])
+    assert np.allclose(ret, [np.sum(a * w[:, 0]) for a in x[0]])
+    ivy.previous_backend()
+
+
+def test_vmap_nested():
+    ivy.set_backend("numpy")
+    x = np.random.uniform(size=(3, 4, 5))
+    y = np.random.uniform(size=(3, 5))
+
+    def inner(a, b):
+        return ivy.vmap(lambda p, q: ivy.sum(p * q), in_axes=(0, None))(a, b)
+
+    ret = ivy.vmap(inner, in_axes=(0, 0))(x, y)
+    assert ret.shape == (3, 4)
+    assert np.allclose(ret, np.einsum("ijk,ik->ij", x, y))
+    ivy.previous_backend()
+
+
+@pytest.mark.parametrize("batched", [True, False])
+def test_vmap_errors_and_side_effects(batched):
+    ivy.set_backend("numpy")
+    calls = list()
+
+    def fn(a):
+        calls.append(a)
+        ret = ivy.matmul(a, ivy.ones((7, 2)))
+        return ret if batched else ivy.unique_values(ret)
+
+    # errors of the function itself are raised without re-running it per example
+    with pytest.raises(Exception):
+        ivy.vmap(fn)(np.ones((4, 5)))
+    assert len(calls) == 1
+
+    # functions without batching rules fall back to a loop over the examples
+    calls.clear()
+    ret = ivy.vmap(lambda a: fn(a @ np.ones((5, 7))))(np.ones((4, 5)))
+    assert ret.shape == ((4, 2) if batched else (4, 1))
+    assert len(calls) == (1 if batched else 5)
+    ivy.previous_backend()
+
+
 @st.composite
 def _isin_data_generation_helper(draw):
     assume_unique = draw(st.booleans())
@@ -5,6 +5,11 @@ from hypothesis import strategies as st
 import pytest
 import numpy as np
 
+try:
+    import torch
+except ImportError:
+    torch = None
+
 # local
 import ivy
 from ivy.functional.ivy.gradients import _variable
@@ -167,8 +172,6 @@ def test_execute_with_gradients(
 )
 def test_value_and_grad(x, dtype, func, backend_fw):
     fw = backend_fw.current_backend_str()
-    if fw == "numpy":
-        return
     ivy.set_backend(fw)
     var = _variable(ivy.array(x, dtype=dtype))
     fn = ivy.value_and_grad(func)
@@ -202,8 +205,6 @@ def test_value_and_grad(x, dtype, func, backend_fw):
 )
 def test_jac(x, dtype, func, backend_fw):
     fw = backend_fw.current_backend_str()
-    if fw == "numpy":
-        return
     ivy.set_backend(fw)
     var = _variable(ivy.array(x, dtype=dtype))
     fn = ivy.jac(func)
@@ -254,8 +255,8 @@ def test_jac(x, dtype, func, backend_fw):
 def test_grad(x, dtype, func, backend_fw, nth):
     fw = backend_fw.current_backend_str()
 
-    # ToDo: Remove skipping for paddle and jax for nth > 1
-    if fw == "numpy" or ((fw == "paddle" or fw == "jax") and nth > 1):
+    # ToDo: Remove skipping for numpy, paddle and jax for nth > 1
+    if fw in ("numpy", "paddle", "jax") and nth > 1:
         return
 
     ivy.set_backend(fw)
@@ -281,6 +282,151 @@ def test_grad(x, dtype, func, backend_fw, nth):
         assert np.allclose(grad, grad_from_gt)
 
 
+# numpy gradient tape
+_tape_cases = {
+    "elementwise": (
+        lambda a, b: ivy.sum(ivy.exp(a) * b / (1 + ivy.square(b)) - ivy.tanh(a)),
+        lambda a, b: (a.exp() * b / (1 + b**2) - a.tanh()).sum(),
+        [(3, 4), (4,)],
+    ),
+    "matmul": (
+        lambda a, b: ivy.sum(ivy.matmul(a, b, transpose_b=True) ** 2),
+        lambda a, b: ((a @ b.transpose(-1, -2)) ** 2).sum(),
+        [(2, 3, 4), (5, 4)],
+    ),
+    "reductions": (
+        lambda a: ivy.sum(ivy.max(a, axis=1))
+        + ivy.mean(ivy.var(a, axis=0))
+        + ivy.std(a)
+        + ivy.sum(ivy.cumsum(a, axis=1)),
+        lambda a: a.max(1).values.sum()
+        + a.var(0, unbiased=False).mean()
+        + a.std(unbiased=False)
+        + a.cumsum(1).sum(),
+        [(3, 4)],
+    ),
+    "manipulation": (
+        lambda a: ivy.sum(ivy.permute_dims(ivy.reshape(a, (2, 3, 2)), (2, 0, 1)) ** 3)
+        + ivy.sum(ivy.concat([a, a * 2], axis=0)[2:5] ** 2)
+        + ivy.sum(ivy.stack(ivy.split(a, num_or_size_splits=2, axis=1), axis=1) ** 3),
+        lambda a: (a.reshape(2, 3, 2).permute(2, 0, 1) ** 3).sum()
+        + (torch.cat([a, a * 2], 0)[2:5] ** 2).sum()
+        + (torch.stack(torch.split(a, 2, 1), 1) ** 3).sum(),
+        [(3, 4)],
+    ),
+    "indexing": (
+        lambda a: ivy.sum(a[ivy.array([0, 2, 0])] ** 2)
+        + ivy.sum(ivy.gather(a, ivy.array([1, 1, 3]), axis=1)),
+        lambda a: (a[[0, 2, 0]] ** 2).sum() + a[:, [1, 1, 3]].sum(),
+        [(3, 4)],
+    ),
+    "activations": (
+        lambda a: ivy.sum(
+            ivy.relu(a)
+            + ivy.gelu(a)
+            + ivy.sigmoid(a)
+            + ivy.softmax(a) * a
+            + ivy.log_softmax(a, axis=0) ** 2
+            + ivy.softplus(a)
+        ),
+        lambda a: (
+            a.relu()
+            + torch.nn.functional.gelu(a)
+            + a.sigmoid()
+            + a.softmax(-1) * a
+            + a.log_softmax(0) ** 2
+            + torch.nn.functional.softplus(a)
+        ).sum(),
+        [(3, 4)],
+    ),
+    "conv": (
+        lambda x, w: ivy.sum(
+            ivy.conv2d(x, w, 2, [(1, 1), (2, 2)], data_format="NCHW", dilations=(1, 2))
+            ** 2
+        ),
+        lambda x, w: (
+            torch.nn.functional.conv2d(
+                x, w.permute(3, 2, 0, 1), stride=2, padding=(1, 2), dilation=(1, 2)
+            )
+            ** 2
+        ).sum(),
+        [(2, 3, 7, 8), (3, 3, 3, 4)],
+    ),
+    "depthwise_conv": (
+        lambda x, w: ivy.sum(ivy.depthwise_conv2d(x, w, 1, "SAME") ** 2),
+        lambda x, w: (
+            torch.nn.functional.conv2d(
+                x.permute(0, 3, 1, 2), w.permute(2, 0, 1)[:, None], padding=1, groups=3
+            )
+            ** 2
+        ).sum(),
+        [(2, 6, 6, 3), (3, 3, 3)],
+    ),
+    "losses": (
+        lambda p, t: ivy.sum(ivy.cross_entropy(ivy.softmax(t), ivy.softmax(p)))
+        + ivy.binary_cross_entropy(
+            ivy.sigmoid(t), p, from_logits=True, reduction="mean"
+        ),
+        lambda p, t: -(t.softmax(-1) * p.softmax(-1).clamp(1e-7, 1 - 1e-7).log()).sum()
+        + torch.nn.functional.binary_cross_entropy_with_logits(p, t.sigmoid()),
+        [(3, 4), (3, 4)],
+    ),
+    "layers": (
+        lambda x, w, b: ivy.sum(ivy.layer_norm(ivy.linear(x, w, bias=b), [-1]) ** 3),
+        lambda x, w, b: (
+            torch.nn.functional.layer_norm(
+                torch.nn.functional.linear(x, w, b), (5,), eps=1e-5
+            )
+            ** 3
+        ).sum(),
+        [(3, 4), (5, 4), (5,)],
+    ),
+}
+
+
+@pytest.mark.parametrize("case", list(_tape_cases))
+def test_numpy_gradients_against_torch(case, backend_fw):
+    fw = backend_fw.current_backend_str()
+    if fw != "numpy" or torch is None:
+        return
+    fn, torch_fn, shapes = _tape_cases[case]
+    rng = np.random.default_rng(0)
+    xs = [rng.standard_normal(shape) for shape in shapes]
+    ivy.set_backend(fw)
+    value, grads = ivy.execute_with_gradients(
+        lambda xs: fn(*xs), [ivy.array(x) for x in xs]
+    )
+    ivy.previous_backend()
+    grads = grads if isinstance(grads, list) else [grads]
+    xs_gt = [torch.tensor(x, requires_grad=True) for x in xs]
+    value_gt = torch_fn(*xs_gt)
+    value_gt.backward()
+    assert np.allclose(ivy.to_numpy(value), value_gt.detach().numpy())
+    for grad, x_gt in zip(grads, xs_gt):
+        assert grad.shape == x_gt.shape
+        assert np.allclose(ivy.to_numpy(grad), x_gt.grad.numpy())
+
+
+def test_numpy_gradients_train_module(backend_fw):
+    fw = backend_fw.current_backend_str()
+    if fw != "numpy":
+        return
+    ivy.set_backend(fw)
+    ivy.seed(seed_value=0)
+    x = ivy.random_normal(shape=(32, 3))
+    y = ivy.sum(x**2, axis=-1, keepdims=True)
+    module = ivy.Sequential(ivy.Linear(3, 16), ivy.Linear(16, 1))
+    optimizer = ivy.Adam(lr=1e-2)
+    loss_fn = lambda v: ivy.mean((module(x, v=v) - y) ** 2)
+    losses = []
+    for _ in range(20):
+        loss, grads = ivy.execute_with_gradients(loss_fn, module.v)
+        module.v = optimizer.step(module.v, grads)
+        losses.append(ivy.to_scalar(loss))
+    ivy.previous_backend()
+    assert losses[-1] < losses[0]
+
+
 # adam_step
 @handle_test(
     fn_tree="functional.ivy.adam_step",
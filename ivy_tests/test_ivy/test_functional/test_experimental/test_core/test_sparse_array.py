@@ -355,3 +355,88 @@ def test_sparse_bsr(
         class_name=class_name,
         method_name=method_name,
     )
+
+
+# csr - matmul
+@handle_method(
+    method_tree="SparseArray.matmul",
+    sparse_data=_sparse_csr_indices_values_shape(),
+    num_cols=helpers.ints(min_value=1, max_value=4),
+    data=st.data(),
+    method_num_positional_args=st.just(1),
+    method_container_flags=st.just([False]),
+    init_num_positional_args=st.just(0),  # TODO should not be hardcoded
+)
+def test_sparse_csr_matmul(
+    sparse_data,
+    num_cols,
+    data,
+    class_name,
+    method_name,
+    ground_truth_backend,
+    init_flags,
+    on_device,
+    method_flags,
+):
+    crow_indices, col_indices, value_dtype, values, shape = sparse_data
+    other = data.draw(
+        helpers.array_values(dtype=value_dtype, shape=(shape[1], num_cols))
+    )
+    helpers.test_method(
+        ground_truth_backend=ground_truth_backend,
+        init_flags=init_flags,
+        method_flags=method_flags,
+        on_device=on_device,
+        init_input_dtypes=["int64", "int64", value_dtype],
+        init_all_as_kwargs_np={
+            "crow_indices": crow_indices,
+            "col_indices": col_indices,
+            "values": values,
+            "dense_shape": shape,
+            "format": "csr",
+        },
+        method_input_dtypes=[value_dtype],
+        method_all_as_kwargs_np={"other": other},
+        class_name=class_name,
+        method_name=method_name,
+    )
+
+
+# coo - sum
+@handle_method(
+    method_tree="SparseArray.sum",
+    sparse_data=_sparse_coo_indices_values_shape(),
+    axis=st.sampled_from([None, 0, 1, -1]),
+    keepdims=st.booleans(),
+    method_num_positional_args=st.just(0),
+    init_num_positional_args=st.just(0),  # TODO should not be hardcoded
+)
+def test_sparse_coo_sum(
+    sparse_data,
+    axis,
+    keepdims,
+    class_name,
+    method_name,
+    ground_truth_backend,
+    init_flags,
+    method_flags,
+    on_device,
+):
+    coo_ind, val_dtype, val, shp = sparse_data
+    helpers.test_method(
+        ground_truth_backend=ground_truth_backend,
+        init_flags=init_flags,
+        method_flags=method_flags,
+        on_device=on_device,
+        init_input_dtypes=["int64", val_dtype],
+        init_all_as_kwargs_np={
+            "coo_indices": coo_ind,
+            "values": val,
+            "dense_shape": shp,
+            "format": "coo",
+        },
+        method_input_dtypes=[],
+        method_all_as_kwargs_np={"axis": axis, "keepdims": keepdims},
+        class_name=class_name,
+        method_name=method_name,
+    )
@@ -3,11 +3,13 @@
 # global
 from hypothesis import strategies as st, assume
 import numpy as np
+import pytest
 
 # local
 import ivy_tests.test_ivy.helpers as helpers
 from ivy_tests.test_ivy.helpers import handle_test
 from ivy.functional.ivy.layers import _deconv_length
+from ivy.functional.backends.numpy import layers as np_layers
 
 
 # Linear #
@@ -197,11 +199,17 @@ def x_and_scaled_attention(draw, dtypes):
     dtype_q_k_v_mask_scale=x_and_scaled_attention(
         dtypes=helpers.get_dtypes("numeric", full=False),
     ),
+    is_causal=st.booleans(),
+    query_block_size=st.one_of(st.none(), helpers.ints(min_value=1, max_value=2)),
+    key_block_size=st.one_of(st.none(), helpers.ints(min_value=1, max_value=2)),
     ground_truth_backend="jax",
 )
 def test_scaled_dot_product_attention(
     *,
     dtype_q_k_v_mask_scale,
+    is_causal,
+    query_block_size,
+    key_block_size,
     test_flags,
     backend_fw,
     fn_name,
@@ -223,6 +231,9 @@ def test_scaled_dot_product_attention(
         v=v,
         scale=scale,
         mask=mask,
+        is_causal=is_causal,
+        query_block_size=query_block_size,
+        key_block_size=key_block_size,
     )
 
 
@@ -860,6 +871,139 @@ def test_conv_general_transpose(
     )
 
 
+def _tile_sum_conv(x, filters, strides, padding, dims, dilations, groups=1):
+    # the numpy backend's former convolution, which materialises every product of
+    # the input patches and the filters with np.tile before reducing with np.sum
+    for j in range(dims):
+        if dilations[j] > 1:
+            filters = np_layers._add_dilations(filters, dilations[j], axis=j)
+    kernel_shape = list(filters.shape[:dims])
+    x = np_layers._pad_conv(x, kernel_shape, strides, padding, dims, [1] * dims)
+    in_dim = filters.shape[-2]
+    out_dim = filters.shape[-1] // groups
+    out_shape = [
+        (x.shape[i + 1] - kernel_shape[i]) // strides[i] + 1 for i in range(dims)
+    ]
+    res = []
+    for g in range(groups):
+        x_g = x[..., g * in_dim : (g + 1) * in_dim]
+        sub_matrices = np.lib.stride_tricks.as_strided(
+            x_g,
+            [x.shape[0], *out_shape, *kernel_shape, in_dim],
+            (
+                x_g.strides[0],
+                *[x_g.strides[i + 1] * strides[i] for i in range(dims)],
+                *x_g.strides[1:],
+            ),
+            writeable=False,
+        )
+        mult = np.tile(
+            np.expand_dims(sub_matrices, -1), [1] * (dims * 2 + 2) + [out_dim]
+        ) * filters[..., g * out_dim : (g + 1) * out_dim].reshape(
+            [1] * (dims + 1) + kernel_shape + [in_dim, out_dim]
+        )
+        res.append(np.sum(mult, tuple(range(dims + 1, dims * 2 + 2))))
+    return np.concatenate(res, axis=-1)
+
+
+def _tile_sum_conv_transpose(x, filters, strides, padding, dims, dilations, groups=1):
+    x, filters = np_layers._dilate_pad_conv_tranpose(
+        x, filters, strides, padding, dims, dilations, None
+    )
+    spatial = tuple(range(1, dims + 1))
+    in_dim = filters.shape[-2] // groups
+    return np.concatenate(
+        [
+            np.flip(
+                _tile_sum_conv(
+                    np.flip(x[..., g * in_dim : (g + 1) * in_dim], spatial),
+                    filters[..., g * in_dim : (g + 1) * in_dim, :],
+                    [1] * dims,
+                    "VALID",
+                    dims,
+                    [1] * dims,
+                ),
+                spatial,
+            )
+            for g in range(groups)
+        ],
+        axis=-1,
+    )
+
+
+@pytest.mark.parametrize("tile_size", [None, 1, 7])
+@pytest.mark.parametrize("dims", [1, 2, 3])
+@pytest.mark.parametrize("padding", ["SAME", "VALID", 1])
+@pytest.mark.parametrize(("strides", "dilations"), [(1, 1), (2, 1), (1, 2), (2, 2)])
+def test_numpy_conv_im2col(tile_size, dims, padding, strides, dilations, monkeypatch):
+    # the im2col engine of the numpy backend matches the tile and sum convolution
+    monkeypatch.setattr(np_layers, "conv_tile_size", tile_size)
+    rng = np.random.default_rng(0)
+    x = rng.standard_normal((2, *[7 - dims] * dims, 4))
+    filters = rng.standard_normal((*[3, 2, 2][:dims], 4, 6))
+    strides_, dilations_ = [strides] * dims, [dilations] * dims
+    expected = _tile_sum_conv(x, filters, strides_, padding, dims, dilations_)
+    conv = getattr(np_layers, "conv{}d".format(dims))
+    ret = conv(x, filters, strides, padding, dilations=dilations)
+    assert ret.shape == expected.shape
+    assert np.allclose(ret, expected)
+
+    # grouped
+    bias = rng.standard_normal(6)
+    ret = np_layers.conv_general_dilated(
+        x,
+        filters[..., :2, :],
+        strides,
+        padding,
+        dims=dims,
+        feature_group_count=2,
+        dilations=dilations,
+        bias=bias,
+    )
+    expected = _tile_sum_conv(
+        x, filters[..., :2, :], strides_, padding, dims, dilations_, groups=2
+    )
+    assert np.allclose(ret, expected + bias)
+
+    # depthwise
+    if dims == 2:
+        ret = np_layers.depthwise_conv2d(
+            x, filters[..., 0], strides, padding, dilations=dilations
+        )
+        expected = _tile_sum_conv(
+            x,
+            np.expand_dims(filters[..., 0], -2),
+            strides_,
+            padding,
+            dims,
+            dilations_,
+            groups=4,
+        )
+        assert np.allclose(ret, expected)
+
+    # transposed
+    if isinstance(padding, str):
+        transpose = getattr(np_layers, "conv{}d_transpose".format(dims))
+        ret = transpose(x, filters, strides, padding, dilations=dilations)
+        expected = _tile_sum_conv_transpose(
+            x, filters, strides_, padding, dims, dilations_
+        )
+        assert np.allclose(ret, expected)
+        ret = np_layers.conv_general_transpose(
+            x,
+            filters,
+            strides,
+            padding,
+            dims=dims,
+            feature_group_count=2,
+            dilations=dilations,
+        )
+        expected = _tile_sum_conv_transpose(
+            x, filters, strides_, padding, dims, dilations_, groups=2
+        )
+        assert np.allclose(ret, expected)
+
+
 # LSTM #
 # -----#
 
@@ -2580,6 +2580,97 @@ def test_container_to_disk_shuffle_and_from_disk_as_hdf5(on_device):
     os.remove(save_filepath)
 
 
+
+@pytest.mark.parametrize("mmap", [True, False])
+def test_container_from_disk_as_hdf5_key_chains_and_mmap(on_device, mmap):
+    if ivy.current_backend_str() == "tensorflow":
+        # container disk saving requires eager execution
+        pytest.skip()
+    h5py = pytest.importorskip("h5py")
+    save_filepath = "container_on_disk.hdf5"
+    container = Container(
+        {
+            "a": ivy.array([[1.0, 2.0], [3.0, 4.0]], device=on_device),
+            "b": {
+                "c": ivy.array([1, 2], device=on_device),
+                "d": ivy.array([True, False], device=on_device),
+            },
+            "e": {"f": ivy.array([5.0, 6.0], device=on_device)},
+        }
+    )
+    # datasets written without chunking are stored contiguously
+    with h5py.File(save_filepath, "w") as h5_obj:
+        for key_chain, value in container.cont_to_iterator():
+            h5_obj.create_dataset(key_chain, data=ivy.to_numpy(value))
+
+    loaded_container = Container.cont_from_disk_as_hdf5(
+        save_filepath, slice(1, 2), key_chains=["a", "b/c", "e"], mmap=mmap
+    )
+    assert list(loaded_container.cont_to_iterator_keys()) == ["a", "b/c", "e/f"]
+    for key_chain in ("a", "b/c", "e/f"):
+        loaded = loaded_container.cont_at_key_chain(key_chain)
+        expected = ivy.to_numpy(container.cont_at_key_chain(key_chain))[1:2]
+        assert ivy.is_ivy_array(loaded)
+        assert loaded.dtype == ivy.as_ivy_dtype(expected.dtype)
+        assert np.array_equal(ivy.to_numpy(loaded), expected)
+    if mmap and ivy.current_backend_str() == "numpy":
+        assert isinstance(loaded_container.a.data, np.memmap)
+
+    del loaded_container
+    os.remove(save_filepath)
+
+
+@pytest.mark.parametrize("num_workers", [0, 2])
+def test_container_to_disk_as_hdf5_chunks_and_changed_only(on_device, num_workers):
+    if ivy.current_backend_str() == "tensorflow":
+        # container disk saving requires eager execution
+        pytest.skip()
+    h5py = pytest.importorskip("h5py")
+    save_filepath = "container_on_disk.hdf5"
+    container = Container(
+        {
+            "a": ivy.array([[1.0, 2.0], [3.0, 4.0]], device=on_device),
+            "b": {
+                "c": ivy.array([1, 2, 3], device=on_device),
+                "d": ivy.array([4.0, 5.0, 6.0], device=on_device),
+            },
+            "e": {},
+        }
+    )
+    container.cont_to_disk_as_hdf5(
+        save_filepath,
+        chunks={"a": None, "b/c": (1,)},
+        compression={"b/d": "gzip"},
+        num_workers=num_workers,
+        changed_only=True,
+    )
+    with h5py.File(save_filepath, "r") as h5_obj:
+        assert h5_obj["a"].chunks is None
+        assert h5_obj["b/c"].chunks == (1,)
+        assert h5_obj["b/d"].compression == "gzip"
+        assert isinstance(h5_obj["e"], h5py.Group)
+    loaded_container = Container.cont_from_disk_as_hdf5(save_filepath)
+    assert ivy.Container.cont_identical_structure([loaded_container, container])
+    for key_chain, value in container.cont_to_iterator():
+        assert np.array_equal(
+            ivy.to_numpy(loaded_container.cont_at_key_chain(key_chain)),
+            ivy.to_numpy(value),
+        )
+
+    # only the changed leaf is written again
+    with h5py.File(save_filepath, "a") as h5_obj:
+        h5_obj["b/d"][0] = 0.0
+        h5_obj["b/c"][0] = 0
+    container.b.c = ivy.array([7, 8, 9], device=on_device)
+    container.cont_to_disk_as_hdf5(
+        save_filepath, num_workers=num_workers, changed_only=True
+    )
+    loaded_container = Container.cont_from_disk_as_hdf5(save_filepath)
+    assert np.array_equal(ivy.to_numpy(loaded_container.b.c), np.array([7, 8, 9]))
+    assert np.array_equal(ivy.to_numpy(loaded_container.b.d), np.array([0, 5, 6]))
+
+    os.remove(save_filepath)
+
 def test_container_pickle(on_device):
     dict_in = {
         "a": ivy.array([np.float32(1.0)], device=on_device),
@@ -1,3 +1,4 @@
+import inspect
 import numpy as np
 
 import ivy
@@ -37,6 +38,21 @@ def test_handle_array_like_without_promotion(fn, x, expected_type):
     assert isinstance(handle_array_like_without_promotion(fn)(x), expected_type)
 
 
+@pytest.mark.parametrize("x", [[1, 2], (1, 2), 1.0, None])
+def test_handle_array_like_without_promotion_keyword(x):
+    # keyword arguments are passed through unconverted
+    assert handle_array_like_without_promotion(_fn2)(x=x) is x
+
+
+def test_handle_array_like_without_promotion_caches_signature():
+    fn = handle_array_like_without_promotion(_fn2)
+    with patch("inspect.signature", wraps=inspect.signature) as signature_mock:
+        for _ in range(3):
+            assert isinstance(fn([1, 2]), ivy.Array)
+    fn_calls = [c for c in signature_mock.call_args_list if c.args[0] is _fn2]
+    assert len(fn_calls) == 1
+
+
 def test_outputs_to_ivy_arrays():
     assert isinstance(
         ivy.outputs_to_ivy_arrays(_fn1)(ivy.to_native(ivy.array([2.0]))), ivy.Array
@@ -145,3 +161,91 @@ def test_views(array_to_update):
     assert np.allclose(c, c_copy + 1)
     assert np.allclose(d, d_copy + 1)
     assert np.allclose(e[0], e_copy + 1)
+
+
+def test_fused_dispatch(backend_fw):
+    ivy.set_fused_dispatch_mode(True)
+    ivy.set_backend(backend_fw.backend)
+    try:
+        assert hasattr(ivy.add, "fused_dispatch")
+        assert hasattr(ivy.add, "handle_nestable")
+        x = ivy.array([1.0, 2.0])
+        ret = ivy.add(x, 1.0)
+        assert isinstance(ret, ivy.Array)
+        assert np.allclose(ivy.to_numpy(ret), [2.0, 3.0])
+        # out arguments fall back to the full wrapper chain
+        out = ivy.zeros(2)
+        ivy.add(x, x, out=out)
+        assert np.allclose(ivy.to_numpy(out), [2.0, 4.0])
+        with pytest.raises(ivy.utils.exceptions.IvyException):
+            ivy.add(ivy.ones(2), ivy.ones(3))
+    finally:
+        ivy.previous_backend()
+        ivy.unset_fused_dispatch_mode()
+    assert not ivy.fused_dispatch_mode
+
+
+def test_fused_dispatch_container(backend_fw):
+    if backend_fw.backend == "jax":
+        # the jax backend's container types are defined by haiku
+        pytest.importorskip("haiku")
+    ivy.set_fused_dispatch_mode(True)
+    ivy.set_backend(backend_fw.backend)
+    try:
+        x = ivy.array([1.0, 2.0])
+        # containers fall back to the full wrapper chain
+        ret = ivy.add(ivy.Container(a=x), x)
+        assert isinstance(ret, ivy.Container)
+        assert np.allclose(ivy.to_numpy(ret.a), [2.0, 4.0])
+    finally:
+        ivy.previous_backend()
+        ivy.unset_fused_dispatch_mode()
+
+
+@pytest.mark.parametrize(
+    ("fn_name", "args", "kwargs"),
+    [
+        ("unstack", ([[1.0, 2.0], [3.0, 4.0]],), {"axis": 1}),
+        ("meshgrid", ([1.0, 2.0, 3.0], [4.0, 5.0]), {"indexing": "ij"}),
+    ],
+)
+def test_fused_dispatch_multiple_outputs(fn_name, args, kwargs, backend_fw):
+    rets = list()
+    for fused in (False, True):
+        if fused:
+            ivy.set_fused_dispatch_mode(True)
+        ivy.set_backend(backend_fw.backend)
+        try:
+            fn = getattr(ivy, fn_name)
+            rets.append(fn(*[ivy.array(a) for a in args], **kwargs))
+        finally:
+            ivy.previous_backend()
+            if fused:
+                ivy.unset_fused_dispatch_mode()
+    chained, fused = rets
+    assert type(chained) is type(fused)
+    assert len(chained) == len(fused)
+    for c, f in zip(chained, fused):
+        assert type(c) is type(f)
+        assert np.allclose(ivy.to_numpy(c), ivy.to_numpy(f))
+
+
+def test_fused_dispatch_nan_policy(backend_fw):
+    def _backend_fn(x):
+        return x
+
+    wrapped = ivy.handle_exceptions(ivy.func_wrapper.handle_nans(_backend_fn))
+    fused = ivy.func_wrapper._fuse_wrappers(_backend_fn, wrapped)
+    ivy.set_backend(backend_fw.backend)
+    try:
+        x = ivy.native_array([1.0, float("nan")])
+        assert fused(x) is x
+        ivy.set_nan_policy("raise_exception")
+        try:
+            # an active nan policy goes through the chain, which checks for nans
+            with pytest.raises(ivy.utils.exceptions.IvyException):
+                fused(x)
+        finally:
+            ivy.unset_nan_policy()
+    finally:
+        ivy.previous_backend()
@@ -3,6 +3,7 @@
 # global
 from hypothesis import given, strategies as st
 import numpy as np
+import pytest
 
 # local
 import ivy
@@ -1009,3 +1010,20 @@ def test_module_track_submod_call_order(
             module._dl0._l0.v.cont_flatten_key_chains().to_numpy(),
         ]
     )
+
+
+def test_module_save_weights(on_device, tmp_path):
+    if ivy.current_backend_str() == "tensorflow":
+        # container disk saving requires eager execution
+        pytest.skip()
+    module = TrainableModule(3, 2, device=on_device, hidden_size=4)
+    weights_path = str(tmp_path / "weights" / "module.hdf5")
+    module.save_weights(weights_path, compression="gzip", changed_only=True)
+    loaded = ivy.Container.cont_from_disk_as_hdf5(weights_path)
+    assert ivy.Container.cont_identical_structure([loaded, module.v])
+    assert ivy.Container.cont_all_true(
+        ivy.Container.cont_multi_map(
+            lambda xs, _: np.array_equal(ivy.to_numpy(xs[0]), ivy.to_numpy(xs[1])),
+            [loaded, module.v],
+        )
+    )
@@ -0,0 +1,92 @@
+"""
+Per-call cost of functions wrapped with `handle_array_like_without_promotion`.
+
+Times `ivy.sin` on a Python list, which is converted to an array by the wrapper on
+every call (`ivy.abs` declares a float input, so lists are not array-like for it).
+The current wrapper, which resolves the array-like parameters once, is compared
+with a reference wrapper calling `inspect.signature` on every call, as the wrapper
+used to.
+
+Usage: python scripts/benchmarks/array_like_dispatch.py [--backend numpy] [--number N]
+"""
+
+import argparse
+import functools
+import inspect
+import time
+
+import ivy
+from ivy.func_wrapper import (
+    _check_in_nested_sequence,
+    handle_array_like_without_promotion,
+)
+
+
+def _per_call_signature(fn):
+    @functools.wraps(fn)
+    def _handle_array_like_without_promotion(*args, **kwargs):
+        args = list(args)
+        num_args = len(args)
+        try:
+            type_hints = inspect.signature(fn).parameters
+        except (TypeError, ValueError):
+            return fn(*args, **kwargs)
+        for i, (parameter, param) in enumerate(type_hints.items()):
+            annotation_str = str(param.annotation)
+            if (
+                i < num_args
+                and ("rray" in annotation_str or "Tensor" in annotation_str)
+                and parameter != "out"
+                and all(
+                    sq not in annotation_str
+                    for sq in ["Sequence", "List", "Tuple", "float", "int", "bool"]
+                )
+            ):
+                arg = args[i]
+                if _check_in_nested_sequence(arg, value=Ellipsis, _type=slice):
+                    continue
+                if not ivy.is_array(arg):
+                    args[i] = ivy.array(arg)
+        return fn(*args, **kwargs)
+
+    return _handle_array_like_without_promotion
+
+
+def _time(fn, x, number):
+    start = time.perf_counter()
+    for _ in range(number):
+        fn(x)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--backend", default="numpy")
+    parser.add_argument("--number", type=int, default=1000000)
+    args = parser.parse_args()
+    ivy.set_backend(args.backend)
+    try:
+        # the ivy function itself, without any of its wrappers
+        sin = inspect.unwrap(ivy.functional.ivy.elementwise.sin)
+        x = [0.5, -1.0, 2.0]
+        results = [
+            ("per-call signature", _time(_per_call_signature(sin), x, args.number)),
+            (
+                "cached signature",
+                _time(handle_array_like_without_promotion(sin), x, args.number),
+            ),
+        ]
+    finally:
+        ivy.previous_backend()
+    print("{} calls of ivy.sin(list)".format(args.number))
+    for label, total in results:
+        print(
+            "{:<20}{:>10.2f} s{:>10.2f} us per call".format(
+                label, total, total / args.number * 1e6
+            )
+        )
+    print("speedup: {:.2f}x".format(results[0][1] / results[1][1]))
+
+
+if __name__ == "__main__":
+    main()
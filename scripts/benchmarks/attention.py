@@ -0,0 +1,96 @@
+"""
+Latency and peak memory of `ivy.scaled_dot_product_attention`, full and blocked.
+
+Usage: python scripts/benchmarks/attention.py [--backend numpy]
+    [--seq-lens 1024 2048 4096 8192 16384] [--max-full-len 4096] [--batch 1]
+    [--feat-dim 64] [--block-size 512] [--causal]
+"""
+
+import argparse
+import time
+import tracemalloc
+
+import numpy as np
+
+import ivy
+
+
+def _measure(fn):
+    start = time.perf_counter()
+    fn()
+    seconds = time.perf_counter() - start
+    # a second run for the memory, as tracing slows down every allocation;
+    # tracemalloc sees numpy buffers, other backends report only their latency
+    tracemalloc.start()
+    ret = fn()
+    peak = tracemalloc.get_traced_memory()[1] / 2**20
+    tracemalloc.stop()
+    return ret, seconds, peak
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--backend", default="numpy")
+    parser.add_argument(
+        "--seq-lens", type=int, nargs="+", default=[1024, 2048, 4096, 8192, 16384]
+    )
+    parser.add_argument(
+        "--max-full-len",
+        type=int,
+        default=4096,
+        help="longest sequence to also run without blocks",
+    )
+    parser.add_argument("--batch", type=int, default=1)
+    parser.add_argument("--feat-dim", type=int, default=64)
+    parser.add_argument("--block-size", type=int, default=512)
+    parser.add_argument("--causal", action="store_true")
+    args = parser.parse_args()
+    ivy.set_backend(args.backend)
+    rng = np.random.default_rng(0)
+    scale = args.feat_dim**-0.5
+    print(
+        "{:<8}{:<9}{:>10}{:>12}{:>12}".format(
+            "len", "mode", "time (s)", "peak (MiB)", "max diff"
+        )
+    )
+    for seq_len in args.seq_lens:
+        q, k, v = (
+            ivy.array(
+                rng.standard_normal((args.batch, seq_len, args.feat_dim)),
+                dtype="float32",
+            )
+            for _ in range(3)
+        )
+        blocked, seconds, peak = _measure(
+            lambda: ivy.scaled_dot_product_attention(
+                q,
+                k,
+                v,
+                scale,
+                is_causal=args.causal,
+                query_block_size=args.block_size,
+                key_block_size=args.block_size,
+            )
+        )
+        results = [("blocked", seconds, peak, "")]
+        if seq_len <= args.max_full_len:
+            full, seconds, peak = _measure(
+                lambda: ivy.scaled_dot_product_attention(
+                    q, k, v, scale, is_causal=args.causal
+                )
+            )
+            diff = float(ivy.max(ivy.abs(full - blocked)))
+            results.insert(0, ("full", seconds, peak, "{:.1e}".format(diff)))
+            del full
+        for mode, seconds, peak, diff in results:
+            print(
+                "{:<8}{:<9}{:>10.2f}{:>12.1f}{:>12}".format(
+                    seq_len, mode, seconds, peak, diff
+                )
+            )
+        del blocked
+    ivy.previous_backend()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""
+Run time and peak memory of the numpy convolution engine on ResNet layer shapes.
+
+Usage: python scripts/benchmarks/conv.py [--batch 8] [--number N] [--tile-size T]
+"""
+
+import argparse
+import timeit
+import tracemalloc
+
+import numpy as np
+
+import ivy
+from ivy.functional.backends.numpy import layers
+
+# (name, input H/W, input channels, kernel size, output channels, stride)
+RESNET_LAYERS = (
+    ("conv1", 224, 3, 7, 64, 2),
+    ("conv2_x", 56, 64, 3, 64, 1),
+    ("conv3_x", 28, 128, 3, 128, 1),
+    ("conv4_x", 14, 256, 3, 256, 1),
+    ("conv5_x", 7, 512, 3, 512, 1),
+    ("proj_1x1", 56, 256, 1, 64, 1),
+    ("down_1x1", 28, 256, 1, 512, 2),
+)
+
+
+def _bench(batch, tile_size, number):
+    layers.conv_tile_size = tile_size
+    results = dict()
+    for name, size, in_dim, kernel, out_dim, stride in RESNET_LAYERS:
+        x = ivy.array(np.random.rand(batch, size, size, in_dim).astype("float32"))
+        filters = ivy.array(
+            np.random.rand(kernel, kernel, in_dim, out_dim).astype("float32")
+        )
+        fn = lambda: ivy.conv2d(x, filters, stride, "SAME")  # noqa: E731
+        tracemalloc.start()
+        fn()
+        peak = tracemalloc.get_traced_memory()[1] / 2**20
+        tracemalloc.stop()
+        ms = min(timeit.repeat(fn, number=number, repeat=3)) / number * 1e3
+        results[name] = (ms, peak)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--batch", type=int, default=8)
+    parser.add_argument("--number", type=int, default=3)
+    parser.add_argument("--tile-size", type=int, default=8192)
+    args = parser.parse_args()
+    ivy.set_backend("numpy")
+    try:
+        untiled = _bench(args.batch, None, args.number)
+        tiled = _bench(args.batch, args.tile_size, args.number)
+    finally:
+        layers.conv_tile_size = None
+        ivy.previous_backend()
+    print(
+        "{:<10}{:>12}{:>12}{:>12}{:>12}".format(
+            "layer", "full (ms)", "full (MiB)", "tiled (ms)", "tiled (MiB)"
+        )
+    )
+    for name in untiled:
+        print(
+            "{:<10}{:>12.1f}{:>12.1f}{:>12.1f}{:>12.1f}".format(
+                name, *untiled[name], *tiled[name]
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+"""
+Per-call overhead of `ivy.add` with and without fused dispatch.
+
+Usage: python scripts/benchmarks/fused_dispatch.py [--backend numpy] [--number N]
+"""
+
+import argparse
+import timeit
+
+import ivy
+
+
+def _time_per_call(fn, number):
+    return min(timeit.repeat(fn, number=number, repeat=5)) / number * 1e6
+
+
+def _bench(backend, fused, number):
+    if fused:
+        ivy.set_fused_dispatch_mode(True)
+    ivy.set_backend(backend)
+    try:
+        results = dict()
+        for label, shape in (("0-d", ()), ("1-d", (8,))):
+            x = ivy.ones(shape)
+            y = ivy.ones(shape)
+            results[label] = _time_per_call(lambda: ivy.add(x, y), number)
+        return results
+    finally:
+        ivy.previous_backend()
+        if fused:
+            ivy.unset_fused_dispatch_mode()
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--backend", default="numpy")
+    parser.add_argument("--number", type=int, default=20000)
+    args = parser.parse_args()
+    chained = _bench(args.backend, False, args.number)
+    fused = _bench(args.backend, True, args.number)
+    print(
+        "{:<6}{:>14}{:>14}{:>10}".format(
+            "input", "chain (us)", "fused (us)", "speedup"
+        )
+    )
+    for label in chained:
+        print(
+            "{:<6}{:>14.2f}{:>14.2f}{:>9.1f}x".format(
+                label, chained[label], fused[label], chained[label] / fused[label]
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+"""
+Load time and peak memory of `Container.cont_from_disk_as_hdf5` on a weight file.
+
+Usage: python scripts/benchmarks/hdf5_load.py [--backend numpy] [--size-mb 2048]
+    [--reference]
+"""
+
+import argparse
+import os
+import tempfile
+import time
+import tracemalloc
+
+import h5py
+import numpy as np
+
+import ivy
+
+
+def _write_weights(filepath, size_mb, num_layers=64):
+    layer_size = size_mb * 2**20 // 4 // num_layers
+    with h5py.File(filepath, "w") as h5_obj:
+        for i in range(num_layers):
+            group = h5_obj.create_group("layer_{}".format(i))
+            group.create_dataset(
+                "w", data=np.random.rand(layer_size // 1024, 1024).astype("float32")
+            )
+
+
+def _reference_load(h5_obj):
+    # the loader before datasets were read straight into numpy buffers
+    ret = dict()
+    for key, value in h5_obj.items():
+        if isinstance(value, h5py.Group):
+            ret[key] = _reference_load(value)
+        else:
+            ret[key] = ivy.array(list(value[:]), dtype=str(value[:].dtype))
+    return ivy.Container(ret)
+
+
+def _measure(fn):
+    tracemalloc.start()
+    start = time.perf_counter()
+    ret = fn()
+    seconds = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1] / 2**20
+    tracemalloc.stop()
+    return ret, seconds, peak
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--backend", default="numpy")
+    parser.add_argument("--size-mb", type=int, default=2048)
+    parser.add_argument(
+        "--reference", action="store_true", help="also time the list based loader"
+    )
+    args = parser.parse_args()
+    ivy.set_backend(args.backend)
+    filepath = os.path.join(tempfile.mkdtemp(), "weights.hdf5")
+    try:
+        _write_weights(filepath, args.size_mb)
+        loaders = [
+            ("read", lambda: ivy.Container.cont_from_disk_as_hdf5(filepath)),
+            (
+                "mmap",
+                lambda: ivy.Container.cont_from_disk_as_hdf5(filepath, mmap=True),
+            ),
+            (
+                "one key",
+                lambda: ivy.Container.cont_from_disk_as_hdf5(
+                    filepath, key_chains=["layer_0"]
+                ),
+            ),
+        ]
+        if args.reference:
+            loaders.append(
+                ("reference", lambda: _reference_load(h5py.File(filepath, "r")))
+            )
+        print(
+            "{:<10}{:>10}{:>12}{:>12}".format(
+                "loader", "load (s)", "peak (MiB)", "sum (s)"
+            )
+        )
+        for name, fn in loaders:
+            ret, seconds, peak = _measure(fn)
+            # touch all the data, which reads the mapped datasets from disk
+            start = time.perf_counter()
+            for value in ret.cont_to_iterator_values():
+                ivy.sum(value)
+            print(
+                "{:<10}{:>10.2f}{:>12.1f}{:>12.2f}".format(
+                    name, seconds, peak, time.perf_counter() - start
+                )
+            )
+            del ret
+    finally:
+        os.remove(filepath)
+        ivy.previous_backend()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""
+Save time of `Container.cont_to_disk_as_hdf5` for a container of weights.
+
+Usage: python scripts/benchmarks/hdf5_save.py [--backend numpy] [--size-mb 1024]
+"""
+
+import argparse
+import os
+import tempfile
+import time
+
+import numpy as np
+
+import ivy
+
+
+def _weights(size_mb, num_layers=64):
+    layer_size = size_mb * 2**20 // 4 // num_layers
+    return ivy.Container(
+        {
+            "layer_{}".format(i): {
+                "w": ivy.array(
+                    np.random.rand(layer_size // 1024, 1024).astype("float32")
+                ),
+                "b": ivy.array(np.random.rand(1024).astype("float32")),
+            }
+            for i in range(num_layers)
+        }
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--backend", default="numpy")
+    parser.add_argument("--size-mb", type=int, default=1024)
+    args = parser.parse_args()
+    ivy.set_backend(args.backend)
+    weights = _weights(args.size_mb)
+    filepath = os.path.join(tempfile.mkdtemp(), "weights.hdf5")
+    savers = (
+        ("serial", dict(num_workers=0)),
+        ("threaded", dict(num_workers=4)),
+        ("contiguous", dict(chunks=None)),
+        ("lzf", dict(compression="lzf")),
+    )
+    try:
+        print("{:<12}{:>10}".format("writer", "save (s)"))
+        for name, kwargs in savers:
+            start = time.perf_counter()
+            weights.cont_to_disk_as_hdf5(filepath, mode="w", **kwargs)
+            print("{:<12}{:>10.2f}".format(name, time.perf_counter() - start))
+        # saving again after updating a single leaf
+        weights.cont_to_disk_as_hdf5(filepath, mode="w", changed_only=True)
+        weights.layer_0.b = weights.layer_0.b + 1
+        start = time.perf_counter()
+        weights.cont_to_disk_as_hdf5(filepath, changed_only=True)
+        print("{:<12}{:>10.2f}".format("changed", time.perf_counter() - start))
+    finally:
+        os.remove(filepath)
+        ivy.previous_backend()
+
+
+if __name__ == "__main__":
+    main()
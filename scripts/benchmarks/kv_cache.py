@@ -0,0 +1,54 @@
+"""
+Tokens per second of token by token decoding with an `ivy.Sequential` stack of
+`ivy.MultiHeadAttention` layers, with and without their key/value caches.
+
+Usage: python scripts/benchmarks/kv_cache.py [--backend numpy] [--tokens 256]
+    [--layers 4] [--dim 256] [--heads 8] [--batch 1] [--window None]
+"""
+
+import argparse
+import time
+
+import ivy
+
+
+def _decode(stack, x, cached):
+    # without the cache, each step runs the whole prefix through the stack again
+    start = time.perf_counter()
+    for t in range(x.shape[1]):
+        if cached:
+            stack(x[:, t : t + 1])
+        else:
+            stack(x[:, : t + 1])
+    return x.shape[1] / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--backend", default="numpy")
+    parser.add_argument("--tokens", type=int, default=256)
+    parser.add_argument("--layers", type=int, default=4)
+    parser.add_argument("--dim", type=int, default=256)
+    parser.add_argument("--heads", type=int, default=8)
+    parser.add_argument("--batch", type=int, default=1)
+    parser.add_argument("--window", type=int, default=None)
+    args = parser.parse_args()
+    ivy.set_backend(args.backend)
+    layers = [
+        ivy.MultiHeadAttention(
+            args.dim, num_heads=args.heads, head_dim=args.dim // args.heads
+        )
+        for _ in range(args.layers)
+    ]
+    stack = ivy.Sequential(*layers)
+    x = ivy.random_normal(shape=(args.batch, args.tokens, args.dim))
+    print("{:<10}{:>12}".format("mode", "tokens/s"))
+    print("{:<10}{:>12.1f}".format("full", _decode(stack, x, cached=False)))
+    for layer in layers:
+        layer.init_kv_cache(window=args.window)
+    print("{:<10}{:>12.1f}".format("kv cache", _decode(stack, x, cached=True)))
+    ivy.previous_backend()
+
+
+if __name__ == "__main__":
+    main()
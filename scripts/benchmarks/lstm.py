@@ -0,0 +1,60 @@
+"""
+Time of `ivy.lstm_update` against the unrolled compositional implementation.
+
+Usage: python scripts/benchmarks/lstm.py [--backend numpy] [--number N]
+    [--seq-len 512] [--batch 64] [--channels 128]
+"""
+
+import argparse
+import timeit
+
+import numpy as np
+
+import ivy
+from ivy.utils.backend import handler
+
+
+def _time_per_call(fn, number):
+    return min(timeit.repeat(fn, number=number, repeat=3)) / number * 1e3
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--backend", default="numpy")
+    parser.add_argument("--number", type=int, default=5)
+    parser.add_argument("--seq-len", type=int, default=512)
+    parser.add_argument("--batch", type=int, default=64)
+    parser.add_argument("--channels", type=int, default=128)
+    args = parser.parse_args()
+    ivy.set_backend(args.backend)
+    rng = np.random.default_rng(0)
+    channels = args.channels
+    x = ivy.array(
+        rng.standard_normal((args.batch, args.seq_len, channels)), dtype="float32"
+    )
+    init_state = ivy.zeros((args.batch, channels), dtype="float32")
+    kernel, recurrent_kernel = (
+        ivy.array(rng.standard_normal((channels, 4 * channels)) * 0.1, dtype="float32")
+        for _ in range(2)
+    )
+    inputs = (x, init_state, init_state, kernel, recurrent_kernel)
+    # the ivy function as defined, which runs the unrolled steps on any backend
+    unrolled = handler.ivy_original_dict["lstm_update"]
+    layer = ivy.LSTM(channels, channels)
+    assert np.allclose(
+        ivy.to_numpy(unrolled(*inputs)[0]),
+        ivy.to_numpy(ivy.lstm_update(*inputs)[0]),
+        atol=1e-4,
+    )
+    print("{:<12}{:>12}".format("fn", "time (ms)"))
+    for label, fn in (
+        ("unrolled", lambda: unrolled(*inputs)),
+        ("fused", lambda: ivy.lstm_update(*inputs)),
+        ("ivy.LSTM", lambda: layer(x)),
+    ):
+        print("{:<12}{:>12.1f}".format(label, _time_per_call(fn, args.number)))
+    ivy.previous_backend()
+
+
+if __name__ == "__main__":
+    main()
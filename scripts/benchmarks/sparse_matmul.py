@@ -0,0 +1,65 @@
+"""
+Time of `ivy.matmul` with a sparse CSR lhs against the dense matmul.
+
+Usage: python scripts/benchmarks/sparse_matmul.py [--backend numpy] [--number N]
+    [--size 4096] [--columns 64]
+"""
+
+import argparse
+import logging
+import timeit
+
+import numpy as np
+
+import ivy
+
+
+def _time_per_call(fn, number):
+    return min(timeit.repeat(fn, number=number, repeat=3)) / number * 1e3
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--backend", default="numpy")
+    parser.add_argument("--number", type=int, default=5)
+    parser.add_argument("--size", type=int, default=4096)
+    parser.add_argument("--columns", type=int, default=64)
+    args = parser.parse_args()
+    # backends without native sparse arrays warn on every sparse array created
+    logging.disable(logging.WARNING)
+    ivy.set_backend(args.backend)
+    rng = np.random.default_rng(0)
+    rhs = ivy.array(rng.standard_normal((args.size, args.columns)), dtype="float32")
+    print(
+        "{:<10}{:>10}{:>14}{:>14}{:>10}".format(
+            "density", "nnz", "dense (ms)", "sparse (ms)", "speedup"
+        )
+    )
+    for density in (0.001, 0.01, 0.1):
+        mask = rng.random((args.size, args.size)) < density
+        dense = np.where(mask, rng.standard_normal(mask.shape), 0).astype("float32")
+        rows, cols = np.nonzero(dense)
+        sparse = ivy.SparseArray(
+            coo_indices=np.stack([rows, cols]),
+            values=dense[rows, cols],
+            dense_shape=dense.shape,
+            format="coo",
+        ).to_csr()
+        dense = ivy.array(dense)
+        assert np.allclose(
+            ivy.to_numpy(ivy.matmul(sparse, rhs)),
+            ivy.to_numpy(ivy.matmul(dense, rhs)),
+            atol=1e-3,
+        )
+        dense_time = _time_per_call(lambda: ivy.matmul(dense, rhs), args.number)
+        sparse_time = _time_per_call(lambda: ivy.matmul(sparse, rhs), args.number)
+        print(
+            "{:<10}{:>10}{:>14.1f}{:>14.1f}{:>9.1f}x".format(
+                density, len(rows), dense_time, sparse_time, dense_time / sparse_time
+            )
+        )
+    ivy.previous_backend()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""
+Time of `ivy.vmap` against a python loop over the examples.
+
+Usage: python scripts/benchmarks/vmap.py [--backend numpy] [--number N] [--batch B]
+"""
+
+import argparse
+import timeit
+
+import numpy as np
+
+import ivy
+
+
+def _time_per_call(fn, number):
+    return min(timeit.repeat(fn, number=number, repeat=5)) / number * 1e6
+
+
+def _loop(fn, in_axes):
+    def _fn(*args):
+        size = next(a.shape[0] for a, axis in zip(args, in_axes) if axis is not None)
+        return ivy.stack(
+            [
+                fn(*[a if axis is None else a[i] for a, axis in zip(args, in_axes)])
+                for i in range(size)
+            ]
+        )
+
+    return _fn
+
+
+def _loss(w, x, y):
+    return ivy.mean(ivy.square(ivy.matmul(x, w) - y))
+
+
+def _cases(batch):
+    rng = np.random.default_rng(0)
+    return (
+        (
+            "matmul",
+            ivy.matmul,
+            (0, 0),
+            (
+                rng.standard_normal((batch, 32, 64)),
+                rng.standard_normal((batch, 64, 32)),
+            ),
+        ),
+        (
+            "loss",
+            _loss,
+            (None, 0, 0),
+            (
+                rng.standard_normal((64, 10)),
+                rng.standard_normal((batch, 16, 64)),
+                rng.standard_normal((batch, 16, 10)),
+            ),
+        ),
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--backend", default="numpy")
+    parser.add_argument("--number", type=int, default=100)
+    parser.add_argument("--batch", type=int, default=128)
+    args = parser.parse_args()
+    ivy.set_backend(args.backend)
+    print("{:<8}{:>14}{:>14}{:>10}".format("fn", "loop (us)", "vmap (us)", "speedup"))
+    for label, fn, in_axes, inputs in _cases(args.batch):
+        inputs = [ivy.native_array(x) for x in inputs]
+        loop = _loop(fn, in_axes)
+        vmapped = ivy.vmap(fn, in_axes=in_axes)
+        assert np.allclose(ivy.to_numpy(loop(*inputs)), ivy.to_numpy(vmapped(*inputs)))
+        loop_time = _time_per_call(lambda: loop(*inputs), args.number)
+        vmap_time = _time_per_call(lambda: vmapped(*inputs), args.number)
+        print(
+            "{:<8}{:>14.1f}{:>14.1f}{:>9.1f}x".format(
+                label, loop_time, vmap_time, loop_time / vmap_time
+            )
+        )
+    ivy.previous_backend()
+
+
+if __name__ == "__main__":
+    main()